@@ -76,18 +76,22 @@ def run_nqueens():
     solver = NQueens()
     while True:
         try:
-            n = int(input("Enter board size (4-10, default=8): ") or "8")
+            n = int(input("Enter board size (4 or more, default=8): ") or "8")
             if n < 4:
                 print("Board size must be at least 4")
                 continue
-            if n > 10:
-                print("Maximum board size is 10")
-                continue
-                
-            delay = float(input("Enter animation delay in seconds (default=1.0): ") or "1.0")
-            
+
+            per_page = int(input("Enter solutions per page (default=16): ") or "16")
+            export = input("Directory to export pages as PNG (Enter to skip): ").strip()
+            if export:
+                pages = int(input("Number of pages to export (default=1): ") or "1")
+                viewer = solver.pages(n, per_page)
+                paths = viewer.save_pages(export, range(pages))
+                viewer.close()
+                print(f"Wrote {len(paths)} page(s) to {export}")
+
             print(f"\nSolving {n}-Queens puzzle...")
-            solver.visualize(n, delay)
+            solver.visualize(n, per_page=per_page)
             break
             
         except ValueError as e:
@@ -101,9 +105,9 @@ def run_pascal_triangle(size):
         print(row)
     pascal.plot(size)
 
-def run_hanoi(disks, delay):
-        hanoi = TowerOfHanoi()
-        print(f"\nSolving Tower of Hanoi with {disks} disks...")
+def run_hanoi(disks, delay, pegs=3):
+        hanoi = TowerOfHanoi(pegs)
+        print(f"\nSolving Tower of Hanoi with {disks} disks on {pegs} pegs...")
         hanoi.setup(disks)
         hanoi.visualize(delay)
 
@@ -294,11 +298,15 @@ def main():
                 while True:
                     try:
                         disks = int(input("Enter number of disks (default=3): ") or "3")
+                        pegs = int(input("Enter number of pegs (3 or more, default=3): ") or "3")
                         delay = float(input("Enter animation delay in seconds (default=0.5): ") or "0.5")
                         if disks <= 0:
                             print("Please provide a positive number of disks")
                             continue
-                        run_hanoi(disks, delay)
+                        if pegs < 3:
+                            print("Please provide at least 3 pegs")
+                            continue
+                        run_hanoi(disks, delay, pegs)
                         break
                     except ValueError:
                         print("Please enter valid numbers")
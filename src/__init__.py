@@ -1 +1,7 @@
-from .rubiks_cube import RubiksCube
\ No newline at end of file
+def __getattr__(name):
+    # RubiksCube pulls in PyQt6, so only import it when it is asked for;
+    # headless modules such as src.sudoku_core stay importable without Qt
+    if name == "RubiksCube":
+        from .rubiks_cube import RubiksCube
+        return RubiksCube
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,24 @@
 import matplotlib.pyplot as plt
+from matplotlib.animation import FuncAnimation
+from matplotlib.patches import Rectangle
 import numpy as np
 import time
 
+from src import hanoi_multipeg
+
 class TowerOfHanoi:
-    def __init__(self):
-        self.pegs = [[], [], []]
+    """Tower of Hanoi on num_pegs pegs, moving the disks from peg 0 to
+    the last peg. Three pegs use the classic solution; more use the
+    Frame–Stewart algorithm with the split table of hanoi_multipeg (the
+    shared one unless table is given).
+    """
+
+    def __init__(self, num_pegs=3, table=None):
+        if num_pegs < 3:
+            raise ValueError("At least three pegs are needed")
+        self.num_pegs = num_pegs
+        self.table = table
+        self.pegs = [[] for _ in range(num_pegs)]
         self.num_disks = 0
         self.moves = []
         
@@ -12,7 +26,7 @@ class TowerOfHanoi:
         if num_disks <= 0:
             raise ValueError("Number of disks must be positive")
         self.num_disks = num_disks
-        self.pegs = [list(range(num_disks, 0, -1)), [], []]
+        self.pegs = [list(range(num_disks, 0, -1))] + [[] for _ in range(self.num_pegs - 1)]
         self.moves = []
         
     def move_disk(self, from_peg, to_peg):
@@ -23,96 +37,214 @@ class TowerOfHanoi:
             
     def solve(self):
         self.moves = []
-        self._solve_recursive(self.num_disks, 0, 2, 1)
-        return self.moves
-        
-    def _solve_recursive(self, n, source, target, auxiliary):
-        if n > 0:
-            self._solve_recursive(n-1, source, auxiliary, target)
-            self.move_disk(source, target)
-            self._solve_recursive(n-1, auxiliary, target, source)
-            
-    def visualize(self, delay=0.5):
-        fig, ax = plt.subplots(figsize=(10, 5))
-        plt.ion()
-        
-        # Setup initial state
-        self.setup(self.num_disks)
-        
-        # Define colors for each peg
-        peg_colors = ['#FF9999', '#99FF99', '#9999FF']
-        
-        # Add complexity information
-        complexity_text = (
-            "Tower of Hanoi Complexity:\n"
-            f"Time: O(2^n)\n"
-            f"Space: O(n)\n\n"
-            f"n (disks): {self.num_disks}\n"
-            f"Total moves: {2**self.num_disks - 1}\n\n"
-            "Current Move:\n"
-            "Time: O(1)\n"
-            "Space: O(1)"
-        )
-        complexity_box = plt.figtext(0.85, 0.5, complexity_text, fontsize=10,
-                                   bbox=dict(facecolor='lightyellow', alpha=0.8),
-                                   verticalalignment='center')
-        
-        def draw_state():
-            ax.clear()
-            disk_height = 0.15  # Thinner disks
-            base_height = 0.1
-            max_height = self.num_disks + 1  # Total height for pegs
-            
-            # Calculate positions from bottom up
-            positions = {i: [] for i in range(3)}  # Store y-positions for each peg
-            
-            # Draw base line
-            ax.plot([-1, 3], [base_height, base_height], 'k-', linewidth=3)
-            
-            # Draw pegs first
-            for i in range(3):
-                ax.plot([i, i], [base_height, max_height], 'k-', linewidth=2)
-            
-            # Draw disks from bottom to top
-            for i, peg in enumerate(self.pegs):
-                current_height = base_height
-                for disk in peg:
-                    width = disk * 0.35  # Smaller disk width
-                    ax.fill([i-width/2, i+width/2, i+width/2, i-width/2],
-                           [current_height, current_height, 
-                            current_height+disk_height, current_height+disk_height],
-                           peg_colors[i], alpha=0.8,
-                           edgecolor='black', linewidth=1)
-                    current_height += disk_height * 1.2  # Add small gap between disks
-            
-            # Update display settings
-            ax.set_xlim(-1, 3)
-            ax.set_ylim(0, max_height)
-            ax.set_title(f"Tower of Hanoi - Move {len(self.moves)}")
-            
-            # Update complexity info
-            current_move = len(self.moves)
-            move_info = (
-                "Tower of Hanoi Complexity:\n"
-                f"Time: O(2^n)\n"
-                f"Space: O(n)\n\n"
-                f"n (disks): {self.num_disks}\n"
-                f"Total moves: {2**self.num_disks - 1}\n\n"
-                f"Current Move: {current_move}\n"
-                f"Progress: {current_move/(2**self.num_disks - 1)*100:.1f}%\n"
-                "Move Complexity: O(1)"
-            )
-            complexity_box.set_text(move_info)
-            plt.pause(delay)
-            
-        # Solve and animate
-        moves = self.solve()
-        self.setup(self.num_disks)
-        
-        draw_state()
-        for from_peg, to_peg in moves:
+        if not self.num_disks:
+            return self.moves   # nothing set up yet
+        for _, from_peg, to_peg in self.iter_moves(self.num_disks):
             self.move_disk(from_peg, to_peg)
-            draw_state()
+        return self.moves
+
+    def move_count(self, n):
+        """Number of moves in the n-disk solution"""
+        return hanoi_multipeg.move_count(n, self.num_pegs, self.table)
+
+    def iter_moves(self, n):
+        """Yield the moves that take n disks from peg 0 to the last peg as
+        (disk, from_peg, to_peg), disk 1 being the smallest.
+
+        With three pegs, moves come in the order of the recursive solution,
+        but nothing is kept except the move counter, so any n works in
+        constant memory.
+        """
+        if n <= 0:
+            raise ValueError("Number of disks must be positive")
+        if self.num_pegs > 3:
+            return hanoi_multipeg.iter_moves(n, self.num_pegs, self.table)
+        return self._iter_moves(n)
+
+    def _iter_moves(self, n):
+        # Gray-code structure of the solution: move k (from 1) moves disk
+        # trailing_zeros(k) + 1 from peg (k & (k - 1)) % 3 to peg
+        # ((k | (k - 1)) + 1) % 3. That walk ends on peg 2 for odd n and on
+        # peg 1 for even n, so even n swaps pegs 1 and 2.
+        pegs = (0, 1, 2) if n % 2 else (0, 2, 1)
+        for k in range(1, 1 << n):
+            yield ((k & -k).bit_length(), pegs[(k & (k - 1)) % 3],
+                   pegs[((k | (k - 1)) + 1) % 3])
+
+    def move_at(self, k, n=None):
+        """The k-th move (from 0) of the n-disk solution as (disk, from_peg,
+        to_peg), computed in O(n) without generating the moves before it.
+
+        n defaults to the number of disks set up.
+        """
+        n = self.num_disks if n is None else n
+        if n <= 0:
+            raise ValueError("Number of disks must be positive")
+        if self.num_pegs > 3:
+            return hanoi_multipeg.move_at(n, self.num_pegs, k, self.table)
+        if not 0 <= k < (1 << n) - 1:
+            raise ValueError(f"Move index must be between 0 and {(1 << n) - 2}")
+        k += 1
+        pegs = (0, 1, 2) if n % 2 else (0, 2, 1)
+        return ((k & -k).bit_length(), pegs[(k & (k - 1)) % 3],
+                pegs[((k | (k - 1)) + 1) % 3])
             
-        plt.ioff()
-        plt.show()
\ No newline at end of file
+    def state_at(self, n, k):
+        """The pegs after the first k moves of the n-disk solution, in the
+        layout of self.pegs (each peg's disks from the bottom up).
+
+        Read straight off the bits of k, largest disk first: if the bit of
+        disk d is set, d has already moved to the target of its subtower
+        and the smaller disks are moving on from the spare peg; otherwise d
+        is still on the source and the smaller disks are heading for the
+        spare peg. O(n), whatever k is.
+        """
+        if n <= 0:
+            raise ValueError("Number of disks must be positive")
+        if self.num_pegs > 3:
+            return hanoi_multipeg.state_at(n, self.num_pegs, k, self.table)
+        if not 0 <= k < 1 << n:
+            raise ValueError(f"Step must be between 0 and {(1 << n) - 1}")
+        pegs = [[], [], []]
+        source, target, spare = 0, 2, 1
+        for disk in range(n, 0, -1):
+            if k >> (disk - 1) & 1:
+                pegs[target].append(disk)
+                source, spare = spare, source
+            else:
+                pegs[source].append(disk)
+                target, spare = spare, target
+        return pegs
+
+    def visualize(self, delay=0.5, start=0):
+        """Animate the solution from move start, delay seconds per move.
+
+        See HanoiAnimation for the keys that seek and change speed.
+        """
+        animation = HanoiAnimation(self, self.num_disks, delay, start)
+        animation.show()
+
+
+class HanoiAnimation:
+    """Blitted Tower of Hanoi animation that can start at any move.
+
+    The base, pegs and complexity box are drawn once; each frame only moves
+    the disk rectangles to the positions state_at gives for the current
+    move and updates the move counter, and FuncAnimation blits them. When
+    delay is shorter than a frame, each frame advances several moves
+    instead of trying to draw them all.
+
+    Keys: Right/Left seek 10% forward/back, Home/End jump to the start or
+    the end, +/- double or halve the speed, space pauses.
+    """
+
+    PEG_COLORS = ['#FF9999', '#99FF99', '#9999FF', '#FFCC88', '#CC99FF', '#88DDDD']
+    MAX_FPS = 30
+    DISK_HEIGHT = 0.15
+    BASE_HEIGHT = 0.1
+
+    def __init__(self, hanoi, n, delay=0.5, start=0):
+        if n <= 0:
+            raise ValueError("Number of disks must be positive")
+        if delay <= 0:
+            raise ValueError("Delay must be positive")
+        self.hanoi = hanoi
+        self.n = n
+        self.num_pegs = hanoi.num_pegs
+        self.total = hanoi.move_count(n)
+        self.step = 0
+        self.paused = False
+        self.animation = None
+        self.set_speed(delay)
+        self.seek(start)
+
+        self.fig, self.ax = plt.subplots(figsize=(10, 5))
+        ax = self.ax
+        max_height = max(n + 1, self.BASE_HEIGHT + 1.2 * self.DISK_HEIGHT * (n + 1))
+        ax.plot([-1, self.num_pegs], [self.BASE_HEIGHT, self.BASE_HEIGHT], 'k-', linewidth=3)
+        for i in range(self.num_pegs):
+            ax.plot([i, i], [self.BASE_HEIGHT, max_height], 'k-', linewidth=2)
+        ax.set_xlim(-1, self.num_pegs)
+        ax.set_ylim(0, max_height)
+        plt.figtext(0.85, 0.5,
+                    "Tower of Hanoi Complexity:\n"
+                    f"Time: {'O(2^n)' if self.num_pegs == 3 else 'O(total moves)'}\n"
+                    "Space: O(n)\n\n"
+                    f"n (disks): {n}\n"
+                    f"Pegs: {self.num_pegs}\n"
+                    f"Total moves: {self.total}\n\n"
+                    "Seek to any move: O(n)",
+                    fontsize=10, bbox=dict(facecolor='lightyellow', alpha=0.8),
+                    verticalalignment='center')
+
+        self.disks = []
+        for disk in range(1, n + 1):
+            width = 0.95 * disk / n
+            rect = Rectangle((0, 0), width, self.DISK_HEIGHT, alpha=0.8,
+                             edgecolor='black', linewidth=1, animated=True)
+            ax.add_patch(rect)
+            self.disks.append(rect)
+        self.title = ax.text(0.5, 1.02, "", transform=ax.transAxes, ha='center',
+                             va='bottom', fontsize=12, animated=True)
+        self.fig.canvas.mpl_connect('key_press_event', self._on_key)
+
+    def set_speed(self, delay):
+        """Show one move every delay seconds, skipping moves when that is
+        faster than MAX_FPS frames per second"""
+        self.delay = delay
+        frame = max(delay, 1.0 / self.MAX_FPS)
+        self.interval = int(frame * 1000)
+        self.moves_per_frame = max(1, round(frame / delay))
+        if self.animation is not None:
+            self.animation.event_source.interval = self.interval
+
+    def seek(self, step):
+        """Jump to the position after step moves"""
+        self.step = min(max(step, 0), self.total)
+
+    def frames(self):
+        """Positions to draw: the current step, advancing by
+        moves_per_frame between frames. It holds at the last move rather
+        than ending, so seeking back afterwards plays on."""
+        while True:
+            yield self.step
+            if not self.paused:
+                self.step = min(self.total, self.step + self.moves_per_frame)
+
+    def draw(self, step):
+        """Move the disk artists to the position after step moves and
+        return them for blitting"""
+        self.step = step
+        for peg, disks in enumerate(self.hanoi.state_at(self.n, step)):
+            for level, disk in enumerate(disks):
+                rect = self.disks[disk - 1]
+                rect.set_xy((peg - rect.get_width() / 2,
+                             self.BASE_HEIGHT + level * self.DISK_HEIGHT * 1.2))
+                rect.set_facecolor(self.PEG_COLORS[peg % len(self.PEG_COLORS)])
+        progress = step / self.total * 100
+        self.title.set_text(f"Tower of Hanoi - Move {step} of {self.total} ({progress:.1f}%)")
+        return self.disks + [self.title]
+
+    def _on_key(self, event):
+        jump = max(1, self.total // 10)
+        if event.key == 'right':
+            self.seek(self.step + jump)
+        elif event.key == 'left':
+            self.seek(self.step - jump)
+        elif event.key == 'home':
+            self.seek(0)
+        elif event.key == 'end':
+            self.seek(self.total)
+        elif event.key == '+':
+            self.set_speed(self.delay / 2)
+        elif event.key == '-':
+            self.set_speed(self.delay * 2)
+        elif event.key == ' ':
+            self.paused = not self.paused
+
+    def show(self):
+        self.animation = FuncAnimation(self.fig, self.draw, frames=self.frames,
+                                       init_func=lambda: self.draw(self.step),
+                                       interval=self.interval, blit=True, repeat=False,
+                                       cache_frame_data=False)
+        plt.show()
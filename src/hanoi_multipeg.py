@@ -0,0 +1,258 @@
+"""Frame–Stewart solver for the Tower of Hanoi with four or more pegs.
+
+To move m disks with p pegs, the Frame–Stewart algorithm parks the top t
+disks on a spare peg (using all p pegs), moves the other m - t with the
+remaining p - 1 pegs, then brings the t disks back on top. That takes
+2 M(t, p) + M(m - t, p - 1) moves, where M(m, 3) = 2^m - 1. The best t for
+every m and p comes from a dynamic-programming table, SplitTable, which
+grows on demand, is shared by every solver that does not bring its own,
+and can be kept in a JSON file between runs::
+
+    python -m src.hanoi_multipeg --pegs 4 5 6 --disks 16 32 64 --table splits.json
+
+compares move counts and the time to stream every move for each peg count.
+Sub-towers left with three pegs are moved with the Gray-code walk that
+TowerOfHanoi uses, so moves stream with no recursion.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+
+class SplitTable:
+    """Memoised Frame–Stewart move counts and split points.
+
+    moves(m, pegs) is the number of moves for m disks and split(m, pegs)
+    the number of top disks to park first (pegs >= 4). Rows are filled up
+    to the largest m asked for. With a path, the table is loaded from that
+    JSON file if it exists and written back whenever it grows.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.counts = {}   # pegs -> [M(0, pegs), M(1, pegs), ...]
+        self.splits = {}   # pegs -> [split for 0 disks, for 1 disk, ...]
+        if path and os.path.exists(path):
+            with open(path) as f:
+                data = json.load(f)
+            self.counts = {int(p): row for p, row in data["counts"].items()}
+            self.splits = {int(p): row for p, row in data["splits"].items()}
+
+    def moves(self, m, pegs):
+        if pegs < 3:
+            raise ValueError("At least three pegs are needed")
+        if m < 0:
+            raise ValueError("Number of disks cannot be negative")
+        if pegs == 3:
+            return (1 << m) - 1
+        self._extend(m, pegs)
+        return self.counts[pegs][m]
+
+    def split(self, m, pegs):
+        if pegs < 4:
+            raise ValueError("Splits are only defined for four or more pegs")
+        if m < 0:
+            raise ValueError("Number of disks cannot be negative")
+        self._extend(m, pegs)
+        return self.splits[pegs][m]
+
+    def _extend(self, m, pegs):
+        grown = self._fill(m, pegs)
+        if grown and self.path:
+            self.save()
+
+    def _fill(self, m, pegs):
+        """Fill the rows of pegs (and of fewer pegs) up to m disks; True if
+        anything was added"""
+        if pegs == 3:
+            return False
+        counts = self.counts.setdefault(pegs, [0, 1])
+        splits = self.splits.setdefault(pegs, [0, 0])
+        if len(counts) > m:
+            return False
+        self._fill(m, pegs - 1)
+        for size in range(len(counts), m + 1):
+            best = best_split = None
+            for top in range(1, size):
+                cost = 2 * counts[top] + self.moves(size - top, pegs - 1)
+                if best is None or cost < best:
+                    best, best_split = cost, top
+            counts.append(best)
+            splits.append(best_split)
+        return True
+
+    def save(self, path=None):
+        path = path or self.path
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"counts": {str(p): row for p, row in self.counts.items()},
+                       "splits": {str(p): row for p, row in self.splits.items()}}, f)
+        os.replace(tmp, path)
+
+
+# Used by every solver that is not given a table of its own
+SHARED_TABLE = SplitTable()
+
+
+def _check(n, pegs):
+    if n <= 0:
+        raise ValueError("Number of disks must be positive")
+    if pegs < 3:
+        raise ValueError("At least three pegs are needed")
+
+
+def move_count(n, pegs, table=None):
+    """Moves the Frame–Stewart solution takes for n disks on pegs pegs"""
+    _check(n, pegs)
+    return (table or SHARED_TABLE).moves(n, pegs)
+
+
+def iter_moves(n, pegs, table=None):
+    """Yield the moves that take n disks from peg 0 to peg pegs - 1 as
+    (disk, from_peg, to_peg), disk 1 being the smallest"""
+    _check(n, pegs)
+    return _iter_moves(n, pegs, table or SHARED_TABLE)
+
+
+def _iter_moves(n, pegs, table):
+    # Tasks are (smallest disk, largest disk, pegs usable, source, target),
+    # pushed in reverse so they pop in order
+    stack = [(1, n, tuple(range(pegs)), 0, pegs - 1)]
+    while stack:
+        lo, hi, usable, source, target = stack.pop()
+        spare = [peg for peg in usable if peg != source and peg != target]
+        if len(usable) == 3 or lo == hi:
+            yield from _gray_moves(lo, hi, source, target, spare[0])
+            continue
+        top = table.split(hi - lo + 1, len(usable))
+        park = spare[0]
+        stack.append((lo, lo + top - 1, usable, park, target))
+        stack.append((lo + top, hi, tuple(p for p in usable if p != park), source, target))
+        stack.append((lo, lo + top - 1, usable, source, park))
+
+
+def _gray_pegs(count, source, target, spare):
+    # The Gray-code walk ends on its peg 2 for an odd count, peg 1 for even
+    return (source, spare, target) if count % 2 else (source, target, spare)
+
+
+def _gray_moves(lo, hi, source, target, spare):
+    pegs = _gray_pegs(hi - lo + 1, source, target, spare)
+    offset = lo - 1
+    for k in range(1, 1 << (hi - lo + 1)):
+        yield ((k & -k).bit_length() + offset, pegs[(k & (k - 1)) % 3],
+               pegs[((k | (k - 1)) + 1) % 3])
+
+
+def _descend(n, pegs, k, table, placed=None):
+    """Follow move k down the splits to the three-peg sub-tower (or single
+    disk) it falls in; the disks parked on the way go into placed"""
+    lo, hi, usable, source, target = 1, n, tuple(range(pegs)), 0, pegs - 1
+    while len(usable) > 3 and lo < hi:
+        size, p = hi - lo + 1, len(usable)
+        top = table.split(size, p)
+        park = next(peg for peg in usable if peg != source and peg != target)
+        first = table.moves(top, p)
+        middle = table.moves(size - top, p - 1)
+        if k < first:
+            parked, peg = range(lo + top, hi + 1), source
+            hi, target = lo + top - 1, park
+        elif k < first + middle:
+            parked, peg = range(lo, lo + top), park
+            lo, usable = lo + top, tuple(q for q in usable if q != park)
+            k -= first
+        else:
+            parked, peg = range(lo + top, hi + 1), target
+            hi, source = lo + top - 1, park
+            k -= first + middle
+        if placed is not None:
+            for disk in parked:
+                placed[disk] = peg
+    spare = next(peg for peg in usable if peg != source and peg != target)
+    return lo, hi, source, target, spare, k
+
+
+def move_at(n, pegs, k, table=None):
+    """The k-th move (from 0) as (disk, from_peg, to_peg), in O(n) table
+    lookups without generating the moves before it"""
+    _check(n, pegs)
+    table = table or SHARED_TABLE
+    total = table.moves(n, pegs)
+    if not 0 <= k < total:
+        raise ValueError(f"Move index must be between 0 and {total - 1}")
+    lo, hi, source, target, spare, k = _descend(n, pegs, k, table)
+    gray = _gray_pegs(hi - lo + 1, source, target, spare)
+    k += 1
+    return ((k & -k).bit_length() + lo - 1, gray[(k & (k - 1)) % 3],
+            gray[((k | (k - 1)) + 1) % 3])
+
+
+def state_at(n, pegs, k, table=None):
+    """The pegs after the first k moves, each as its disks from the bottom
+    up, in O(n) table lookups"""
+    _check(n, pegs)
+    table = table or SHARED_TABLE
+    total = table.moves(n, pegs)
+    if not 0 <= k <= total:
+        raise ValueError(f"Step must be between 0 and {total}")
+    placed = {}
+    lo, hi, source, target, spare, k = _descend(n, pegs, k, table, placed)
+    # Three-peg sub-tower: the bit walk of TowerOfHanoi.state_at
+    for disk in range(hi, lo - 1, -1):
+        if k >> (disk - lo) & 1:
+            placed[disk] = target
+            source, spare = spare, source
+        else:
+            placed[disk] = source
+            target, spare = spare, target
+    result = [[] for _ in range(pegs)]
+    for disk in range(n, 0, -1):
+        result[placed[disk]].append(disk)
+    return result
+
+
+def benchmark(peg_counts=(4, 5, 6), disk_counts=(8, 16, 32, 48, 64), table=None):
+    """Move count and time to stream every move for each peg count and
+    number of disks.
+
+    Returns rows of (pegs, disks, moves, seconds). The three-peg count,
+    2^n - 1, is the baseline they improve on; its moves are not streamed.
+    """
+    table = table or SHARED_TABLE
+    rows = []
+    for pegs in peg_counts:
+        for n in disk_counts:
+            start = time.perf_counter()
+            moves = sum(1 for _ in iter_moves(n, pegs, table))
+            rows.append((pegs, n, moves, time.perf_counter() - start))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compare Frame–Stewart move counts and generation time")
+    parser.add_argument("--pegs", type=int, nargs="+", default=[4, 5, 6],
+                        help="peg counts to compare")
+    parser.add_argument("--disks", type=int, nargs="+", default=[8, 16, 32, 48, 64],
+                        help="numbers of disks")
+    parser.add_argument("--table", help="JSON file keeping the split table between runs")
+    args = parser.parse_args(argv)
+
+    if min(args.pegs) < 4:
+        parser.error("peg counts must be at least 4")
+    if min(args.disks) < 1:
+        parser.error("numbers of disks must be positive")
+    table = SplitTable(args.table)
+    start = time.perf_counter()
+    table.moves(max(args.disks), max(args.pegs))
+    print(f"Split table up to {max(args.disks)} disks: {time.perf_counter() - start:.4f}s")
+    print(f"{'pegs':>4} {'disks':>5} {'moves':>12} {'3-peg moves':>22} {'seconds':>9}")
+    for pegs, n, moves, seconds in benchmark(args.pegs, args.disks, table):
+        print(f"{pegs:>4} {n:>5} {moves:>12} {(1 << n) - 1:>22} {seconds:9.4f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
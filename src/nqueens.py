@@ -1,11 +1,28 @@
-import matplotlib.pyplot as plt
-import numpy as np
+from array import array
 import time
 
+from src.nqueens_bitboard import BitboardNQueensSolver
+from src.nqueens_local import MinConflictsSolver
+from src.nqueens_pages import SolutionPages
+
+# Engines selectable through NQueens.solve(n, solver=...); both return the
+# same solutions in the same order
+SOLVERS = ("bitboard", "backtrack")
+
+# complete(method="auto") searches boards up to this size and repairs larger
+# ones with local search
+LOCAL_SEARCH_SIZE = 24
+
+# pages() pages through the search's solutions up to this size (the first
+# page of 16 takes about 2s at n=28, 7s at 29 and 50s at 30) and shows the
+# symmetries of one_solution beyond it
+PAGER_SEARCH_SIZE = 28
+
 class NQueens:
     def __init__(self):
         self.count = 0
         self.solutions = []
+        self.stats = {}
 
     def _create_board(self, queens, n):
         board = []
@@ -20,29 +37,68 @@ class NQueens:
         return board
 
     def is_valid_solution(self, board):
-        n = len(board)
-        queens = []
-        
-        # Extract queen positions
-        for i, row in enumerate(board):
-            queens.append(row.index('Q'))
-            
-        # Check each queen against others
-        for i in range(n):
-            for j in range(i + 1, n):
-                # Check same column
-                if queens[i] == queens[j]:
-                    return False
-                    
-                # Check diagonals
-                if abs(queens[i] - queens[j]) == abs(i - j):
-                    return False
-                    
+        return self.is_valid_placement([row.index('Q') for row in board])
+
+    def is_valid_placement(self, queens):
+        """True if queens, the queen column of each row, is a solution.
+
+        Marks each column and diagonal as it is taken, so it runs in O(n)
+        and handles boards far too large to compare every pair of queens.
+        """
+        n = len(queens)
+        cols = bytearray(n)
+        diag = bytearray(2 * n)   # row + col
+        anti = bytearray(2 * n)   # row - col + n
+        for row, col in enumerate(queens):
+            if not 0 <= col < n or cols[col] or diag[row + col] or anti[row - col + n]:
+                return False
+            cols[col] = diag[row + col] = anti[row - col + n] = 1
         return True
+
+    def one_solution(self, n):
+        """One solution for any n other than 2 and 3, built directly in O(n).
+
+        Returns an array('i') of queen columns, one per row. Uses the
+        classic construction: the even columns (1-based) in order, then the
+        odd ones, with the fixes needed when n % 6 is 2 or 3.
+        """
+        if n <= 0:
+            raise ValueError("Board size must be positive")
+        if n in (2, 3):
+            raise ValueError(f"The {n}-queens problem has no solution")
+        # 0-based columns: 1-based even column c is c - 1
+        if n % 6 == 2:
+            # Odd columns 3, 1, 7, 9, ..., 5
+            evens = array('i', range(1, n, 2))
+            odds = array('i', [2, 0]) + array('i', range(6, n, 2)) + array('i', [4])
+        elif n % 6 == 3:
+            # Even columns 4, 6, ..., 2 and odd columns 5, 7, ..., 1, 3
+            evens = array('i', range(3, n, 2)) + array('i', [1])
+            odds = array('i', range(4, n, 2)) + array('i', [0, 2])
+        else:
+            evens = array('i', range(1, n, 2))
+            odds = array('i', range(0, n, 2))
+        return evens + odds
         
-    def solve(self, n):
+    def solve(self, n, solver="bitboard", fundamental=False):
+        """Return every solution as a list of row strings.
+
+        solver is "bitboard" (default), which keeps the attacked columns and
+        diagonals as integers, or "backtrack", the original set-based search.
+        With fundamental=True only one solution per class under rotation and
+        reflection is returned (from a bitboard search of half the board);
+        count is still the total number of solutions.
+        """
+        if solver not in SOLVERS:
+            raise ValueError(f"Unknown solver: {solver}")
         if n <= 0:
             raise ValueError("Board size must be positive")
+        if solver == "bitboard" or fundamental:
+            engine = BitboardNQueensSolver()
+            found = engine.fundamental_solutions(n) if fundamental else engine.solve(n)
+            self.solutions = [self._create_board(queens, n) for queens in found]
+            self.count = engine.count
+            return self.solutions
         
         self.count = 0
         self.solutions = []
@@ -80,58 +136,92 @@ class NQueens:
         backtrack(0)
         return self.solutions
     
-    def get_solution_count(self, n):
-        self.solve(n)
+    def count_solutions(self, n):
+        """Number of solutions, counted without building any of them.
+
+        Only half the first row is searched; the mirror images make up the
+        rest.
+        """
+        self.count = BitboardNQueensSolver().count_solutions(n)
         return self.count
 
-    def visualize(self, n, delay=0.5):
-        solutions = self.solve(n)
-        num_solutions = self.count
-        
-        # Calculate grid dimensions for subplots
-        grid_size = int(np.ceil(np.sqrt(num_solutions)))
-        fig = plt.figure(figsize=(15, 15))
-        
-        print(f"\nFound {num_solutions} distinct solutions for {n}-Queens puzzle")
-        
+    def iter_solutions(self, n):
+        """Yield each solution lazily as a tuple of queen columns, one per row"""
+        return BitboardNQueensSolver().iter_solutions(n)
+
+    def complete(self, n, placed, method="auto", max_steps=100000, seed=None):
+        """Complete pre-placed queens to a solution.
+
+        placed maps rows to the columns of their queens. method "search"
+        runs the bitboard search, which finds a completion whenever one
+        exists; "local" repairs a full placement with min-conflicts local
+        search, which handles millions of rows but gives up after max_steps
+        repair steps; "auto" searches boards up to LOCAL_SEARCH_SIZE and
+        repairs larger ones. Returns an array('i') of queen columns, or None.
+        Counters of the run are left in stats.
+        """
+        if method not in ("auto", "search", "local"):
+            raise ValueError(f"Unknown method: {method}")
+        if method == "auto":
+            method = "search" if n <= LOCAL_SEARCH_SIZE else "local"
+        start = time.perf_counter()
+        if method == "search":
+            found = next(BitboardNQueensSolver().iter_completions(n, placed), None)
+            self.stats = {"method": "search", "seconds": time.perf_counter() - start}
+            return None if found is None else array('i', found)
+        engine = MinConflictsSolver(max_steps, seed=seed)
+        queens = engine.solve(n, placed)
+        self.stats = dict(engine.stats(), method="local")
+        return queens
+
+    def constructed_solutions(self, n):
+        """The distinct rotations and reflections of one_solution(n), up to 8"""
+        queens = list(self.one_solution(n))
+        seen, found = set(), []
+        for _ in range(2):
+            for _ in range(4):
+                if tuple(queens) not in seen:
+                    seen.add(tuple(queens))
+                    found.append(tuple(queens))
+                # Quarter turn: the queen at (row, col) moves to (col, n - 1 - row)
+                turned = [0] * n
+                for row, col in enumerate(queens):
+                    turned[col] = n - 1 - row
+                queens = turned
+            queens = queens[::-1]
+        return found
+
+    def pages(self, n, per_page=16, figsize=(12, 12)):
+        """A SolutionPages viewer for n: every solution in search order up to
+        PAGER_SEARCH_SIZE, the constructed ones beyond it"""
+        if n <= PAGER_SEARCH_SIZE:
+            return SolutionPages(n, self.iter_solutions(n), per_page, figsize)
+        return SolutionPages(n, self.constructed_solutions(n), per_page, figsize,
+                             title=f"{n}-Queens (constructed)")
+
+    def get_solution_count(self, n):
+        return self.count_solutions(n)
+
+    def visualize(self, n, delay=0.5, per_page=16):
+        """Page through the solutions, per_page boards at a time.
+
+        Solutions are generated as pages are turned, so large boards open
+        at once; past PAGER_SEARCH_SIZE, where even the first page would
+        take minutes to find, the constructed solutions are shown instead.
+        delay is kept for compatibility and has no effect.
+        """
+        pages = self.pages(n, per_page)
+
+        print(f"\nShowing {n}-Queens solutions, {per_page} per page "
+              "(Right/Left or n/p to turn pages)")
+
         # Add complexity information
         complexity_text = (
             "N-Queens Problem:\n"
-            f"Board Size: {n}x{n}\n"
-            f"Total Solutions: {num_solutions}\n\n"
+            f"Board Size: {n}x{n}\n\n"
             "Time Complexity: O(n!)\n"
             "Space Complexity: O(n)"
         )
-        plt.figtext(0.02, 0.02, complexity_text, fontsize=10,
-                   bbox=dict(facecolor='lightyellow', alpha=0.8))
-        
-        # Create and display all solutions
-        for idx, board in enumerate(solutions):
-            ax = fig.add_subplot(grid_size, grid_size, idx + 1)
-            
-            # Create chess board pattern
-            board_img = np.zeros((n, n))
-            board_img[1::2, 0::2] = 1
-            board_img[0::2, 1::2] = 1
-            
-            # Display board
-            ax.imshow(board_img, cmap='gray')
-            
-            # Place queens
-            for i, row in enumerate(board):
-                j = row.index('Q')
-                ax.plot(j, i, 'ro', markersize=20 - n)  # Adjust queen size based on board size
-            
-            # Add grid
-            ax.grid(True)
-            ax.set_xticks(np.arange(-0.5, n, 1))
-            ax.set_yticks(np.arange(-0.5, n, 1))
-            
-            # Remove axis labels
-            ax.set_xticklabels([])
-            ax.set_yticklabels([])
-            
-            ax.set_title(f"Solution {idx + 1}")
-        
-        plt.tight_layout()
-        plt.show()
\ No newline at end of file
+        pages.fig.text(0.02, 0.02, complexity_text, fontsize=10,
+                       bbox=dict(facecolor='lightyellow', alpha=0.8))
+        pages.show()
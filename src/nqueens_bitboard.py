@@ -0,0 +1,223 @@
+"""Bitboard N-Queens search.
+
+The squares attacked by the queens placed so far are kept as three n-bit
+integers: the occupied columns and the two diagonal directions, which shift
+one column per row. The free squares of the next row are then
+``~(cols | ld | rd)``, and the search takes them lowest first with
+``x & -x``, so solutions come out in the same order as the set-based
+search in NQueens.
+
+Searches can start from a prefix, the columns of the queens in the first
+rows. Counting uses the board's mirror symmetry: it only searches the
+prefixes of half_prefixes(n) and doubles the result.
+"""
+
+
+def symmetries(queens):
+    """The 8 images of a solution under the rotations and reflections of
+    the board (with repeats when the solution is itself symmetric)"""
+    n = len(queens)
+    inverse = [0] * n
+    for row, col in enumerate(queens):
+        inverse[col] = row
+    images = []
+    for q in (tuple(queens), tuple(inverse)):
+        mirrored = tuple(n - 1 - col for col in q)
+        images += [q, mirrored, q[::-1], mirrored[::-1]]
+    return images
+
+
+def half_prefixes(n):
+    """Prefixes covering one solution of every mirrored pair: a first-row
+    queen in the left half, or, when n is odd, in the middle column with
+    the second-row queen in the left half"""
+    half = n // 2
+    prefixes = [(col,) for col in range(half)]
+    if n % 2:
+        prefixes += [(half, col) for col in range(half) if abs(col - half) > 1]
+    return prefixes
+
+
+def prefix_masks(n, prefix):
+    """(cols, ld, rd) attacked on the row after prefix, or None if the
+    prefix queens attack each other"""
+    if len(prefix) > n or any(not 0 <= col < n for col in prefix):
+        raise ValueError("Prefix does not fit the board")
+    full = (1 << n) - 1
+    cols = ld = rd = 0
+    for col in prefix:
+        bit = 1 << col
+        if (cols | ld | rd) & bit:
+            return None
+        cols |= bit
+        ld = (ld | bit) << 1 & full
+        rd = (rd | bit) >> 1
+    return cols, ld, rd
+
+
+class BitboardNQueensSolver:
+    """N-Queens solver on integer bitboards.
+
+    Solutions are tuples of queen columns, one per row. solve(n) returns
+    them all and sets count; iter_solutions(n) yields them one at a time
+    and count_solutions(n) only counts, so neither holds more than the
+    current board in memory. fundamental_solutions(n) returns one solution
+    per class under rotation and reflection, and iter_completions(n, placed)
+    the solutions that keep a set of pre-placed queens.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.solutions = []
+
+    def solve(self, n):
+        self.solutions = list(self.iter_solutions(n))
+        self.count = len(self.solutions)
+        return self.solutions
+
+    def iter_solutions(self, n, prefix=()):
+        """Yield the solutions that start with the columns in prefix"""
+        if n <= 0:
+            raise ValueError("Board size must be positive")
+        return self._iter_solutions(n, tuple(prefix))
+
+    def iter_completions(self, n, placed):
+        """Yield the solutions that keep the queens in placed, a mapping of
+        row to column (pre-placed queens may be on any rows)"""
+        if n <= 0:
+            raise ValueError("Board size must be positive")
+        placed = dict(placed)
+        if any(not (0 <= row < n and 0 <= col < n) for row, col in placed.items()):
+            raise ValueError("Pre-placed queen outside the board")
+        # allowed[row]: squares of row not attacked by a pre-placed queen on
+        # another row; a pre-placed row allows only its own queen's square
+        full = (1 << n) - 1
+        allowed = [full] * n
+        for row, col in placed.items():
+            bit = 1 << col
+            for other in range(n):
+                if other == row:
+                    allowed[other] &= bit
+                else:
+                    shift = abs(other - row)
+                    allowed[other] &= ~(bit | bit << shift | bit >> shift)
+        if any(not allowed[row] for row in placed):
+            raise ValueError("Pre-placed queens attack each other")
+        return self._iter_solutions(n, (), allowed)
+
+    def _iter_solutions(self, n, prefix, allowed=None):
+        masks = prefix_masks(n, prefix)
+        if masks is None:
+            return
+        start = len(prefix)
+        if start == n:
+            yield prefix
+            return
+        # Explicit per-row stacks: a recursive generator would pass every
+        # solution up through n levels of yield
+        full = (1 << n) - 1
+        if allowed is None:
+            allowed = [full] * n
+        last = n - 1
+        queens = list(prefix) + [0] * (n - start)
+        cols, ld, rd, avail = [0] * n, [0] * n, [0] * n, [0] * n
+        cols[start], ld[start], rd[start] = masks
+        avail[start] = allowed[start] & ~(masks[0] | masks[1] | masks[2])
+        row = start
+        while row >= start:
+            free = avail[row]
+            if not free:
+                row -= 1
+                continue
+            bit = free & -free
+            avail[row] = free ^ bit
+            queens[row] = bit.bit_length() - 1
+            if row == last:
+                yield tuple(queens)
+                continue
+            c = cols[row] | bit
+            l = (ld[row] | bit) << 1 & full
+            r = (rd[row] | bit) >> 1
+            row += 1
+            cols[row], ld[row], rd[row] = c, l, r
+            avail[row] = allowed[row] & ~(c | l | r)
+
+    def count_solutions(self, n, prefix=None):
+        """Count solutions; with a prefix, only those starting with it"""
+        if n <= 0:
+            raise ValueError("Board size must be positive")
+        if prefix is None:
+            if n == 1:
+                self.count = 1
+            else:
+                self.count = 2 * sum(self._count_from(n, p) for p in half_prefixes(n))
+        else:
+            self.count = self._count_from(n, tuple(prefix))
+        return self.count
+
+    def _count_from(self, n, prefix):
+        masks = prefix_masks(n, prefix)
+        if masks is None:
+            return 0
+        full = (1 << n) - 1
+        cols, ld, rd = masks
+        if len(prefix) >= n - 1:
+            return 1 if len(prefix) == n or full & ~(cols | ld | rd) else 0
+        if len(prefix) == n - 2:
+            total = 0
+            avail = full & ~(cols | ld | rd)
+            while avail:
+                bit = avail & -avail
+                avail ^= bit
+                if full & ~(cols | bit | (ld | bit) << 1 | (rd | bit) >> 1):
+                    total += 1
+            return total
+        last = n - 3
+
+        def place(row, cols, ld, rd):
+            # Bits shifted past the board in ld are dropped by the & full
+            # when the free squares are taken, so ld is never masked
+            avail = full & ~(cols | ld | rd)
+            total = 0
+            if row < last:
+                while avail:
+                    bit = avail & -avail
+                    avail ^= bit
+                    total += place(row + 1, cols | bit, (ld | bit) << 1, (rd | bit) >> 1)
+                return total
+            # The last three rows are inlined: calls for them would outnumber
+            # all the others together
+            while avail:
+                bit = avail & -avail
+                avail ^= bit
+                c, l, r = cols | bit, (ld | bit) << 1, (rd | bit) >> 1
+                free = full & ~(c | l | r)
+                while free:
+                    bit2 = free & -free
+                    free ^= bit2
+                    # One column is left for the last row; count it if it is
+                    # not attacked instead of descending into it
+                    if full & ~(c | bit2 | (l | bit2) << 1 | (r | bit2) >> 1):
+                        total += 1
+            return total
+
+        return place(len(prefix), *masks)
+
+    def fundamental_solutions(self, n):
+        """One solution per symmetry class, the lexicographically smallest.
+
+        Only the half_prefixes are searched, since every class has its
+        smallest member there. count is set to the total number of
+        solutions, rebuilt from the class sizes.
+        """
+        if n <= 0:
+            raise ValueError("Board size must be positive")
+        self.solutions = []
+        self.count = 0
+        for prefix in half_prefixes(n) if n > 1 else [()]:
+            for queens in self._iter_solutions(n, prefix):
+                images = symmetries(queens)
+                if queens == min(images):
+                    self.solutions.append(queens)
+                    self.count += len(set(images))
+        return self.solutions
@@ -0,0 +1,205 @@
+"""Min-conflicts local search for very large N-Queens boards.
+
+Instead of searching, the solver starts from a full placement that is
+already nearly right and repairs it. The first placement gives every row
+its own column, preferring squares whose diagonals are still free, which
+leaves only a few dozen queens attacked even on a million rows. Each
+attacked queen then swaps columns with whichever sampled queen makes the
+fewest attacks. Swaps keep one queen per column, so only diagonals can
+clash. Queens per column and per diagonal are kept in count arrays, so
+the attacks on a square are a few lookups and a swap updates a handful of
+counters. Pre-placed queens never move.
+
+The search is incomplete. It cannot prove that no completion exists, and
+it may not finish, so it runs on a step budget. When a round stops making
+progress, the free queens are placed afresh and the repair starts over.
+"""
+from array import array
+import random
+import time
+
+# Random unused columns tried per row when building a placement
+INIT_TRIES = 64
+# Repair passes without fewer attacked queens before starting over
+PATIENCE = 10
+
+
+class MinConflictsSolver:
+    """Repair-based N-Queens solver.
+
+    solve(n, placed) returns an array('i') of queen columns, one per row,
+    keeping the queens in placed (a mapping of row to column), or None when
+    max_steps repair steps did not remove every attack. Each step compares
+    swaps with up to sample other queens. The counters of the last run are
+    in stats().
+    """
+
+    def __init__(self, max_steps=100000, sample=64, seed=None):
+        if max_steps < 0 or sample <= 0:
+            raise ValueError("Step budget and sample size must be positive")
+        self.max_steps = max_steps
+        self.sample = sample
+        self.rng = random.Random(seed)
+        self.steps = 0
+        self.moves = 0
+        self.scans = 0
+        self.restarts = 0
+        self.initial_conflicts = 0
+        self.conflicts = 0
+        self.seconds = 0.0
+
+    def stats(self):
+        """Counters of the last solve: steps (attacked queens handled),
+        moves (swaps made), scans (passes collecting attacked queens),
+        restarts (fresh placements after a stalled round),
+        initial_conflicts (attacked queens in the first placement),
+        conflicts (attacked queens found by the last pass) and seconds"""
+        return {"steps": self.steps, "moves": self.moves, "scans": self.scans,
+                "restarts": self.restarts, "initial_conflicts": self.initial_conflicts,
+                "conflicts": self.conflicts, "seconds": self.seconds}
+
+    def solve(self, n, placed=None):
+        if n <= 0:
+            raise ValueError("Board size must be positive")
+        placed = dict(placed or {})
+        if any(not (0 <= row < n and 0 <= col < n) for row, col in placed.items()):
+            raise ValueError("Pre-placed queen outside the board")
+
+        start = time.perf_counter()
+        self.steps = self.moves = self.scans = self.restarts = 0
+        self.n = n
+        self.queens = array('i', [-1]) * n
+        self.cols = array('i', [0]) * n
+        self.diag = array('i', [0]) * (2 * n - 1)   # row + col
+        self.anti = array('i', [0]) * (2 * n - 1)   # row - col + n - 1
+        for row, col in placed.items():
+            self._put(row, col)
+        for row, col in placed.items():
+            if self._attacks(row, col) > 3:
+                raise ValueError("Pre-placed queens attack each other")
+        self.free_rows = [row for row in range(n) if row not in placed]
+
+        self._place_free()
+        self.initial_conflicts = None
+        # With fewer than two free queens there is nothing to swap, and
+        # nothing a fresh placement would change
+        while (not self._repair() and self.steps < self.max_steps
+               and len(self.free_rows) > 1):
+            self.restarts += 1
+            for row in self.free_rows:
+                self._lift(row)
+            self._place_free()
+
+        self.seconds = time.perf_counter() - start
+        return None if self.conflicts else self.queens
+
+    def _put(self, row, col):
+        self.queens[row] = col
+        self.cols[col] += 1
+        self.diag[row + col] += 1
+        self.anti[row - col + self.n - 1] += 1
+
+    def _lift(self, row):
+        col = self.queens[row]
+        self.cols[col] -= 1
+        self.diag[row + col] -= 1
+        self.anti[row - col + self.n - 1] -= 1
+
+    def _attacks(self, row, col):
+        """Queens on the column and diagonals of a square (its own included)"""
+        return self.cols[col] + self.diag[row + col] + self.anti[row - col + self.n - 1]
+
+    def _place_free(self):
+        """Give each free row an unused column, preferring one whose
+        diagonals are free too"""
+        rng, n = self.rng, self.n
+        queens, cols, diag, anti = self.queens, self.cols, self.diag, self.anti
+        unused = [col for col in range(n) if not cols[col]]
+        for row in self.free_rows:
+            for _ in range(INIT_TRIES):
+                i = rng.randrange(len(unused))
+                col = unused[i]
+                if not diag[row + col] and not anti[row - col + n - 1]:
+                    break
+            unused[i] = unused[-1]
+            unused.pop()
+            # _put, inlined: this loop runs once per row
+            queens[row] = col
+            cols[col] += 1
+            diag[row + col] += 1
+            anti[row - col + n - 1] += 1
+
+    def _repair(self):
+        """Swap attacked queens until none is left (True), the step budget
+        runs out or PATIENCE passes bring no improvement (False)"""
+        rng, queens, free_rows, n = self.rng, self.queens, self.free_rows, self.n
+        diag, anti = self.diag, self.anti
+        # Only the first pass scans every row. Two queens that attack each
+        # other cannot both have stood still since they were last found
+        # unattacked, so later passes check the queens attacked in the
+        # previous pass and those swapped during it.
+        suspects = free_rows
+        best, stalled = None, 0
+        while True:
+            # Columns never clash, so a queen is attacked when its diagonals
+            # hold more than itself
+            attacked = [row for row in suspects
+                        if diag[row + queens[row]] + anti[row - queens[row] + n - 1] > 2]
+            self.scans += 1
+            if self.initial_conflicts is None:
+                self.initial_conflicts = len(attacked)
+            self.conflicts = len(attacked)
+            if not attacked:
+                return True
+            if self.steps >= self.max_steps or len(free_rows) < 2:
+                return False
+            if best is None or len(attacked) < best:
+                best, stalled = len(attacked), 0
+            else:
+                stalled += 1
+                if stalled >= PATIENCE:
+                    return False
+
+            suspects = set(attacked)
+            rng.shuffle(attacked)
+            for row in attacked:
+                if self.steps >= self.max_steps:
+                    break
+                if self._attacks(row, queens[row]) == 3:
+                    continue   # freed by an earlier swap in this pass
+                self.steps += 1
+                best_delta, best_rows = None, []
+                for _ in range(self.sample):
+                    other = free_rows[rng.randrange(len(free_rows))]
+                    if other == row:
+                        continue
+                    delta = self._swap_delta(row, other)
+                    if best_delta is None or delta < best_delta:
+                        best_delta, best_rows = delta, [other]
+                    elif delta == best_delta:
+                        best_rows.append(other)
+                # Sideways swaps (delta 0) are taken too, to drift off plateaus
+                if best_delta is not None and best_delta <= 0:
+                    other = rng.choice(best_rows)
+                    self._swap(row, other)
+                    suspects.add(other)
+                    self.moves += 1
+
+    def _swap_delta(self, row, other):
+        """Change in attacks on the two queens if they swapped columns"""
+        queens = self.queens
+        a, b = queens[row], queens[other]
+        self._lift(row)
+        self._lift(other)
+        before = self._attacks(row, a) + self._attacks(other, b)
+        after = self._attacks(row, b) + self._attacks(other, a)
+        self._put(row, a)
+        self._put(other, b)
+        return after - before
+
+    def _swap(self, row, other):
+        a, b = self.queens[row], self.queens[other]
+        self._lift(row)
+        self._lift(other)
+        self._put(row, b)
+        self._put(other, a)
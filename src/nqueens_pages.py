@@ -0,0 +1,165 @@
+"""Paginated N-Queens solution viewer.
+
+One figure holds a fixed grid of boards. The checkerboards are drawn once
+and cached as the background; turning a page only moves the queen markers
+and titles and blits them over that background, so paging stays fast
+however many solutions there are. Solutions are pulled from the source
+iterator only as far as the pages shown so far need, so even boards with
+millions of solutions open immediately.
+"""
+import os
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+# Boards larger than this get a plain background instead of an n x n
+# checkerboard image; at that size the squares are under a pixel anyway
+CHECKER_SIZE = 64
+
+
+class SolutionPages:
+    """Show or export solutions a page at a time.
+
+    solutions is any iterable of queen-column tuples, such as
+    NQueens.iter_solutions(n). show() opens the window (Right/Left or
+    n/p to turn pages, Home for the first); show_page(k) draws page k and
+    save_pages(directory) writes pages out as PNG files. title heads the
+    status line (default "<n>-Queens").
+    """
+
+    def __init__(self, n, solutions, per_page=16, figsize=(12, 12), title=None):
+        if n <= 0:
+            raise ValueError("Board size must be positive")
+        if per_page <= 0:
+            raise ValueError("Page size must be positive")
+        self.n = n
+        self.title = title or f"{n}-Queens"
+        self.per_page = per_page
+        self.source = iter(solutions)
+        self.solutions = []
+        self.exhausted = False
+        self.page = 0
+        self.background = None
+
+        grid = int(np.ceil(np.sqrt(per_page)))
+        self.fig, axes = plt.subplots(grid, grid, figsize=figsize, squeeze=False)
+        self.axes = axes.ravel()[:per_page]
+        for ax in axes.ravel()[per_page:]:
+            ax.set_visible(False)
+
+        board_img = None
+        if n <= CHECKER_SIZE:
+            board_img = np.zeros((n, n))
+            board_img[1::2, 0::2] = 1
+            board_img[0::2, 1::2] = 1
+        # About 60% of a square, in points
+        markersize = max(1.0, 0.6 * 72 * figsize[0] / (grid * n))
+        self.queens, self.titles = [], []
+        for ax in self.axes:
+            if board_img is not None:
+                ax.imshow(board_img, cmap='gray')
+            else:
+                ax.set_facecolor('lightgray')
+                ax.set_xlim(-0.5, n - 0.5)
+                ax.set_ylim(n - 0.5, -0.5)
+                ax.set_aspect('equal')
+            ax.set_xticks([])
+            ax.set_yticks([])
+            line, = ax.plot([], [], 'ro', markersize=markersize, animated=True)
+            title = ax.text(0.5, 1.02, "", transform=ax.transAxes, ha='center',
+                            va='bottom', animated=True)
+            self.queens.append(line)
+            self.titles.append(title)
+        self.status = self.fig.text(0.5, 0.01, "", ha='center', animated=True)
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+        self.fig.canvas.mpl_connect('key_press_event', self._on_key)
+
+    def _fetch(self, count):
+        """Pull solutions from the source until count are held or it ends"""
+        while not self.exhausted and len(self.solutions) < count:
+            try:
+                self.solutions.append(tuple(next(self.source)))
+            except StopIteration:
+                self.exhausted = True
+
+    def has_page(self, page):
+        self._fetch((page + 1) * self.per_page)
+        return page == 0 or 0 <= page * self.per_page < len(self.solutions)
+
+    def _on_draw(self, event):
+        # A full redraw (first show, resize) invalidates the cached background
+        self.background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_artists()
+
+    def _on_key(self, event):
+        page = {"right": self.page + 1, "n": self.page + 1,
+                "left": self.page - 1, "p": self.page - 1, "home": 0}.get(event.key)
+        if page is not None and page >= 0 and self.has_page(page):
+            self.show_page(page)
+
+    def show_page(self, page):
+        """Draw page (counting from 0); raises IndexError past the last one"""
+        if page < 0 or not self.has_page(page):
+            raise IndexError(f"No page {page}")
+        self.page = page
+        first = page * self.per_page
+        for slot, (line, title) in enumerate(zip(self.queens, self.titles)):
+            idx = first + slot
+            if idx < len(self.solutions):
+                queens = self.solutions[idx]
+                line.set_data(queens, range(self.n))
+                title.set_text(f"Solution {idx + 1}")
+            else:
+                line.set_data([], [])
+                title.set_text("")
+        if self.exhausted:
+            pages = max(1, -(-len(self.solutions) // self.per_page))
+            status = f"page {page + 1} of {pages}, {len(self.solutions)} solutions"
+        else:
+            status = f"page {page + 1}, more to come"
+        self.status.set_text(f"{self.title}: {status}")
+        self._blit()
+
+    def _blit(self):
+        canvas = self.fig.canvas
+        if self.background is None:
+            # The draw event caches the background and draws the artists
+            canvas.draw()
+            return
+        canvas.restore_region(self.background)
+        self._draw_artists()
+        canvas.blit(self.fig.bbox)
+
+    def _draw_artists(self):
+        for ax, line, title in zip(self.axes, self.queens, self.titles):
+            ax.draw_artist(line)
+            ax.draw_artist(title)
+        self.fig.draw_artist(self.status)
+
+    def save_pages(self, directory, pages=None, prefix="nqueens"):
+        """Write pages (default: every page) to directory as PNG files.
+
+        Pages are blitted onto the cached background and written straight
+        from the canvas buffer, so the figure is never fully redrawn. Pages
+        past the last one are skipped; returns the paths written.
+        """
+        os.makedirs(directory, exist_ok=True)
+        if pages is None:
+            self._fetch(float("inf"))
+            pages = range(max(1, -(-len(self.solutions) // self.per_page)))
+        paths = []
+        for page in pages:
+            if not self.has_page(page):
+                continue
+            self.show_page(page)
+            path = os.path.join(directory, f"{prefix}_{self.n}_page{page + 1:04d}.png")
+            plt.imsave(path, np.asarray(self.fig.canvas.buffer_rgba()))
+            paths.append(path)
+        return paths
+
+    def show(self, page=0):
+        self.show_page(page)
+        plt.show()
+
+    def close(self):
+        plt.close(self.fig)
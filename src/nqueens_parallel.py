@@ -0,0 +1,187 @@
+"""Multi-process N-Queens counting and enumeration.
+
+The search is split by the queens of the first rows: split(n, depth) lists
+every non-attacking placement of the first depth rows, keeping only
+first-row queens in the left half as the sequential count does. The
+prefixes go to a process pool one at a time, so a worker that finishes a
+small subtree simply takes the next one; subtrees under different
+prefixes vary a lot in size. Only a couple of subtrees per worker are in
+flight at once. Counts are added up and doubled for the mirror images,
+and solutions are streamed back a subtree at a time, from subtrees three
+rows deep by default so that each one stays small::
+
+    python -m src.nqueens_parallel 15 --workers 1 2 4 8
+
+measures the speedup of each worker count over a single process.
+"""
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import argparse
+import os
+import sys
+import time
+
+from src.nqueens_bitboard import BitboardNQueensSolver, half_prefixes, prefix_masks
+
+
+def split(n, depth=2):
+    """Non-attacking placements of the first depth rows (at most n - 1)
+    whose first-row queen is in the left half.
+
+    Between them and their mirror images they cover every solution once.
+    For odd n, the middle first-row column comes with its second row
+    already restricted to the left half, as in half_prefixes.
+    """
+    if n <= 1:
+        raise ValueError("Board size must be at least 2 to split")
+    depth = max(1, min(depth, n - 1))
+    prefixes = []
+
+    def extend(prefix):
+        if len(prefix) >= depth:
+            prefixes.append(prefix)
+            return
+        for col in range(n):
+            if prefix_masks(n, prefix + (col,)) is not None:
+                extend(prefix + (col,))
+
+    for prefix in half_prefixes(n):
+        extend(prefix)
+    return prefixes
+
+
+def _count_prefix(n, prefix):
+    return BitboardNQueensSolver().count_solutions(n, prefix)
+
+
+def _solve_prefix(n, prefix):
+    """Every solution under prefix and its mirror image, packed as bytes
+    with one byte per column (n stays far below 256 for a full search)"""
+    packed = bytearray()
+    last = n - 1
+    for queens in BitboardNQueensSolver().iter_solutions(n, prefix):
+        packed += bytes(queens)
+        packed += bytes(last - col for col in queens)
+    return bytes(packed)
+
+
+def _pool_results(task, n, prefixes, workers):
+    """Run task(n, prefix) for every prefix on workers processes, yielding
+    the results as they finish.
+
+    As in sudoku_batch.solve_batch, at most two tasks per worker are in
+    flight, so results cannot pile up faster than the caller reads them.
+    Closing the generator early cancels the tasks not started yet and
+    terminates the worker processes, so running subtrees (which can take
+    minutes) stop using CPU; it returns without waiting for them to exit.
+    """
+    pool = ProcessPoolExecutor(max_workers=workers)
+    prefixes = iter(prefixes)
+    in_flight = set()
+    try:
+        while True:
+            while len(in_flight) < workers * 2:
+                prefix = next(prefixes, None)
+                if prefix is None:
+                    break
+                in_flight.add(pool.submit(task, n, prefix))
+            if not in_flight:
+                return
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in in_flight:
+            future.cancel()
+        if in_flight:
+            # ProcessPoolExecutor only gained terminate_workers in Python 3.14
+            terminate = getattr(pool, "terminate_workers", None)
+            if terminate is not None:
+                terminate()
+            else:
+                for process in list((pool._processes or {}).values()):
+                    process.terminate()
+        pool.shutdown(wait=False)
+
+
+def count_parallel(n, workers=None, depth=2):
+    """Count the solutions of the n-queens problem across worker processes.
+
+    workers defaults to one per CPU; depth is the number of rows the
+    prefixes fix (1 or 2 is plenty: 2 gives about n²/2 subtrees).
+    """
+    if n <= 0:
+        raise ValueError("Board size must be positive")
+    if n == 1:
+        return 1
+    workers = workers or os.cpu_count() or 1
+    return 2 * sum(_pool_results(_count_prefix, n, split(n, depth), workers))
+
+
+def iter_parallel(n, workers=None, depth=3):
+    """Yield every solution as a tuple of queen columns, computed across
+    worker processes.
+
+    Solutions arrive a subtree at a time, in whatever order the subtrees
+    finish, rather than in the order of the sequential search. Each
+    subtree's solutions travel back in one piece, so depth is one more
+    than for counting: that keeps each piece small (about 13,000 solutions
+    at n=16).
+    """
+    if n <= 0:
+        raise ValueError("Board size must be positive")
+    return _iter_parallel(n, workers or os.cpu_count() or 1, depth)
+
+
+def _iter_parallel(n, workers, depth):
+    if n == 1:
+        yield (0,)
+        return
+    for packed in _pool_results(_solve_prefix, n, split(n, depth), workers):
+        for start in range(0, len(packed), n):
+            yield tuple(packed[start:start + n])
+
+
+def measure_scaling(n, worker_counts=(1, 2, 4, 8), depth=2):
+    """Wall time of count_parallel for each worker count, plus the
+    sequential count for reference.
+
+    Returns rows of (workers, seconds, speedup over the sequential count);
+    workers 0 stands for BitboardNQueensSolver.count_solutions in this
+    process.
+    """
+    start = time.perf_counter()
+    expected = BitboardNQueensSolver().count_solutions(n)
+    sequential = time.perf_counter() - start
+    rows = [(0, sequential, 1.0)]
+    for workers in worker_counts:
+        start = time.perf_counter()
+        if count_parallel(n, workers, depth) != expected:
+            raise RuntimeError("Parallel count disagrees with the sequential count")
+        elapsed = time.perf_counter() - start
+        rows.append((workers, elapsed, sequential / elapsed))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Count N-Queens solutions across worker processes")
+    parser.add_argument("n", type=int, help="board size")
+    parser.add_argument("-w", "--workers", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="worker counts to time")
+    parser.add_argument("--depth", type=int, default=2, help="rows fixed by each prefix")
+    args = parser.parse_args(argv)
+
+    if args.n < 2:
+        parser.error("board size must be at least 2")
+    rows = measure_scaling(args.n, args.workers, args.depth)
+    print(f"CPUs available: {os.cpu_count()}")
+    print(f"Subtrees: {len(split(args.n, args.depth))}")
+    print(f"{'workers':>7} {'seconds':>9} {'speedup':>8}")
+    for workers, seconds, speedup in rows:
+        label = "serial" if workers == 0 else workers
+        print(f"{label:>7} {seconds:9.3f} {speedup:8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,30 @@
-from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QGridLayout, 
-                           QLineEdit, QPushButton, QMessageBox, QLabel)
-from PyQt6.QtCore import Qt
-import matplotlib.pyplot as plt
-import numpy as np
+import threading
 import time
 import sys
 
-class Sudoku:
-    def __init__(self, test_mode=False):
+from src.sudoku_board import Board
+from src.sudoku_core import SudokuCore
+
+# PyQt6 and matplotlib are imported inside the methods that use them, so the
+# solver can run headless (test_mode=True) without either installed.
+
+
+CELL_STYLE = """
+    QLineEdit {{
+        font-size: 20px;
+        background-color: white;
+        border: 1px solid gray;
+        color: {color};
+    }}
+"""
+
+
+class Sudoku(SudokuCore):
+    def __init__(self, test_mode=False, size=9, frame_rate=30, cache=None):
+        super().__init__(size, cache)
         self.test_mode = test_mode
         if not test_mode:
+            from PyQt6.QtWidgets import QApplication
             # Check if QApplication instance already exists
             if not QApplication.instance():
                 self.app = QApplication(sys.argv)
@@ -20,280 +35,150 @@ class Sudoku:
             self.app = None
             self.window = None
         self.cells = []
-        self.delay = 0.05
-        self.solving = False
-        # Pre-compute sets for faster lookups
-        self.rows = [set() for _ in range(9)]
-        self.cols = [set() for _ in range(9)]
-        self.boxes = [set() for _ in range(9)]
-        # Pre-compute box indices
-        self.box_indices = []
-        for box in range(9):
-            indices = []
-            start_row = (box // 3) * 3
-            start_col = (box % 3) * 3
-            for i in range(3):
-                for j in range(3):
-                    indices.append((start_row + i, start_col + j))
-            self.box_indices.append(indices)
-
-    def initialize_constraints(self, board):
-        """Initialize constraint sets"""
-        for i in range(9):
-            for j in range(9):
-                if board[i][j] != ".":
-                    num = int(board[i][j])
-                    self.rows[i].add(num)
-                    self.cols[j].add(num)
-                    self.boxes[(i // 3) * 3 + j // 3].add(num)
-    
-    # # def solve(self, board):
-    #     if not self.is_valid_board(board):
-    #         raise ValueError("Invalid Sudoku board")
-        
-    #     self.solving = True
-    #     find = self.find_best_empty(board)
-    #     if not find:
-    #         return board
-            
-    #     row, col = find
-    #     possible = self.get_possible_numbers(board, row, col)
-        
-    #     for i in possible:
-    #         if not self.solving:
-    #             return None
-                
-    #         board[row][col] = str(i)
-            
-    #         if hasattr(self, 'cells') and self.cells:
-    #             self.cells[row][col].setText(str(i))
-    #             self.cells[row][col].setStyleSheet("""
-    #                 QLineEdit {
-    #                     font-size: 20px;
-    #                     background-color: white;
-    #                     border: 1px solid gray;
-    #                     color: red;
-    #                 }
-    #             """)
-    #             QApplication.processEvents()
-    #             time.sleep(self.delay)
-            
-    #         if self.solve(board):
-    #             return board
-                
-    #         board[row][col] = "."
-    #         if hasattr(self, 'cells') and self.cells:
-    #             self.cells[row][col].setText("")
-    #             self.cells[row][col].setStyleSheet("""
-    #                 QLineEdit {
-    #                     font-size: 20px;
-    #                     background-color: white;
-    #                     border: 1px solid gray;
-    #                 }
-    #             """)
-    #             QApplication.processEvents()
-        
-    #     return False
-
-    def solve(self, board):
-        if not self.is_valid_board(board):
-            raise ValueError("Invalid Sudoku board")
-        
-        self.solving = True
+        # GUI solves run on a worker thread; the window repaints the latest
+        # board snapshot frame_rate times a second
+        self.frame_rate = frame_rate
+        self._snapshot = None
+        self._next_frame = 0.0
+        self._worker = None
+
+    def _on_progress(self, board):
+        """Publish a board snapshot for the GUI, at most once per frame.
+
+        Runs on the solver thread at every search node, so it only copies the
+        board when a frame is due; painting happens on the GUI thread.
+        """
+        if self.test_mode or not self.window:
+            return
+        now = time.perf_counter()
+        if now >= self._next_frame:
+            self._next_frame = now + 1 / self.frame_rate
+            self._snapshot = [row[:] for row in board]
+
+    def _solve_in_background(self, board):
+        """Solve board on a worker thread while the window repaints snapshots.
+
+        Runs a local event loop until the worker is done, so the Stop button
+        stays responsive and callers get solve()'s result as before.
+        """
+        from PyQt6.QtCore import QEventLoop, QTimer
+
+        outcome = {}
+
+        def work():
+            try:
+                outcome["result"] = self.solve(board)
+            except ValueError as e:
+                outcome["error"] = e
+            # Final frame: whatever the search left on the board
+            self._snapshot = [row[:] for row in board]
+
+        painted = [row[:] for row in board]
         self.start_time = time.time()
         self.initial_empty_cells = sum(row.count('.') for row in board)
-        self.solve_attempts = 0  # Initialize solve attempts counter
-        self.backtrack_count = 0  # Initialize backtrack counter
-        
-        # Initialize constraint sets
-        self.initialize_constraints(board)
-        return self._solve(board)
-
-    def _solve(self, board):
-        if not self.solving:
-            return None
-            
-        # Update statistics in window title only if not in test mode
-        current_time = time.time() - self.start_time
-        empty_cells = sum(row.count('.') for row in board)
-        cells_filled = self.initial_empty_cells - empty_cells
-        
-        if not self.test_mode and self.window:
-            title_text = (
-                f"Sudoku Solver | Time: {current_time:.2f}s | "
-                f"Filled: {cells_filled}/{self.initial_empty_cells}"
-            )
-            self.window.setWindowTitle(title_text)
-            QApplication.processEvents()
-        
-        cell = self.find_most_constrained_cell(board)
-        if not cell:
-            return board
-            
-        row, col = cell
-        possible = self.get_possible_values(row, col)
-        
-        for num in possible:
-            self.solve_attempts += 1
-            if self.is_safe_to_place(board, row, col, num):
-                board[row][col] = str(num)
-                self.update_constraints(row, col, num, add=True)
-                
-                # Update GUI only if not in test mode
-                if not self.test_mode and hasattr(self, 'cells') and self.cells:
-                    self.cells[row][col].setText(str(num))
-                    self.cells[row][col].setStyleSheet("""
-                        QLineEdit {
-                            font-size: 20px;
-                            background-color: white;
-                            border: 1px solid gray;
-                            color: red;
-                        }
-                    """)
-                    QApplication.processEvents()
-                    time.sleep(self.delay)
-                
-                if self._solve(board):
-                    return board
-                    
-                self.backtrack_count += 1
-                board[row][col] = "."
-                self.update_constraints(row, col, num, add=False)
-                
-                # Update GUI for backtracking only if not in test mode
-                if not self.test_mode and hasattr(self, 'cells') and self.cells:
-                    self.cells[row][col].setText("")
-                    self.cells[row][col].setStyleSheet("""
-                        QLineEdit {
-                            font-size: 20px;
-                            background-color: white;
-                            border: 1px solid gray;
-                        }
-                    """)
-                    QApplication.processEvents()
-        
-        return False
-
-    def update_constraints(self, row, col, num, add=True):
-        """Update constraint sets"""
-        if add:
-            self.rows[row].add(num)
-            self.cols[col].add(num)
-            self.boxes[(row // 3) * 3 + col // 3].add(num)
-        else:
-            self.rows[row].remove(num)
-            self.cols[col].remove(num)
-            self.boxes[(row // 3) * 3 + col // 3].remove(num)
-
-    def get_possible_values(self, row, col):
-        """Get possible values for a cell using constraint sets"""
-        used = self.rows[row] | self.cols[col] | self.boxes[(row // 3) * 3 + col // 3]
-        return set(range(1, 10)) - used
-
-    def find_most_constrained_cell(self, board):
-        """Find empty cell with fewest possible values"""
-        min_possibilities = 10
-        best_cell = None
-        
-        for i in range(9):
-            for j in range(9):
-                if board[i][j] == ".":
-                    possible = self.get_possible_values(i, j)
-                    if len(possible) < min_possibilities:
-                        min_possibilities = len(possible)
-                        best_cell = (i, j)
-                        if min_possibilities == 1:
-                            return best_cell
-        
-        return best_cell
-
-    def is_safe_to_place(self, board, row, col, num):
-        """Quick check if number can be placed"""
-        return (num not in self.rows[row] and 
-                num not in self.cols[col] and 
-                num not in self.boxes[(row // 3) * 3 + col // 3])
-
-    def get_possible_numbers(self, board, row, col):
-        box_id = (row // 3) * 3 + col // 3
-        used = set()
-        
-        # Check row and column simultaneously
-        for i in range(9):
-            if board[row][i] != ".":
-                used.add(int(board[row][i]))
-            if board[i][col] != ".":
-                used.add(int(board[i][col]))
-        
-        # Check box using pre-computed indices
-        for i, j in self.box_indices[box_id]:
-            if board[i][j] != ".":
-                used.add(int(board[i][j]))
-        
-        return set(range(1, 10)) - used
-
-    def find_best_empty(self, board):
-        min_possibilities = 10
-        best_cell = None
-        
-        for i in range(9):
-            for j in range(9):
-                if board[i][j] == ".":
-                    possible = self.get_possible_numbers(board, i, j)
-                    if len(possible) == 1:  # Found cell with only one possibility
-                        return (i, j)
-                    if len(possible) < min_possibilities:
-                        min_possibilities = len(possible)
-                        best_cell = (i, j)
-        
-        return best_cell
+        self._snapshot = None
+        self._next_frame = 0.0
+        self._worker = threading.Thread(target=work, daemon=True)
+
+        loop = QEventLoop()
+        timer = QTimer()
+        timer.setInterval(max(1, round(1000 / self.frame_rate)))
+
+        def tick():
+            done = not self._worker.is_alive()
+            self._repaint(painted)
+            if done:
+                loop.quit()
+
+        timer.timeout.connect(tick)
+        self._worker.start()
+        timer.start()
+        loop.exec()
+        timer.stop()
+        self._worker.join()
+        self._worker = None
+
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["result"]
+
+    def _repaint(self, painted):
+        """Paint the latest snapshot, touching only cells that changed"""
+        snapshot = self._snapshot
+        if snapshot is None or snapshot is painted:
+            return
+        for i in range(self.size):
+            for j in range(self.size):
+                value = snapshot[i][j]
+                if value != painted[i][j]:
+                    cell = self.cells[i][j]
+                    if value == ".":
+                        cell.setText("")
+                        cell.setStyleSheet(CELL_STYLE.format(color="black"))
+                    else:
+                        cell.setText(value)
+                        cell.setStyleSheet(CELL_STYLE.format(color="red"))
+                    painted[i][j] = value
+
+        empty_cells = sum(row.count('.') for row in snapshot)
+        self.window.setWindowTitle(
+            f"Sudoku Solver | Time: {time.time() - self.start_time:.2f}s | "
+            f"Filled: {self.initial_empty_cells - empty_cells}/{self.initial_empty_cells}"
+        )
 
     def solve_array(self, board):
-        """Solve Sudoku from array input"""
+        """Solve Sudoku from array input (a list of rows or a Board)"""
+        compact = isinstance(board, Board)
         try:
+            if compact and board.size != self.size:
+                raise ValueError(f"Board must be {self.size}x{self.size}")
             # Create deep copy to preserve original board
-            initial_state = [row[:] for row in board]
-            
-            # Print the input board in 3x3 format
+            initial_state = board.to_list() if compact else [row[:] for row in board]
+
+            # Print the input board in box format
+            n = self.box_size
+            rule = "-" * (2 * (self.size + n) + 1)
             print("\nInput Sudoku Board:")
-            print("-" * 25)
-            for i in range(9):
-                if i % 3 == 0 and i != 0:
-                    print("-" * 25)
-                row = board[i]
-                for j in range(9):
-                    if j % 3 == 0:
+            print(rule)
+            for i in range(self.size):
+                if i % n == 0 and i != 0:
+                    print(rule)
+                row = initial_state[i]
+                for j in range(self.size):
+                    if j % n == 0:
                         print("|", end=" ")
                     print(row[j], end=" ")
                 print("|")
-            print("-" * 25)
-            
+            print(rule)
+
             if not self.test_mode:
+                from PyQt6.QtWidgets import QApplication
                 # Initialize GUI before solving
                 if not self.window:
                     self.create_gui()
                 # Clear and load the initial board
                 self.clear_board()
-                for i in range(9):
-                    for j in range(9):
+                for i in range(self.size):
+                    for j in range(self.size):
                         if initial_state[i][j] != ".":
                             self.cells[i][j].setText(initial_state[i][j])
-                            self.cells[i][j].setStyleSheet("""
-                                QLineEdit {
-                                    font-size: 20px;
-                                    background-color: white;
-                                    border: 1px solid gray;
-                                    color: black;
-                                }
-                            """)
+                            self.cells[i][j].setStyleSheet(CELL_STYLE.format(color="black"))
                 QApplication.processEvents()
-            
-            # Solve the board
-            solution = self.solve(board)
+
+            # Solve the board; with a window the last frame shows the solution
+            if self.test_mode:
+                solution = self.solve(board)
+            elif compact:
+                # Painting works on the list format; the Board takes the result
+                solution = self._solve_in_background(board.to_list())
+                if solution:
+                    board.update(solution)
+            else:
+                solution = self._solve_in_background(board)
             if solution:
                 if not self.test_mode:
-                    self.display_solution(solution, initial_state)
                     self.visualize(solution, initial_state)
-                return solution
+                return board if compact else solution
             else:
                 print("No solution exists!")
                 return None
@@ -303,300 +188,28 @@ class Sudoku:
 
     def load_array_to_gui(self, board):
         """Load array into GUI"""
+        if isinstance(board, Board):
+            board = board.to_list()
         if not self.window:
             self.create_gui()
-        
-        for i in range(9):
-            for j in range(9):
+
+        for i in range(self.size):
+            for j in range(self.size):
                 if board[i][j] != ".":
                     self.cells[i][j].setText(board[i][j])
 
-    # # def solve(self, board):
-    #     if not self.is_valid_board(board):
-    #         raise ValueError("Invalid Sudoku board")
-            
-    #     find = self.find_empty(board)
-    #     if not find:
-    #         return board
-            
-    #     row, col = find
-        
-    #     for i in range(1,10):
-    #         if self.is_valid(board, i, (row, col)):
-    #             board[row][col] = str(i)
-                
-    #             # Update GUI with current number in red
-    #             if hasattr(self, 'cells') and self.cells:
-    #                 self.cells[row][col].setText(str(i))
-    #                 self.cells[row][col].setStyleSheet("""
-    #                     QLineEdit {
-    #                         font-size: 20px;
-    #                         background-color: white;
-    #                         border: 1px solid gray;
-    #                         color: red;
-    #                     }
-    #                 """)
-    #                 QApplication.processEvents()
-    #                 time.sleep(self.delay)
-                
-    #             if self.solve(board):
-    #                 return board
-                    
-    #             board[row][col] = "."
-    #             # Clear cell in GUI if backtracking
-    #             if hasattr(self, 'cells') and self.cells:
-    #                 self.cells[row][col].setText("")
-    #                 self.cells[row][col].setStyleSheet("""
-    #                     QLineEdit {
-    #                         font-size: 20px;
-    #                         background-color: white;
-    #                         border: 1px solid gray;
-    #                     }
-    #                 """)
-    #                 QApplication.processEvents()
-                
-    #     return False
-
-    # def load_example(self, custom_board=None):
-    #     # Create GUI if it doesn't exist
-    #     if not self.window:
-    #         self.create_gui()
-        
-    #     # Initialize default example board
-    #     example = [
-    #         ["5","3",".",".","7",".",".",".","."],
-    #         ["6",".",".","1","9","5",".",".","."],
-    #         [".","9","8",".",".",".",".","6","."],
-    #         ["8",".",".",".","6",".",".",".","3"],
-    #         ["4",".",".","8",".","3",".",".","1"],
-    #         ["7",".",".",".","2",".",".",".","6"],
-    #         [".","6",".",".",".",".","2","8","."],
-    #         [".",".",".","4","1","9",".",".","5"],
-    #         [".",".",".",".","8",".",".","7","9"]
-    #     ]
-        
-    #     board_to_use = example
-        
-    #     # Handle custom board if provided
-    #     if custom_board is not None:
-    #         try:
-    #             # Handle boolean input by converting to empty board
-    #             if isinstance(custom_board, bool):
-    #                 board = [["."] * 9 for _ in range(9)]
-    #             else:
-    #                 # Convert rows to lists if needed
-    #                 board = []
-    #                 for row in custom_board:
-    #                     board_row = []
-    #                     for cell in row:
-    #                         # Convert cell to string and handle zeros
-    #                         cell_str = str(cell)
-    #                         board_row.append("." if cell_str == "0" or cell_str == "" else cell_str)
-    #                     board.append(board_row)
-                
-    #             # Validate board dimensions
-    #             if len(board) != 9 or any(len(row) != 9 for row in board):
-    #                 raise ValueError("Board must be 9x9")
-                
-    #             # Validate cell contents
-    #             for row in board:
-    #                 for cell in row:
-    #                     if not (cell == "." or (cell.isdigit() and 1 <= int(cell) <= 9)):
-    #                         raise ValueError(f"Invalid cell value: {cell}")
-                
-    #             # Update GUI with custom board
-    #             self.clear_board()
-    #             for i in range(9):
-    #                 for j in range(9):
-    #                     if board[i][j] != ".":
-    #                         self.cells[i][j].setText(board[i][j])
-    #                         self.cells[i][j].setStyleSheet("""
-    #                             QLineEdit {
-    #                                 font-size: 20px;
-    #                                 background-color: white;
-    #                                 border: 1px solid gray;
-    #                                 color: black;
-    #                             }
-    #                         """)
-                
-    #             # Print the board in 9x9 format
-    #             print("\nLoaded Sudoku Board:")
-    #             print("-" * 25)
-    #             for i in range(9):
-    #                 if i % 3 == 0 and i != 0:
-    #                     print("-" * 25)
-    #                 for j in range(9):
-    #                     if j % 3 == 0:
-    #                         print("|", end=" ")
-    #                     print(board[i][j], end=" ")
-    #                 print("|")
-    #             print("-" * 25)
-                
-    #             return board
-                
-    #         except Exception as e:
-    #             print(f"Error loading custom board: {e}")
-        
-    #     # Load default example if no custom board or if custom board failed
-    #     example = [
-    #         ["5","3",".",".","7",".",".",".","."],
-    #         ["6",".",".","1","9","5",".",".","."],
-    #         [".","9","8",".",".",".",".","6","."],
-    #         ["8",".",".",".","6",".",".",".","3"],
-    #         ["4",".",".","8",".","3",".",".","1"],
-    #         ["7",".",".",".","2",".",".",".","6"],
-    #         [".","6",".",".",".",".","2","8","."],
-    #         [".",".",".","4","1","9",".",".","5"],
-    #         [".",".",".",".","8",".",".","7","9"]
-    #     ]
-        
-    #     # Clear and update GUI with example
-    #     self.clear_board()
-    #     for i in range(9):
-    #         for j in range(9):
-    #             if example[i][j] != ".":
-    #                 self.cells[i][j].setText(example[i][j])
-    #                 self.cells[i][j].setStyleSheet("""
-    #                     QLineEdit {
-    #                         font-size: 20px;
-    #                         background-color: white;
-    #                         border: 1px solid gray;
-    #                         color: black !important;
-    #                     }
-    #                 """)
-        
-    #     return example
-
     def clear_board(self):
         """Clear all cells in the GUI"""
-        for i in range(9):
-            for j in range(9):
+        for i in range(self.size):
+            for j in range(self.size):
                 self.cells[i][j].setText("")
                 self.cells[i][j].setStyleSheet(self.cells[i][j].styleSheet().replace("red", "black"))
 
-    def is_valid(self, board, num, pos):
-        # Check row
-        for x in range(len(board[0])):
-            if board[pos[0]][x] == str(num) and pos[1] != x:
-                return False
-                
-        # Check column
-        for x in range(len(board)):
-            if board[x][pos[1]] == str(num) and pos[0] != x:
-                return False
-                
-        # Check box
-        box_x = pos[1] // 3
-        box_y = pos[0] // 3
-        
-        for i in range(box_y * 3, box_y * 3 + 3):
-            for j in range(box_x * 3, box_x * 3 + 3):
-                if board[i][j] == str(num) and (i,j) != pos:
-                    return False
-                    
-        return True
-        
-    # def solve(self, board):
-    #     if not self.is_valid_board(board):
-    #         raise ValueError("Invalid Sudoku board")
-            
-    #     find = self.find_empty(board)
-    #     if not find:
-    #         return board
-            
-    #     row, col = find
-        
-    #     for i in range(1,10):
-    #         if self.is_valid(board, i, (row, col)):
-    #             board[row][col] = str(i)
-                
-    #             # Update GUI with current number in red
-    #             if hasattr(self, 'cells') and self.cells:
-    #                 self.cells[row][col].setText(str(i))
-    #                 self.cells[row][col].setStyleSheet("""
-    #                     QLineEdit {
-    #                         font-size: 20px;
-    #                         background-color: white;
-    #                         border: 1px solid gray;
-    #                         color: red;
-    #                     }
-    #                 """)
-    #                 QApplication.processEvents()
-    #                 time.sleep(self.delay)
-                
-    #             if self.solve(board):
-    #                 return board
-                    
-    #             board[row][col] = "."
-    #             # Clear cell in GUI if backtracking
-    #             if hasattr(self, 'cells') and self.cells:
-    #                 self.cells[row][col].setText("")
-    #                 self.cells[row][col].setStyleSheet("""
-    #                     QLineEdit {
-    #                         font-size: 20px;
-    #                         background-color: white;
-    #                         border: 1px solid gray;
-    #                     }
-    #                 """)
-    #                 QApplication.processEvents()
-                
-    #     return False
-
-    def find_empty(self, board):
-        for i in range(len(board)):
-            for j in range(len(board[0])):
-                if board[i][j] == ".":
-                    return (i, j)
-        return None
-        
-    def is_valid_board(self, board):
-        # Check rows
-        for row in board:
-            nums = [x for x in row if x != "."]
-            if len(nums) != len(set(nums)):
-                return False
-                
-        # Check columns
-        for col in zip(*board):
-            nums = [x for x in col if x != "."]
-            if len(nums) != len(set(nums)):
-                return False
-                
-        # Check boxes
-        for i in (0, 3, 6):
-            for j in (0, 3, 6):
-                box = []
-                for k in range(3):
-                    for l in range(3):
-                        if board[i+k][j+l] != ".":
-                            box.append(board[i+k][j+l])
-                if len(box) != len(set(box)):
-                    return False
-        return True
-        
-    def is_valid_solution(self, board):
-        # Check if board is complete and valid
-        for row in board:
-            if sorted([str(x) for x in row]) != ['1','2','3','4','5','6','7','8','9']:
-                return False
-                
-        for col in zip(*board):
-            if sorted([str(x) for x in col]) != ['1','2','3','4','5','6','7','8','9']:
-                return False
-                
-        for i in (0, 3, 6):
-            for j in (0, 3, 6):
-                box = []
-                for k in range(3):
-                    for l in range(3):
-                        box.append(board[i+k][j+l])
-                if sorted([str(x) for x in box]) != ['1','2','3','4','5','6','7','8','9']:
-                    return False
-        return True
-
     def display_solution(self, solution, initial_state):
-        for i in range(9):
-            for j in range(9):
+        from PyQt6.QtWidgets import QApplication
+
+        for i in range(self.size):
+            for j in range(self.size):
                 self.cells[i][j].setText(solution[i][j])
                 # Color solved numbers red, keep original numbers black
                 if initial_state[i][j] == ".":
@@ -607,66 +220,73 @@ class Sudoku:
                     time.sleep(0.2)
 
     def visualize(self, board, initial_state):
+        import matplotlib.pyplot as plt
+
+        size = self.size
         fig, ax = plt.subplots(figsize=(10, 10))
-        
-        # Draw grid with thicker lines for 3x3 boxes
-        for i in range(10):
-            lw = 3 if i % 3 == 0 else 0.5
+
+        # Draw grid with thicker lines around the boxes
+        for i in range(size + 1):
+            lw = 3 if i % self.box_size == 0 else 0.5
             ax.axhline(y=i, color='black', linewidth=lw)
             ax.axvline(x=i, color='black', linewidth=lw)
-            
+
         # Fill numbers with different colors
-        for i in range(9):
-            for j in range(9):
+        fontsize = 20 * 9 // size
+        for i in range(size):
+            for j in range(size):
                 color = 'black' if initial_state[i][j] != "." else 'red'
-                ax.text(j + 0.5, 8.5 - i, board[i][j], 
-                       ha='center', va='center', fontsize=20,
+                ax.text(j + 0.5, size - 0.5 - i, board[i][j],
+                       ha='center', va='center', fontsize=fontsize,
                        color=color)
-                
+
         ax.set_title("Sudoku Solution\nRed: Solved Numbers, Black: Given Numbers")
         plt.axis('off')
         plt.show()
 
     def solve_from_gui(self):
         """Solve Sudoku from GUI input"""
+        from PyQt6.QtWidgets import QMessageBox
+
+        if self._worker:  # Already solving
+            return
         self.solving = True  # Reset solving flag
         board = []
         initial_state = []  # Store initial state to know which numbers were given
-        for i in range(9):
+        for i in range(self.size):
             row = []
             initial_row = []
-            for j in range(9):
-                val = self.cells[i][j].text()
+            for j in range(self.size):
+                val = self.cells[i][j].text().upper()
                 row.append(val if val else ".")
                 initial_row.append(val if val else ".")
             board.append(row)
             initial_state.append(initial_row)
-            
+
         try:
             start_time = time.time()
-            solution = self.solve(board)
+            solution = self._solve_in_background(board)
             end_time = time.time()
             solve_time = end_time - start_time
-            
+
             if solution and self.solving:  # Check if solving wasn't stopped
-                self.display_solution(solution, initial_state)
                 self.visualize(solution, initial_state)
                 empty_cells = sum(row.count('.') for row in initial_state)
-                
+
                 # Calculate solving statistics
                 attempts_per_cell = self.solve_attempts / empty_cells if empty_cells > 0 else 0
                 backtrack_ratio = self.backtrack_count / self.solve_attempts if self.solve_attempts > 0 else 0
-                
+
                 stats_message = (
                     f"Time taken: {solve_time:.3f} seconds\n"
                     f"Empty cells filled: {empty_cells}\n"
-                    f"Complexity: O(9^{empty_cells})\n"
+                    f"Complexity: O({self.size}^{empty_cells})\n"
                     f"Solution attempts: {self.solve_attempts}\n"
                     f"Backtrack count: {self.backtrack_count}\n"
                     f"Average attempts per cell: {attempts_per_cell:.2f}\n"
                     f"Backtrack ratio: {backtrack_ratio:.2%}"
                 )
-                
+
                 QMessageBox.information(self.window, "Solution Found", stats_message)
                 self.window.setWindowTitle("Sudoku Solver")  # Reset title
             elif not self.solving:
@@ -677,32 +297,38 @@ class Sudoku:
             QMessageBox.critical(self.window, "Error", str(e))
 
     def create_gui(self):
+        from PyQt6.QtWidgets import (QMainWindow, QWidget, QGridLayout,
+                                     QLineEdit, QPushButton)
+        from PyQt6.QtCore import Qt
+
         self.window = QMainWindow()
         self.window.setWindowTitle("Sudoku Solver")
-        
+
         # Set window to stay on top initially
         self.window.setWindowFlags(Qt.WindowType.WindowStaysOnTopHint)
-        
+
         central_widget = QWidget()
         self.window.setCentralWidget(central_widget)
         main_layout = QGridLayout(central_widget)
-        main_layout.setSpacing(10)  # Space between 3x3 boxes
-        
-        # Create 9x9 grid organized in 3x3 boxes
+        main_layout.setSpacing(10)  # Space between boxes
+
+        # Create the size x size grid organized in boxes
+        n = self.box_size
+        cell_size = 50 if self.size <= 9 else 32
         self.cells = []
-        for box_i in range(3):
-            for box_j in range(3):
-                # Create a widget for each 3x3 box
+        for box_i in range(n):
+            for box_j in range(n):
+                # Create a widget for each box
                 box_widget = QWidget()
                 box_layout = QGridLayout(box_widget)
                 box_layout.setSpacing(1)  # Space between cells in a box
-                
-                for i in range(3):
+
+                for i in range(n):
                     cell_row = []
-                    for j in range(3):
+                    for j in range(n):
                         cell = QLineEdit()
                         cell.setMaxLength(1)
-                        cell.setFixedSize(50, 50)
+                        cell.setFixedSize(cell_size, cell_size)
                         cell.setAlignment(Qt.AlignmentFlag.AlignCenter)
                         cell.setStyleSheet("""
                             QLineEdit {
@@ -713,86 +339,79 @@ class Sudoku:
                                 font-weight: bold;
                             }
                         """)
-                        
+
                         box_layout.addWidget(cell, i, j)
                         cell_row.append(cell)
-                        
+
                         # Set focus to first cell
                         if box_i == 0 and box_j == 0 and i == 0 and j == 0:
                             cell.setFocus()
-                    
-                    if box_i * 3 + i >= len(self.cells):
+
+                    if box_i * n + i >= len(self.cells):
                         self.cells.append([])
-                    self.cells[box_i * 3 + i].extend(cell_row)
-                
+                    self.cells[box_i * n + i].extend(cell_row)
+
                 box_widget.setStyleSheet("background-color: #f0f0f0; border: 2px solid black;")
                 main_layout.addWidget(box_widget, box_i, box_j)
 
         # Remove stats label section and directly add buttons
         button_widget = QWidget()
         button_layout = QGridLayout(button_widget)
-        
+
         solve_button = QPushButton("Solve")
         solve_button.clicked.connect(self.solve_from_gui)
         solve_button.setFixedSize(100, 40)
-        
+
         stop_button = QPushButton("Stop")
         stop_button.clicked.connect(self.stop_solving)
         stop_button.setFixedSize(100, 40)
-        
+
         check_button = QPushButton("Check")
         check_button.clicked.connect(self.check_solution)
         check_button.setFixedSize(100, 40)
-        
+
         clear_button = QPushButton("Clear")
         clear_button.clicked.connect(self.clear_board)
         clear_button.setFixedSize(100, 40)
-        
-        # example_button = QPushButton("Load Example")
-        # example_button.clicked.connect(self.load_example)
-        # example_button.setFixedSize(100, 40)
-        
+
         button_layout.addWidget(solve_button, 0, 0)
         button_layout.addWidget(stop_button, 0, 1)
         button_layout.addWidget(check_button, 0, 2)
         button_layout.addWidget(clear_button, 0, 3)
-        # button_layout.addWidget(example_button, 0, 4)
-        
-        main_layout.addWidget(button_widget, 3, 0, 1, 3)
-        
+
+        main_layout.addWidget(button_widget, n, 0, 1, n)
+
         self.window.show()
         self.window.activateWindow()
         self.window.raise_()  # Bring window to front
-        
+
         # Remove stay on top flag after showing
         self.window.setWindowFlags(Qt.WindowType.Widget)
         self.window.show()
 
-    def stop_solving(self):
-        """Stop the solving process"""
-        self.solving = False
-
     def check_solution(self):
         """Check if current board state is valid"""
+        from PyQt6.QtWidgets import QMessageBox
+
         board = []
-        for i in range(9):
+        for i in range(self.size):
             row = []
-            for j in range(9):
+            for j in range(self.size):
                 val = self.cells[i][j].text()
                 if not val:  # Board not complete
                     QMessageBox.warning(self.window, "Incomplete", "Please fill all cells!")
                     return
                 row.append(val)
             board.append(row)
-            
+
         if self.is_valid_solution(board):
             QMessageBox.information(self.window, "Valid", "Solution is correct!")
         else:
             QMessageBox.warning(self.window, "Invalid", "Solution is incorrect!")
 
-    if __name__ == "__main__":
-        # Start the event loop after creating the instance
-        app = QApplication(sys.argv)
-        sudoku = Sudoku()
-        sudoku.create_gui()
-        sys.exit(app.exec())
\ No newline at end of file
+
+if __name__ == "__main__":
+    # Start the event loop after creating the instance
+    sudoku = Sudoku()
+    sudoku.create_gui()
+    sys.exit(sudoku.app.exec())
@@ -0,0 +1,181 @@
+"""Batch Sudoku solving across a process pool.
+
+Reads puzzles in the common 81-character line format (``.`` or ``0`` for
+empty cells) and streams solutions back in input order::
+
+    python -m src.sudoku_batch puzzles.txt --workers 8 --chunk-size 256
+"""
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import os
+import sys
+import time
+
+from src.sudoku_core import SOLVERS, SudokuCore, parse_board, board_to_string
+
+SolveResult = namedtuple(
+    "SolveResult",
+    "index puzzle solution solve_attempts backtrack_count elapsed error")
+
+
+def read_puzzles(lines):
+    """Yield puzzle strings from lines, skipping blanks and # comments.
+
+    Anything after the first 81 characters (ratings, solutions) is ignored.
+    """
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line[:81]
+
+
+def solve_puzzle(puzzle, engine="bitmask", index=0):
+    """Solve one puzzle string and return a SolveResult"""
+    start = time.perf_counter()
+    solver = SudokuCore()
+    try:
+        solution = solver.solve(parse_board(puzzle), solver=engine)
+    except ValueError as e:
+        return SolveResult(index, puzzle, None, 0, 0,
+                           time.perf_counter() - start, str(e))
+    return SolveResult(
+        index, puzzle,
+        board_to_string(solution) if solution else None,
+        solver.solve_attempts, solver.backtrack_count,
+        time.perf_counter() - start, None)
+
+
+def _solve_chunk(chunk, engine):
+    return [solve_puzzle(puzzle, engine, index) for index, puzzle in chunk]
+
+
+def _chunked(puzzles, chunk_size):
+    chunk = []
+    for item in enumerate(puzzles):
+        chunk.append(item)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def solve_batch(puzzles, workers=None, chunk_size=64, engine="bitmask"):
+    """Solve puzzles across a process pool, yielding SolveResults in input order.
+
+    Puzzles are sent to the workers in chunks of chunk_size. Only a couple of
+    chunks per worker are in flight at once, so arbitrarily long inputs are
+    streamed rather than loaded up front.
+    """
+    if engine not in SOLVERS:
+        raise ValueError(f"Unknown engine: {engine}")
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in _chunked(puzzles, chunk_size):
+            pending.append(pool.submit(_solve_chunk, chunk, engine))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+class BatchStats:
+    """Aggregate counters and throughput for a batch run"""
+
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.end_time = None
+        self.puzzles = 0
+        self.solved = 0
+        self.unsolvable = 0
+        self.invalid = 0
+        self.solve_attempts = 0
+        self.backtrack_count = 0
+        self.solve_time = 0.0
+
+    def add(self, result):
+        self.puzzles += 1
+        if result.error:
+            self.invalid += 1
+        elif result.solution:
+            self.solved += 1
+        else:
+            self.unsolvable += 1
+        self.solve_attempts += result.solve_attempts
+        self.backtrack_count += result.backtrack_count
+        self.solve_time += result.elapsed
+
+    def finish(self):
+        self.end_time = time.perf_counter()
+
+    @property
+    def wall_time(self):
+        return (self.end_time or time.perf_counter()) - self.start_time
+
+    @property
+    def throughput(self):
+        """Puzzles per second of wall time"""
+        return self.puzzles / self.wall_time if self.wall_time > 0 else 0.0
+
+    def summary(self):
+        return (
+            f"Puzzles: {self.puzzles} (solved {self.solved}, "
+            f"unsolvable {self.unsolvable}, invalid {self.invalid})\n"
+            f"Wall time: {self.wall_time:.3f}s | "
+            f"Throughput: {self.throughput:.1f} puzzles/s | "
+            f"CPU solve time: {self.solve_time:.3f}s\n"
+            f"Solve attempts: {self.solve_attempts} | "
+            f"Backtracks: {self.backtrack_count}"
+        )
+
+
+def format_result(result):
+    """One tab-separated output line: solution, attempts, backtracks, ms"""
+    if result.error:
+        solution = f"error: {result.error}"
+    else:
+        solution = result.solution or "no solution"
+    return (f"{solution}\t{result.solve_attempts}\t{result.backtrack_count}\t"
+            f"{result.elapsed * 1000:.3f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Solve Sudoku puzzles in the 81-character line format")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="puzzle file, one puzzle per line ('-' for stdin)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="where to write solutions ('-' for stdout)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("-c", "--chunk-size", type=int, default=64,
+                        help="puzzles sent to a worker at a time")
+    parser.add_argument("-e", "--engine", choices=sorted(SOLVERS), default="bitmask")
+    args = parser.parse_args(argv)
+
+    infile = sys.stdin if args.input == "-" else open(args.input)
+    outfile = sys.stdout if args.output == "-" else open(args.output, "w")
+    stats = BatchStats()
+    try:
+        for result in solve_batch(read_puzzles(infile), args.workers,
+                                  args.chunk_size, args.engine):
+            stats.add(result)
+            outfile.write(format_result(result) + "\n")
+    finally:
+        stats.finish()
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+
+    print(stats.summary(), file=sys.stderr)
+    return 0 if stats.invalid == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""Solve-time benchmark for Sudoku engines across grid sizes.
+
+Generates random puzzles for each size by shuffling a full grid and
+blanking cells, then times every engine on the same puzzles::
+
+    python -m src.sudoku_benchmark --sizes 9 16 25 --engines propagate dlx
+
+Random hole patterns have an easy-hard-easy phase transition: around
+40-45% clues on 25x25 grids, both engines hit heavy-tailed searches, so the
+default clue fraction stays clear of it. Solves are capped by --timeout.
+"""
+import argparse
+import random
+import statistics
+import sys
+import threading
+import time
+
+from src.sudoku_core import SOLVERS, SudokuCore
+from src.sudoku_grid import EMPTY, SYMBOLS, box_size_for
+
+
+def random_grid(size, rng):
+    """A random complete grid: a pattern solution with its bands, stacks,
+    rows within bands, columns within stacks and symbols shuffled"""
+    n = box_size_for(size)
+    rows = [band * n + r for band in rng.sample(range(n), n) for r in rng.sample(range(n), n)]
+    cols = [stack * n + c for stack in rng.sample(range(n), n) for c in rng.sample(range(n), n)]
+    symbols = rng.sample(SYMBOLS[:size], size)
+    return [[symbols[(n * (r % n) + r // n + c) % size] for c in cols] for r in rows]
+
+
+def random_puzzle(size, clues, rng):
+    """A random grid keeping a fraction clues of its cells (not necessarily
+    with a unique solution)"""
+    board = random_grid(size, rng)
+    cells = size * size
+    for idx in rng.sample(range(cells), cells - round(clues * cells)):
+        board[idx // size][idx % size] = EMPTY
+    return board
+
+
+def supports_size(engine, size):
+    """Whether engine can solve size x size grids"""
+    if SOLVERS[engine] is None:
+        return True
+    try:
+        SOLVERS[engine](size)
+    except ValueError:
+        return False
+    return True
+
+
+def time_solve(board, size, engine, timeout=None):
+    """Solve a copy of board; returns (seconds, solve_attempts, solved).
+
+    solved is None when the timeout stopped the search.
+    """
+    core = SudokuCore(size)
+    timer = threading.Timer(timeout, core.stop_solving) if timeout else None
+    if timer:
+        timer.start()
+    start = time.perf_counter()
+    try:
+        result = core.solve([row[:] for row in board], solver=engine)
+    finally:
+        if timer:
+            timer.cancel()
+    elapsed = time.perf_counter() - start
+    # A stopped search unwinds with None or False; solving tells them apart
+    return elapsed, core.solve_attempts, bool(result) if core.solving else None
+
+
+def benchmark_sizes(sizes=(9, 16, 25), engines=("propagate", "dlx"), puzzles=10,
+                    clues=0.5, timeout=10.0, seed=0):
+    """Time each engine on the same random puzzles for every size.
+
+    Returns one dict per (size, engine) with the number of puzzles solved
+    and timed out, mean/median/max seconds and mean solve attempts over the
+    puzzles that finished. Engines that do not support a size are skipped.
+    """
+    rows = []
+    for size in sizes:
+        rng = random.Random(seed)
+        boards = [random_puzzle(size, clues, rng) for _ in range(puzzles)]
+        for engine in engines:
+            if not supports_size(engine, size):
+                continue
+            times, attempts, timed_out = [], [], 0
+            for board in boards:
+                elapsed, tries, solved = time_solve(board, size, engine, timeout)
+                if solved is None:
+                    timed_out += 1
+                    continue
+                times.append(elapsed)
+                attempts.append(tries)
+            rows.append({
+                "size": size,
+                "engine": engine,
+                "solved": len(times),
+                "timed_out": timed_out,
+                "mean": statistics.mean(times) if times else None,
+                "median": statistics.median(times) if times else None,
+                "max": max(times) if times else None,
+                "attempts": statistics.mean(attempts) if attempts else None,
+            })
+    return rows
+
+
+def format_rows(rows):
+    lines = [f"{'size':>5} {'engine':<10} {'solved':>6} {'timeout':>7} "
+             f"{'mean ms':>9} {'median ms':>9} {'max ms':>9} {'attempts':>9}"]
+    for row in rows:
+        if row["solved"]:
+            timing = (f"{row['mean'] * 1000:9.1f} {row['median'] * 1000:9.1f} "
+                      f"{row['max'] * 1000:9.1f} {row['attempts']:9.0f}")
+        else:
+            timing = f"{'-':>9} {'-':>9} {'-':>9} {'-':>9}"
+        lines.append(f"{row['size']:>5} {row['engine']:<10} {row['solved']:>6} "
+                     f"{row['timed_out']:>7} {timing}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark Sudoku engines on random N²×N² puzzles")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[9, 16, 25])
+    parser.add_argument("--engines", nargs="+", choices=sorted(SOLVERS),
+                        default=["propagate", "dlx"])
+    parser.add_argument("-n", "--puzzles", type=int, default=10,
+                        help="puzzles per size")
+    parser.add_argument("--clues", type=float, default=0.5,
+                        help="fraction of cells given in each puzzle")
+    parser.add_argument("--timeout", type=float, default=10.0,
+                        help="seconds before a solve is abandoned")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    for size in args.sizes:
+        try:
+            box_size_for(size)
+        except ValueError as e:
+            parser.error(str(e))
+    rows = benchmark_sizes(args.sizes, args.engines, args.puzzles, args.clues,
+                           args.timeout, args.seed)
+    print(format_rows(rows))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
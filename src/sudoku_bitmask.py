@@ -0,0 +1,134 @@
+import time
+
+from src.sudoku_board import cell_values, fill_cells
+
+# Every digit is one bit: digit d lives at bit (d - 1)
+ALL_DIGITS = (1 << 9) - 1
+
+# Lookup tables indexed by a 9-bit "used digits" mask
+POPCOUNT = [bin(mask).count("1") for mask in range(1 << 9)]
+FREE_COUNT = [9 - POPCOUNT[mask] for mask in range(1 << 9)]
+# Free digits for a used mask, in the same order Sudoku.get_possible_values
+# yields them, so both engines walk exactly the same search tree
+FREE_DIGITS = [
+    tuple(set(range(1, 10)) - {d for d in range(1, 10) if mask & (1 << (d - 1))})
+    for mask in range(1 << 9)
+]
+DIGIT_BIT = [0] + [1 << (d - 1) for d in range(1, 10)]
+
+# Row, column and box of every cell in a flat 81-cell board
+CELL_UNITS = [(i // 9, i % 9, (i // 27) * 3 + (i % 9) // 3) for i in range(81)]
+
+
+class BitmaskSudokuSolver:
+    """Sudoku solver that keeps row/column/box constraints as 9-bit integers.
+
+    Drop-in alternative to Sudoku.solve: it takes the same list-of-lists
+    board (or a sudoku_board.Board), fills it in place and returns it (False
+    when there is no solution).
+    Its lookup tables are 9-bit, so it only handles 9x9 grids.
+    """
+
+    def __init__(self, size=9):
+        if size != 9:
+            raise ValueError("Bitmask solver only supports 9x9 boards")
+        self.rows = [0] * 9
+        self.cols = [0] * 9
+        self.boxes = [0] * 9
+        self.cells = [0] * 81
+        self.solving = False
+        self.observer = None
+        self.solve_attempts = 0
+        self.backtrack_count = 0
+
+    def load(self, board):
+        """Load a 9x9 board into the bitmasks, raising ValueError if invalid"""
+        values = cell_values(board, 9)
+
+        rows = self.rows = [0] * 9
+        cols = self.cols = [0] * 9
+        boxes = self.boxes = [0] * 9
+        cells = self.cells = [0] * 81
+
+        for idx, (r, c, b) in enumerate(CELL_UNITS):
+            digit = values[idx]
+            if not digit:
+                continue
+            bit = DIGIT_BIT[digit]
+            if (rows[r] | cols[c] | boxes[b]) & bit:
+                raise ValueError("Invalid Sudoku board")
+            rows[r] |= bit
+            cols[c] |= bit
+            boxes[b] |= bit
+            cells[idx] = digit
+
+    def solve(self, board):
+        self.load(board)
+        self.solving = True
+        self.start_time = time.time()
+        self.solve_attempts = 0
+        self.backtrack_count = 0
+
+        empties = [idx for idx in range(81) if not self.cells[idx]]
+        result = self._solve(empties)
+        if not result:
+            return result
+
+        cells = self.cells
+        return fill_cells(board, ((idx, cells[idx]) for idx in empties))
+
+    def _solve(self, empties):
+        """Search over the still-empty cells, kept in row-major order"""
+        if not self.solving:
+            return None
+        if not empties:
+            return True
+
+        rows, cols, boxes, cells = self.rows, self.cols, self.boxes, self.cells
+        observer = self.observer
+        free_count = FREE_COUNT
+        cell_units = CELL_UNITS
+
+        # Same choice as Sudoku.find_most_constrained_cell: the first cell
+        # with at most one candidate, otherwise the first with the fewest
+        best = 0
+        min_possibilities = 10
+        for idx in empties:
+            r, c, b = cell_units[idx]
+            count = free_count[rows[r] | cols[c] | boxes[b]]
+            if count < min_possibilities:
+                min_possibilities = count
+                best = idx
+                if count <= 1:
+                    break
+
+        pos = empties.index(best)
+        remaining = empties[:pos] + empties[pos + 1:]
+        r, c, b = cell_units[best]
+        for num in FREE_DIGITS[rows[r] | cols[c] | boxes[b]]:
+            self.solve_attempts += 1
+            bit = DIGIT_BIT[num]
+            cells[best] = num
+            rows[r] |= bit
+            cols[c] |= bit
+            boxes[b] |= bit
+            if observer is not None:
+                observer.on_place(r, c, num)
+
+            if self._solve(remaining):
+                return True
+
+            self.backtrack_count += 1
+            cells[best] = 0
+            rows[r] ^= bit
+            cols[c] ^= bit
+            boxes[b] ^= bit
+            if observer is not None:
+                observer.on_undo(r, c)
+
+        return False
+
+    def get_possible_values(self, row, col):
+        """Get possible values for a cell from the current bitmasks"""
+        used = self.rows[row] | self.cols[col] | self.boxes[(row // 3) * 3 + col // 3]
+        return set(FREE_DIGITS[used])
@@ -0,0 +1,202 @@
+"""Compact Sudoku boards backed by a bytearray.
+
+A Board keeps one byte per cell holding the value (0 for empty), so a copy is
+a single memcpy of size² bytes and no per-cell string objects exist. Boards
+parse straight from line-format bytes, including slices of memory-mapped
+puzzle files::
+
+    for board in read_boards("puzzles.txt"):
+        SudokuCore().solve(board)
+
+SudokuCore.solve, count_solutions and the Sudoku GUI accept a Board anywhere
+they take the list-of-lists format. The engines load a Board's cells and
+write the solution back into them directly, through cell_values and
+fill_cells, without going through per-cell strings.
+"""
+import mmap
+
+from src.sudoku_grid import EMPTY, grid_geometry
+
+INVALID = 0xFF
+
+
+def _parse_table(size):
+    """bytes.translate table from line-format characters to cell values"""
+    table = bytearray([INVALID]) * 256
+    table[ord(EMPTY)] = table[ord("0")] = 0
+    for value, symbol in enumerate(grid_geometry(size).symbols, 1):
+        table[ord(symbol)] = table[ord(symbol.lower())] = value
+    return bytes(table)
+
+
+def _format_table(size):
+    """bytes.translate table from cell values to line-format characters"""
+    table = bytearray(256)
+    table[0] = ord(EMPTY)
+    for value, symbol in enumerate(grid_geometry(size).symbols, 1):
+        table[value] = ord(symbol)
+    return bytes(table)
+
+
+_TABLES = {}
+
+
+def _tables(size):
+    if size not in _TABLES:
+        _TABLES[size] = (_parse_table(size), _format_table(size))
+    return _TABLES[size]
+
+
+class Board:
+    """A size x size Sudoku board stored as a bytearray of cell values.
+
+    board[row, col] reads and writes the integer value of a cell (0 when
+    empty); cells is the flat row-major bytearray itself.
+    """
+
+    __slots__ = ("size", "cells")
+
+    def __init__(self, size=9, cells=None):
+        grid = grid_geometry(size)
+        self.size = size
+        if cells is None:
+            self.cells = bytearray(grid.num_cells)
+        else:
+            self.cells = bytearray(cells)
+            if len(self.cells) != grid.num_cells:
+                raise ValueError(f"Board must have {grid.num_cells} cells")
+            if self.cells and max(self.cells) > size:
+                raise ValueError("Invalid cell value")
+
+    @classmethod
+    def from_bytes(cls, data, size=9):
+        """Parse size² line-format bytes (``.`` or ``0`` for empty cells)"""
+        num_cells = size * size
+        if len(data) != num_cells:
+            raise ValueError(f"Board string must have {num_cells} characters")
+        board = cls.__new__(cls)
+        board.size = size
+        board.cells = bytearray(data).translate(_tables(size)[0])
+        if INVALID in board.cells:
+            raise ValueError("Invalid cell value")
+        return board
+
+    @classmethod
+    def from_string(cls, value, size=9):
+        return cls.from_bytes(value.encode("ascii", "replace"), size)
+
+    @classmethod
+    def from_list(cls, board):
+        """Board from the list-of-lists format"""
+        size = len(board)
+        values = grid_geometry(size).values
+        if any(len(row) != size for row in board):
+            raise ValueError(f"Board must be {size}x{size}")
+        try:
+            cells = bytearray(0 if v == EMPTY else values[v] for row in board for v in row)
+        except KeyError as e:
+            raise ValueError(f"Invalid cell value: {e.args[0]}") from None
+        return cls(size, cells)
+
+    def to_list(self):
+        """The board in the list-of-lists format"""
+        line = self.to_string()
+        size = self.size
+        return [list(line[r * size:(r + 1) * size]) for r in range(size)]
+
+    def to_bytes(self):
+        return bytes(self.cells.translate(_tables(self.size)[1]))
+
+    def to_string(self):
+        return self.to_bytes().decode("ascii")
+
+    def update(self, board):
+        """Overwrite the cells from a list-of-lists board of the same size"""
+        self.cells[:] = Board.from_list(board).cells
+
+    def copy(self):
+        return Board(self.size, self.cells)
+
+    def empty_count(self):
+        return self.cells.count(0)
+
+    def __getitem__(self, pos):
+        row, col = pos
+        return self.cells[row * self.size + col]
+
+    def __setitem__(self, pos, value):
+        row, col = pos
+        self.cells[row * self.size + col] = value
+
+    def __len__(self):
+        """Number of rows, as for the list-of-lists format"""
+        return self.size
+
+    def __eq__(self, other):
+        if not isinstance(other, Board):
+            return NotImplemented
+        return self.size == other.size and self.cells == other.cells
+
+    def __str__(self):
+        return self.to_string()
+
+    def __repr__(self):
+        return f"Board({self.size}, {self.to_string()!r})"
+
+
+def cell_values(board, size):
+    """Flat row-major cell values (0 for empty) of a Board or a
+    list-of-lists board, raising ValueError unless it is size x size.
+
+    A Board's own bytearray is returned as it is, so treat it as read-only.
+    """
+    if isinstance(board, Board):
+        if board.size != size:
+            raise ValueError(f"Board must be {size}x{size}")
+        return board.cells
+    if len(board) != size or any(len(row) != size for row in board):
+        raise ValueError("Invalid Sudoku board")
+    return Board.from_list(board).cells
+
+
+def fill_cells(board, filled):
+    """Write (cell index, value) pairs into a Board or a list-of-lists
+    board and return it"""
+    if isinstance(board, Board):
+        cells = board.cells
+        for idx, value in filled:
+            cells[idx] = value
+        return board
+    size = len(board)
+    symbols = grid_geometry(size).symbols
+    for idx, value in filled:
+        board[idx // size][idx % size] = symbols[value - 1]
+    return board
+
+
+def iter_boards(buffer, size=9):
+    """Yield Boards from a buffer of line-format puzzles.
+
+    buffer is bytes or an mmap; blank lines and # comments are skipped and
+    anything after the first size² characters of a line is ignored. Each
+    puzzle is sliced and translated straight into its Board.
+    """
+    num_cells = size * size
+    start, end = 0, len(buffer)
+    while start < end:
+        stop = buffer.find(b"\n", start)
+        if stop == -1:
+            stop = end
+        line = buffer[start:stop].strip()
+        start = stop + 1
+        if line and not line.startswith(b"#"):
+            yield Board.from_bytes(line[:num_cells], size)
+
+
+def read_boards(path, size=9):
+    """Yield Boards from a puzzle file, memory-mapping it rather than reading it"""
+    with open(path, "rb") as f:
+        if not f.seek(0, 2):
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield from iter_boards(buffer, size)
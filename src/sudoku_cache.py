@@ -0,0 +1,308 @@
+"""Solution cache for Sudoku keyed by canonical form.
+
+Puzzles that differ only by relabelling the digits, permuting rows within a
+band or columns within a stack, swapping bands or stacks, or transposing
+share one canonical form. The cache stores the canonical puzzle's solution
+and maps it back through the inverse transform on a hit, so any puzzle
+equivalent to one already solved is answered without searching::
+
+    core = SudokuCore(cache=SolutionCache(path="solutions.db"))
+    core.solve(board)
+    core.cache.hit_rate
+
+Canonicalising is a search of its own, and on sparse or highly symmetric
+boards it takes far longer than solving (an empty 9x9 ties at every
+step). The cache therefore skips boards with fewer than min_clues clues,
+and gives canonical_form a step limit; a board that runs over it is solved
+without the cache.
+"""
+from collections import OrderedDict, namedtuple
+from itertools import permutations, product
+import dbm
+
+from src.sudoku_grid import EMPTY, grid_geometry
+
+# Ties are carried forward row by row (a full 9x9 first row ties 2 x 9 x 1296
+# ways); very sparse, highly symmetric grids (an empty board ties everywhere)
+# are cut off at this many partial transforms. The result is still a valid
+# transform, just possibly not the minimal one, which only costs a cache miss.
+MAX_STATES = 50000
+# Rows SolutionCache lets canonical_form relabel before solving uncached.
+# 9x9 puzzles down to 17 clues take at most about 8000 (0.04s); an empty
+# board would run past 50000.
+CANONICAL_STEPS = 20000
+# Clues a board needs for SolutionCache to look it up at all; 17 is the
+# fewest a 9x9 puzzle with a unique solution can have
+MIN_CLUES = 17
+
+# rows[i] and cols[j] are the (possibly transposed) board's row and column
+# that land at canonical row i and column j; labels[v] is the canonical
+# value of value v (0 stays empty).
+Transform = namedtuple("Transform", "transpose rows cols labels")
+
+
+def _first_row_orders(row, n):
+    """Column orders that bring a row's empty cells furthest forward.
+
+    Each stack goes empties first, and stacks with more empties go first;
+    every tie (stacks with equal counts, cells within the empties or the
+    clues of a stack) is a separate order.
+    """
+    stacks = []
+    for s in range(n):
+        cols = range(s * n, s * n + n)
+        empties = [c for c in cols if not row[c]]
+        clues = [c for c in cols if row[c]]
+        stacks.append((len(empties), empties, clues))
+    stacks.sort(key=lambda stack: -stack[0])
+
+    groups = []  # runs of stacks with the same number of empties
+    for stack in stacks:
+        if groups and groups[-1][0][0] == stack[0]:
+            groups[-1].append(stack)
+        else:
+            groups.append([stack])
+
+    group_orders = [list(permutations(group)) for group in groups]
+    for stack_order in product(*group_orders):
+        stacks_in_order = [stack for group in stack_order for stack in group]
+        inner = [product(permutations(empties), permutations(clues))
+                 for _, empties, clues in stacks_in_order]
+        for parts in product(*inner):
+            yield tuple(c for empties, clues in parts for c in empties + clues)
+
+
+def _relabel(row, cols, labels, next_label):
+    """Row values in column order under labels, extended by first appearance.
+
+    Returns (key, labels, next_label); labels is copied only if it grew.
+    """
+    key = []
+    added = None
+    for c in cols:
+        v = row[c]
+        if v:
+            label = labels[v] or (added and added.get(v))
+            if not label:
+                if added is None:
+                    added = {}
+                label = added[v] = next_label
+                next_label += 1
+            key.append(label)
+        else:
+            key.append(0)
+    if added:
+        labels = labels[:]
+        for v, label in added.items():
+            labels[v] = label
+    return tuple(key), labels, next_label
+
+
+def canonical_form(board, max_steps=None):
+    """Canonical form of a board under the Sudoku symmetry group.
+
+    Returns (key, transform): key is the canonical board in the line format
+    (``.`` for empty cells) and transform maps board onto it. Equivalent
+    boards get the same key, apart from the MAX_STATES cut-off above. With
+    max_steps, returns None once more than that many rows have been
+    relabelled.
+    """
+    steps = 0
+    size = len(board)
+    grid = grid_geometry(size)
+    n = grid.box_size
+    if any(len(row) != size for row in board):
+        raise ValueError("Invalid Sudoku board")
+    base = []
+    for row in board:
+        base_row = []
+        for v in row:
+            if v == EMPTY:
+                base_row.append(0)
+            elif v in grid.values:
+                base_row.append(grid.values[v])
+            else:
+                raise ValueError(f"Invalid cell value: {v}")
+        base.append(base_row)
+    grids = (base, [list(col) for col in zip(*base)])
+
+    # Row 0: the (transpose, row) pairs with the smallest pattern, the
+    # negated empty counts of the row's stacks taken from the fewest empties
+    # up (so rows whose fullest stack has the most empties win). The pattern
+    # is unchanged by every symmetry, so equivalent boards pick the same rows
+    best, firsts = None, []
+    for t, g in enumerate(grids):
+        for r in range(size):
+            pattern = sorted(sum(1 for c in range(s * n, s * n + n) if not g[r][c])
+                             for s in range(n))
+            pattern = tuple(-z for z in pattern)
+            if best is None or pattern < best:
+                best, firsts = pattern, [(t, r)]
+            elif pattern == best:
+                firsts.append((t, r))
+
+    states = []
+    for t, r in firsts:
+        row = grids[t][r]
+        for cols in _first_row_orders(row, n):
+            steps += 1
+            if max_steps is not None and steps > max_steps:
+                return None
+            _, labels, next_label = _relabel(row, cols, [0] * (size + 1), 1)
+            states.append((t, (r,), cols, labels, next_label))
+            if len(states) >= MAX_STATES:
+                break
+        if len(states) >= MAX_STATES:
+            break
+
+    for i in range(1, size):
+        best, next_states, seen = None, [], set()
+        for t, rows, cols, labels, next_label in states:
+            g = grids[t]
+            if i % n:
+                band = rows[-1] - rows[-1] % n
+                candidates = [r for r in range(band, band + n) if r not in rows]
+            else:
+                used = {r - r % n for r in rows}
+                candidates = [r for r in range(size) if r - r % n not in used]
+            steps += len(candidates)
+            if max_steps is not None and steps > max_steps:
+                return None
+            for r in candidates:
+                key, new_labels, new_next = _relabel(g[r], cols, labels, next_label)
+                if best is None or key < best:
+                    best, next_states, seen = key, [], set()
+                if key != best or len(next_states) >= MAX_STATES:
+                    continue
+                # States that used the same rows and agree on the columns and
+                # labels have the same future; keep one of them
+                future = (t, frozenset(rows), r - r % n, cols, tuple(new_labels))
+                if future not in seen:
+                    seen.add(future)
+                    next_states.append((t, rows + (r,), cols, new_labels, new_next))
+        states = next_states
+
+    t, rows, cols, labels, next_label = states[0]
+    # Values missing from the board get the remaining labels in order
+    for v in range(1, size + 1):
+        if not labels[v]:
+            labels[v] = next_label
+            next_label += 1
+
+    canonical = apply_transform(board, Transform(t, rows, cols, tuple(labels)))
+    key = "".join("".join(row) for row in canonical)
+    return key, Transform(t, rows, cols, tuple(labels))
+
+
+def apply_transform(board, transform):
+    """board mapped through transform, as a new board"""
+    size = len(board)
+    symbols = grid_geometry(size).symbols
+    values = grid_geometry(size).values
+    g = [list(col) for col in zip(*board)] if transform.transpose else board
+    out = []
+    for r in transform.rows:
+        row = []
+        for c in transform.cols:
+            v = g[r][c]
+            row.append(EMPTY if v == EMPTY else symbols[transform.labels[values[v]] - 1])
+        out.append(row)
+    return out
+
+
+def invert_transform(board, transform):
+    """The board that transform maps onto board, as a new board"""
+    size = len(board)
+    grid = grid_geometry(size)
+    inverse = [0] * (size + 1)
+    for v, label in enumerate(transform.labels):
+        inverse[label] = v
+    out = [[EMPTY] * size for _ in range(size)]
+    for i, r in enumerate(transform.rows):
+        for j, c in enumerate(transform.cols):
+            v = board[i][j]
+            out[r][c] = v if v == EMPTY else grid.symbols[inverse[grid.values[v]] - 1]
+    if transform.transpose:
+        out = [list(col) for col in zip(*out)]
+    return out
+
+
+class SolutionCache:
+    """LRU cache of canonical puzzle -> canonical solution, with an optional
+    on-disk store (a dbm file at path) behind it.
+
+    Unsolvable puzzles are cached too, with an empty solution. hits, misses
+    and hit_rate report how often lookups were answered; skipped counts the
+    boards that were not looked up, having fewer than min_clues clues or
+    taking more than max_steps steps to canonicalise.
+    """
+
+    def __init__(self, maxsize=4096, path=None, max_steps=CANONICAL_STEPS,
+                 min_clues=MIN_CLUES):
+        self.maxsize = maxsize
+        self.path = path
+        self.max_steps = max_steps
+        self.min_clues = min_clues
+        self.entries = OrderedDict()
+        self.store = dbm.open(path, "c") if path else None
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+
+    def canonical(self, board):
+        """canonical_form(board) within max_steps, or None (counted as
+        skipped) when the board is too sparse or runs over it"""
+        clues = sum(1 for row in board for v in row if v != EMPTY)
+        form = None
+        if clues >= self.min_clues:
+            form = canonical_form(board, self.max_steps)
+        if form is None:
+            self.skipped += 1
+        return form
+
+    def get(self, key):
+        """Cached solution string for a canonical key ("" if unsolvable),
+        or None on a miss"""
+        value = self.entries.get(key)
+        if value is not None:
+            self.entries.move_to_end(key)
+        elif self.store is not None and key in self.store:
+            value = self.store[key].decode("ascii")
+            self._remember(key, value)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self._remember(key, value)
+        if self.store is not None:
+            self.store[key] = value
+
+    def _remember(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    @property
+    def hit_rate(self):
+        """Fraction of lookups answered from the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate,
+                "skipped": self.skipped, "entries": len(self.entries)}
+
+    def close(self):
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
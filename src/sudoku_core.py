@@ -0,0 +1,455 @@
+import time
+
+from src.sudoku_bitmask import BitmaskSudokuSolver
+from src.sudoku_board import Board
+from src.sudoku_cache import apply_transform, invert_transform
+from src.sudoku_dlx import DancingLinksSudokuSolver
+from src.sudoku_grid import EMPTY, SYMBOLS, box_size_for
+from src.sudoku_propagation import PropagatingSudokuSolver
+
+DIGITS = SYMBOLS[:9]
+
+# Alternate engines selectable through SudokuCore.solve(board, solver=...);
+# "backtrack" is the set-based search implemented by SudokuCore itself
+SOLVERS = {
+    "backtrack": None,
+    "bitmask": BitmaskSudokuSolver,
+    "dlx": DancingLinksSudokuSolver,
+    "propagate": PropagatingSudokuSolver,
+}
+
+
+def parse_board(value, size=9):
+    """Parse a board into the list-of-lists format used by the solvers.
+
+    Accepts a size²-character string (``.`` or ``0`` for empty cells), a
+    list of size strings, or a list of size lists of cell values. Values
+    above 9 are the letters A-P (case-insensitive), so a 16x16 grid uses
+    1-9 and A-G.
+    """
+    symbols = SYMBOLS[:size]
+    box_size_for(size)
+    if isinstance(value, (bytes, bytearray)):
+        value = value.decode("ascii")
+    if isinstance(value, str):
+        value = value.strip()
+        if len(value) != size * size:
+            raise ValueError(f"Board string must have {size * size} characters")
+        value = [value[i:i + size] for i in range(0, size * size, size)]
+
+    board = []
+    for row in value:
+        board_row = []
+        for cell in row:
+            cell_str = str(cell).strip().upper()
+            if cell_str in ("", "0", EMPTY):
+                board_row.append(EMPTY)
+            elif len(cell_str) == 1 and cell_str in symbols:
+                board_row.append(cell_str)
+            elif cell_str.isdigit() and 0 < int(cell_str) <= size:
+                board_row.append(symbols[int(cell_str) - 1])
+            else:
+                raise ValueError(f"Invalid cell value: {cell}")
+        board.append(board_row)
+
+    if len(board) != size or any(len(row) != size for row in board):
+        raise ValueError(f"Board must be {size}x{size}")
+    return board
+
+
+def board_to_string(board):
+    """Flatten a board into the 81-character line format"""
+    return "".join("".join(row) for row in board)
+
+
+class SudokuCore:
+    """Pure-Python Sudoku solving and validation, with no GUI dependencies.
+
+    size selects the N²×N² grid: 9 (default), 4, 16 or 25. Cells hold the
+    symbols 1-9 followed by A-P, one per value. cache, a
+    sudoku_cache.SolutionCache, answers solve() for any puzzle equivalent to
+    one already solved without searching.
+    """
+
+    def __init__(self, size=9, cache=None):
+        self.size = size
+        self.cache = cache
+        # A sudoku_observer.SolveObserver that every engine reports its search to
+        self.observer = None
+        self.box_size = box_size_for(size)
+        self.symbols = SYMBOLS[:size]
+        self.values = {symbol: value for value, symbol in enumerate(self.symbols, 1)}
+        self.solving = False
+        self.engine = None
+        self.solve_attempts = 0
+        self.backtrack_count = 0
+        # Cells the last "propagate" solve filled by logic and by search
+        self.logic_filled = 0
+        self.search_filled = 0
+        # Pre-compute sets for faster lookups
+        self.rows = [set() for _ in range(size)]
+        self.cols = [set() for _ in range(size)]
+        self.boxes = [set() for _ in range(size)]
+        # Pre-compute box indices
+        n = self.box_size
+        self.box_indices = []
+        for box in range(size):
+            indices = []
+            start_row = (box // n) * n
+            start_col = (box % n) * n
+            for i in range(n):
+                for j in range(n):
+                    indices.append((start_row + i, start_col + j))
+            self.box_indices.append(indices)
+
+    def box_index(self, row, col):
+        """Index of the box containing (row, col)"""
+        return (row // self.box_size) * self.box_size + col // self.box_size
+
+    def initialize_constraints(self, board):
+        """Initialize constraint sets"""
+        self.rows = [set() for _ in range(self.size)]
+        self.cols = [set() for _ in range(self.size)]
+        self.boxes = [set() for _ in range(self.size)]
+        for i in range(self.size):
+            for j in range(self.size):
+                if board[i][j] != ".":
+                    num = self.values.get(board[i][j])
+                    if num is None:
+                        raise ValueError(f"Invalid cell value: {board[i][j]}")
+                    self.rows[i].add(num)
+                    self.cols[j].add(num)
+                    self.boxes[self.box_index(i, j)].add(num)
+
+    def solve(self, board, solver="backtrack"):
+        """Solve board in place and return it (False if it has no solution).
+
+        board is a list of rows or a sudoku_board.Board. solver picks the
+        engine: "backtrack" (default), "bitmask", "dlx" or "propagate". The
+        bitmask engine only handles 9x9 grids; "propagate" is the one to use
+        for 16x16 and 25x25. The engines read and fill a Board's cells
+        directly; the backtrack search and the cache work on the list format,
+        so they convert it.
+        """
+        if solver not in SOLVERS:
+            raise ValueError(f"Unknown solver: {solver}")
+        if isinstance(board, Board):
+            if board.size != self.size:
+                raise ValueError(f"Board must be {self.size}x{self.size}")
+            if solver != "backtrack" and self.cache is None:
+                return self._solve_with(board, solver)
+            solution = self.solve(board.to_list(), solver)
+            if not solution:
+                return solution
+            board.update(solution)
+            return board
+        if self.cache is not None:
+            return self._solve_cached(board, solver)
+        return self._solve_with(board, solver)
+
+    def _solve_with(self, board, solver):
+        observer = self.observer
+        if observer is not None:
+            observer.on_start(board)
+        result = self._search(board, solver)
+        if observer is not None:
+            observer.on_finish(result)
+        return result
+
+    def _search(self, board, solver):
+        if solver != "backtrack":
+            engine = SOLVERS[solver](self.size)
+            return self._run_engine(engine, engine.solve, board)
+
+        if not self.is_valid_board(board):
+            raise ValueError("Invalid Sudoku board")
+
+        self.solving = True
+        self.start_time = time.time()
+        self.initial_empty_cells = sum(row.count('.') for row in board)
+        self.solve_attempts = 0  # Initialize solve attempts counter
+        self.backtrack_count = 0  # Initialize backtrack counter
+        self.logic_filled = 0
+        self.search_filled = 0
+
+        # Initialize constraint sets
+        self.initialize_constraints(board)
+        return self._solve(board)
+
+    def _solve_cached(self, board, solver):
+        """solve() through self.cache, keyed by the board's canonical form"""
+        if not self.is_valid_board(board):
+            raise ValueError("Invalid Sudoku board")
+        form = self.cache.canonical(board)
+        if form is None:
+            # Too sparse or too symmetric to canonicalise cheaply
+            return self._solve_with(board, solver)
+        key, transform = form
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.solve_attempts = 0
+            self.backtrack_count = 0
+            self.logic_filled = 0
+            self.search_filled = 0
+            observer = self.observer
+            if observer is not None:
+                observer.on_start(board)
+            result = False
+            if cached:
+                solution = invert_transform(parse_board(cached, self.size), transform)
+                for row, solved in zip(board, solution):
+                    row[:] = solved
+                result = board
+            if observer is not None:
+                observer.on_finish(result)
+            return result
+
+        result = self._solve_with(board, solver)
+        if result:
+            self.cache.put(key, board_to_string(apply_transform(result, transform)))
+        elif result is False and self.solving:
+            # Only a finished search proves there is no solution
+            self.cache.put(key, "")
+        return result
+
+    def _solve(self, board):
+        if not self.solving:
+            return None
+
+        self._on_progress(board)
+        observer = self.observer
+
+        cell = self.find_most_constrained_cell(board)
+        if not cell:
+            return board
+
+        row, col = cell
+        possible = self.get_possible_values(row, col)
+
+        for num in possible:
+            self.solve_attempts += 1
+            if self.is_safe_to_place(board, row, col, num):
+                board[row][col] = self.symbols[num - 1]
+                self.update_constraints(row, col, num, add=True)
+                self._on_place(row, col, num)
+                if observer is not None:
+                    observer.on_place(row, col, num)
+
+                if self._solve(board):
+                    return board
+
+                self.backtrack_count += 1
+                board[row][col] = "."
+                self.update_constraints(row, col, num, add=False)
+                self._on_remove(row, col)
+                if observer is not None:
+                    observer.on_undo(row, col)
+
+        return False
+
+    def count_solutions(self, board, limit=2, solver="propagate"):
+        """Count solutions of board without modifying it, stopping as soon as
+        limit are found.
+
+        With the default limit of 2 this is a uniqueness check: 0 means no
+        solution, 1 a unique one and 2 several. limit=None counts them all.
+        solver is "propagate" (default) or "dlx".
+        """
+        if solver not in SOLVERS:
+            raise ValueError(f"Unknown solver: {solver}")
+        if not hasattr(SOLVERS[solver], "count_solutions"):
+            raise ValueError(f"Solver {solver} cannot count solutions")
+        if isinstance(board, Board) and board.size != self.size:
+            raise ValueError(f"Board must be {self.size}x{self.size}")
+        engine = SOLVERS[solver](self.size)
+        observer = self.observer
+        if observer is not None:
+            observer.on_start(board)
+        found = self._run_engine(engine, engine.count_solutions, board, limit)
+        if observer is not None:
+            observer.on_finish(found)
+        return found
+
+    def _run_engine(self, engine, method, *args):
+        self.engine = engine
+        engine.observer = self.observer
+        self.solving = True
+        self.start_time = time.time()
+        try:
+            return method(*args)
+        finally:
+            self.solve_attempts = engine.solve_attempts
+            self.backtrack_count = engine.backtrack_count
+            self.logic_filled = getattr(engine, "logic_filled", 0)
+            self.search_filled = getattr(engine, "search_filled", 0)
+            self.engine = None
+
+    def stop_solving(self):
+        """Stop the solving process"""
+        self.solving = False
+        if self.engine:
+            self.engine.solving = False
+
+    def _on_progress(self, board):
+        """Called at every search node; front ends override to report progress"""
+
+    def _on_place(self, row, col, num):
+        """Called after a number is placed during the search"""
+
+    def _on_remove(self, row, col):
+        """Called after a placement is undone during the search"""
+
+    def update_constraints(self, row, col, num, add=True):
+        """Update constraint sets"""
+        if add:
+            self.rows[row].add(num)
+            self.cols[col].add(num)
+            self.boxes[self.box_index(row, col)].add(num)
+        else:
+            self.rows[row].remove(num)
+            self.cols[col].remove(num)
+            self.boxes[self.box_index(row, col)].remove(num)
+
+    def get_possible_values(self, row, col):
+        """Get possible values for a cell using constraint sets"""
+        used = self.rows[row] | self.cols[col] | self.boxes[self.box_index(row, col)]
+        return set(range(1, self.size + 1)) - used
+
+    def find_most_constrained_cell(self, board):
+        """Find empty cell with fewest possible values"""
+        min_possibilities = self.size + 1
+        best_cell = None
+
+        for i in range(self.size):
+            for j in range(self.size):
+                if board[i][j] == ".":
+                    possible = self.get_possible_values(i, j)
+                    if len(possible) < min_possibilities:
+                        min_possibilities = len(possible)
+                        best_cell = (i, j)
+                        if min_possibilities == 1:
+                            return best_cell
+
+        return best_cell
+
+    def is_safe_to_place(self, board, row, col, num):
+        """Quick check if number can be placed"""
+        return (num not in self.rows[row] and
+                num not in self.cols[col] and
+                num not in self.boxes[self.box_index(row, col)])
+
+    def get_possible_numbers(self, board, row, col):
+        box_id = self.box_index(row, col)
+        used = set()
+
+        # Check row and column simultaneously
+        for i in range(self.size):
+            if board[row][i] != ".":
+                used.add(self.values[board[row][i]])
+            if board[i][col] != ".":
+                used.add(self.values[board[i][col]])
+
+        # Check box using pre-computed indices
+        for i, j in self.box_indices[box_id]:
+            if board[i][j] != ".":
+                used.add(self.values[board[i][j]])
+
+        return set(range(1, self.size + 1)) - used
+
+    def find_best_empty(self, board):
+        min_possibilities = self.size + 1
+        best_cell = None
+
+        for i in range(self.size):
+            for j in range(self.size):
+                if board[i][j] == ".":
+                    possible = self.get_possible_numbers(board, i, j)
+                    if len(possible) == 1:  # Found cell with only one possibility
+                        return (i, j)
+                    if len(possible) < min_possibilities:
+                        min_possibilities = len(possible)
+                        best_cell = (i, j)
+
+        return best_cell
+
+    def is_valid(self, board, num, pos):
+        symbol = self.symbols[num - 1]
+        # Check row
+        for x in range(len(board[0])):
+            if board[pos[0]][x] == symbol and pos[1] != x:
+                return False
+
+        # Check column
+        for x in range(len(board)):
+            if board[x][pos[1]] == symbol and pos[0] != x:
+                return False
+
+        # Check box
+        n = self.box_size
+        box_x = pos[1] // n
+        box_y = pos[0] // n
+
+        for i in range(box_y * n, box_y * n + n):
+            for j in range(box_x * n, box_x * n + n):
+                if board[i][j] == symbol and (i,j) != pos:
+                    return False
+
+        return True
+
+    def find_empty(self, board):
+        for i in range(len(board)):
+            for j in range(len(board[0])):
+                if board[i][j] == ".":
+                    return (i, j)
+        return None
+
+    def is_valid_board(self, board):
+        # Check rows
+        for row in board:
+            nums = [x for x in row if x != "."]
+            if len(nums) != len(set(nums)):
+                return False
+
+        # Check columns
+        for col in zip(*board):
+            nums = [x for x in col if x != "."]
+            if len(nums) != len(set(nums)):
+                return False
+
+        # Check boxes
+        n = self.box_size
+        for i in range(0, self.size, n):
+            for j in range(0, self.size, n):
+                box = []
+                for k in range(n):
+                    for l in range(n):
+                        if board[i+k][j+l] != ".":
+                            box.append(board[i+k][j+l])
+                if len(box) != len(set(box)):
+                    return False
+        return True
+
+    def is_valid_solution(self, board):
+        # Check if board is complete and valid
+        expected = sorted(self.symbols)
+        if len(board) != self.size:
+            return False
+
+        for row in board:
+            if sorted([str(x) for x in row]) != expected:
+                return False
+
+        for col in zip(*board):
+            if sorted([str(x) for x in col]) != expected:
+                return False
+
+        n = self.box_size
+        for i in range(0, self.size, n):
+            for j in range(0, self.size, n):
+                box = []
+                for k in range(n):
+                    for l in range(n):
+                        box.append(board[i+k][j+l])
+                if sorted([str(x) for x in box]) != expected:
+                    return False
+        return True
@@ -0,0 +1,209 @@
+"""Regression benchmark for Sudoku solve over tiered puzzle corpora.
+
+Every puzzle is solved once per repeat for wall time, solve attempts (nodes)
+and backtracks, then once more under tracemalloc for peak memory, which would
+otherwise slow the timed runs. Tier totals are compared against a stored
+baseline report and the run fails when any of them grows past the threshold::
+
+    python -m src.sudoku_corpus --save-baseline baseline.json
+    python -m src.sudoku_corpus --baseline baseline.json --report report.json
+
+Exit status is 1 when a regression is found.
+"""
+import argparse
+import json
+import platform
+import sys
+import threading
+import time
+import tracemalloc
+
+from src.sudoku_core import SOLVERS, SudokuCore, parse_board
+
+CORPUS = {
+    "easy": [
+        "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79",
+        "..3.2.6..9..3.5..1..18.64....81.29..7.......8..67.82....26.95..8..2.3..9..5.1.3..",
+        "2...8.3...6..7..84.3.5..2.9...1.54.8.........4.27.6...3.1..7.4.72..4..6...4.1...3",
+        "......9.7...42.18....7.5.261..9.4....5.....4....5.7..992.1.8....34.59...5.7......",
+    ],
+    "hard": [
+        ".......71.2.8........4.3...7...6..5....2..3..9........6...7.....8....4......5....",
+        ".47.8...1............6..7..6....357......5....1..6....28..4.....9.1...4.....2.69.",
+        "4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......",
+        "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4..",
+        "85...24..72......9..4.........1.7..23.5...9...4...........8..7..17..........36.4.",
+        "...8....9.873...4.6..7.......85..97...........43..75.......3....3...145.4....2..1",
+    ],
+    "17-clue": [
+        ".......1.4.........2...........5.4.7..8...3....1.9....3..4..2...5.1........8.6...",
+        ".......1.4.........2...........5.6.4..8...3....1.9....3..4..2...5.1........8.7...",
+        ".......12..36..........7...41..2.......5..3..7.....6..28.....4....3..5...........",
+        ".......12..8.3...........4.12.5..........47...6.......5.7...3.....62.......1.....",
+    ],
+    # Long searches for the backtracking engine; the first board is built so
+    # that digit-order search needs 9 8 7 6 5 4 3 2 1 along the top row
+    "pathological": [
+        "..............3.85..1.2.......5.7.....4...1...9.......5......73..2.1........4...9",
+        ".......12....35......6...7.7.....3.....4..8..1...........12.....8.....4..5....6..",
+    ],
+}
+
+METRICS = ("seconds", "nodes", "backtracks", "peak_kib")
+
+
+def measure(puzzle, solver="backtrack", timeout=None, memory=True):
+    """Solve one puzzle; returns a dict of the solve's metrics.
+
+    solved is None when the timeout stopped the search. peak_kib is None
+    when memory is False.
+    """
+    core = SudokuCore()
+    timer = threading.Timer(timeout, core.stop_solving) if timeout else None
+    if timer:
+        timer.start()
+    start = time.perf_counter()
+    try:
+        result = core.solve(parse_board(puzzle), solver=solver)
+    finally:
+        if timer:
+            timer.cancel()
+    elapsed = time.perf_counter() - start
+    record = {
+        "seconds": elapsed,
+        "nodes": core.solve_attempts,
+        "backtracks": core.backtrack_count,
+        "solved": bool(result) if core.solving else None,
+        "peak_kib": None,
+    }
+    if memory and record["solved"] is not None:
+        tracemalloc.start()
+        try:
+            SudokuCore().solve(parse_board(puzzle), solver=solver)
+            record["peak_kib"] = tracemalloc.get_traced_memory()[1] / 1024
+        finally:
+            tracemalloc.stop()
+    return record
+
+
+def run_corpus(tiers=None, solver="backtrack", repeat=3, timeout=60.0, memory=True):
+    """Measure every puzzle in the chosen tiers (all by default).
+
+    Wall time is the best of repeat runs. Returns the report: per-puzzle
+    records plus per-tier totals (peak memory is the tier's maximum).
+    """
+    tiers = tiers or list(CORPUS)
+    puzzles = []
+    for tier in tiers:
+        if tier not in CORPUS:
+            raise ValueError(f"Unknown tier: {tier}")
+        for puzzle in CORPUS[tier]:
+            record = measure(puzzle, solver, timeout, memory)
+            for _ in range(repeat - 1):
+                if record["solved"] is None:
+                    break
+                seconds = measure(puzzle, solver, timeout, memory=False)["seconds"]
+                record["seconds"] = min(record["seconds"], seconds)
+            puzzles.append({"tier": tier, "puzzle": puzzle, **record})
+
+    totals = {}
+    for tier in tiers:
+        records = [p for p in puzzles if p["tier"] == tier]
+        peaks = [p["peak_kib"] for p in records if p["peak_kib"] is not None]
+        totals[tier] = {
+            "puzzles": len(records),
+            "timed_out": sum(p["solved"] is None for p in records),
+            "seconds": sum(p["seconds"] for p in records),
+            "nodes": sum(p["nodes"] for p in records),
+            "backtracks": sum(p["backtracks"] for p in records),
+            "peak_kib": max(peaks) if peaks else None,
+        }
+    return {
+        "solver": solver,
+        "python": platform.python_version(),
+        "puzzles": puzzles,
+        "tiers": totals,
+    }
+
+
+def compare(report, baseline, threshold=0.25, min_seconds=0.01):
+    """Regressions of report against baseline, as readable strings.
+
+    A tier metric regresses when it exceeds the baseline by more than
+    threshold (a fraction); wall-time differences under min_seconds are
+    treated as noise. Tiers missing from either report are skipped.
+    """
+    regressions = []
+    for tier, current in report["tiers"].items():
+        before = baseline.get("tiers", {}).get(tier)
+        if before is None:
+            continue
+        if current["timed_out"] > before.get("timed_out", 0):
+            regressions.append(f"{tier}: {current['timed_out']} timed out "
+                               f"(baseline {before.get('timed_out', 0)})")
+        for metric in METRICS:
+            new, old = current.get(metric), before.get(metric)
+            if new is None or not old:
+                continue
+            if metric == "seconds" and new - old < min_seconds:
+                continue
+            if new > old * (1 + threshold):
+                regressions.append(f"{tier}: {metric} {new:.4g} vs baseline {old:.4g} "
+                                   f"(+{(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def format_report(report):
+    lines = [f"{'tier':<13} {'puzzles':>7} {'timeout':>7} {'total ms':>10} "
+             f"{'nodes':>9} {'backtracks':>10} {'peak KiB':>9}"]
+    for tier, row in report["tiers"].items():
+        peak = f"{row['peak_kib']:9.0f}" if row["peak_kib"] is not None else f"{'-':>9}"
+        lines.append(f"{tier:<13} {row['puzzles']:>7} {row['timed_out']:>7} "
+                     f"{row['seconds'] * 1000:10.1f} {row['nodes']:>9} "
+                     f"{row['backtracks']:>10} {peak}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark Sudoku solve over tiered corpora and check for regressions")
+    parser.add_argument("--tiers", nargs="+", choices=list(CORPUS), default=list(CORPUS))
+    parser.add_argument("--solver", choices=sorted(SOLVERS), default="backtrack")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timed runs per puzzle (the best is kept)")
+    parser.add_argument("--timeout", type=float, default=60.0,
+                        help="seconds before a solve is abandoned")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the tracemalloc run for peak memory")
+    parser.add_argument("--report", help="write the JSON report here")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--save-baseline", metavar="PATH",
+                        help="write this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed growth over the baseline, as a fraction")
+    args = parser.parse_args(argv)
+
+    report = run_corpus(args.tiers, args.solver, args.repeat, args.timeout,
+                        memory=not args.no_memory)
+    print(format_report(report))
+    for path in (args.report, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("solver") != report["solver"]:
+            print(f"warning: baseline was recorded with solver {baseline.get('solver')}",
+                  file=sys.stderr)
+        regressions = compare(report, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+import time
+from functools import lru_cache
+
+from src.sudoku_board import Board, cell_values, fill_cells
+from src.sudoku_grid import grid_geometry
+
+# Exact-cover model of an N²×N² Sudoku: size³ candidate rows (row, col,
+# digit), each covering 4 of 4·size² constraint columns. For 9x9:
+#   1-81    cell (r, c) is filled
+#   82-162  row r holds digit d
+#   163-243 column c holds digit d
+#   244-324 box b holds digit d
+# Header 0 is the root of the circular header list.
+ROOT = 0
+
+
+def _row_columns(r, c, d, size=9, box=3):
+    b = (r // box) * box + c // box
+    area = size * size
+    return (1 + r * size + c,
+            1 + area + r * size + d,
+            1 + 2 * area + c * size + d,
+            1 + 3 * area + b * size + d)
+
+
+@lru_cache(maxsize=None)
+def _build_template(size=9):
+    """Build the full dancing-links matrix for a grid size once, as flat lists"""
+    box = grid_geometry(size).box_size
+    num_columns = 4 * size * size
+    first_node = num_columns + 1
+    nodes = first_node + size ** 3 * 4
+    left = [0] * nodes
+    right = [0] * nodes
+    up = list(range(nodes))
+    down = list(range(nodes))
+    column = list(range(nodes))
+    count = [0] * first_node
+
+    # Circular header list: root <-> 1 <-> ... <-> num_columns <-> root
+    for h in range(first_node):
+        left[h] = h - 1 if h else num_columns
+        right[h] = h + 1 if h < num_columns else ROOT
+
+    node = first_node
+    for r in range(size):
+        for c in range(size):
+            for d in range(size):
+                first = node
+                for k, h in enumerate(_row_columns(r, c, d, size, box)):
+                    column[node] = h
+                    up[node] = up[h]
+                    down[node] = h
+                    down[up[h]] = node
+                    up[h] = node
+                    count[h] += 1
+                    left[node] = first + (k - 1) % 4
+                    right[node] = first + (k + 1) % 4
+                    node += 1
+    return left, right, up, down, column, count
+
+
+def node_cell(node, size=9):
+    """(row, col, digit) of the candidate row a matrix node belongs to"""
+    row_id = (node - 4 * size * size - 1) // 4
+    return row_id // (size * size), (row_id // size) % size, row_id % size + 1
+
+
+class DancingLinksSudokuSolver:
+    """Sudoku as exact cover, solved with Knuth's Algorithm X on dancing links.
+
+    Besides the Sudoku.solve-style solve(), it can enumerate
+    (iter_solutions) or count (count_solutions) every solution of a board.
+    size selects the N²×N² grid (9x9 by default).
+    """
+
+    def __init__(self, size=9):
+        self.grid = grid_geometry(size)
+        self.solving = False
+        self.observer = None
+        self.solve_attempts = 0
+        self.backtrack_count = 0
+        self.chosen = []
+
+    def load(self, board):
+        """Copy the template matrix and cover the clues of a board"""
+        grid = self.grid
+        size = grid.size
+        values = cell_values(board, size)
+
+        left, right, up, down, column, count = _build_template(size)
+        self.left, self.right = left[:], right[:]
+        self.up, self.down = up[:], down[:]
+        self.column, self.count = column, count[:]
+        self.chosen = []
+        self.solve_attempts = 0
+        self.backtrack_count = 0
+
+        for idx, value in enumerate(values):
+            if value:
+                r, c = divmod(idx, size)
+                columns = _row_columns(r, c, value - 1, size, grid.box_size)
+                # A clue whose constraint is already satisfied clashes
+                # with an earlier clue in the same row, column or box
+                for h in columns:
+                    if self.left[self.right[h]] != h:
+                        raise ValueError("Invalid Sudoku board")
+                for h in columns:
+                    self._cover(h)
+
+    def _cover(self, c):
+        left, right, up, down, column, count = (
+            self.left, self.right, self.up, self.down, self.column, self.count)
+        right[left[c]] = right[c]
+        left[right[c]] = left[c]
+        i = down[c]
+        while i != c:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                count[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def _uncover(self, c):
+        left, right, up, down, column, count = (
+            self.left, self.right, self.up, self.down, self.column, self.count)
+        i = up[c]
+        while i != c:
+            j = left[i]
+            while j != i:
+                count[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[c]] = c
+        left[right[c]] = c
+
+    def _search(self):
+        """Yield once for every exact cover reachable from the current state"""
+        if not self.solving:
+            return
+        right, count = self.right, self.count
+        if right[ROOT] == ROOT:
+            yield
+            return
+
+        # Column with the fewest remaining candidates
+        best = c = right[ROOT]
+        fewest = count[c]
+        while c != ROOT and fewest > 1:
+            if count[c] < fewest:
+                best, fewest = c, count[c]
+            c = right[c]
+        if fewest == 0:
+            return
+
+        observer = self.observer
+        self._cover(best)
+        r = self.down[best]
+        while r != best:
+            self.solve_attempts += 1
+            self.chosen.append(r)
+            if observer is not None:
+                observer.on_place(*node_cell(r, self.grid.size))
+            j = right[r]
+            while j != r:
+                self._cover(self.column[j])
+                j = right[j]
+
+            yield from self._search()
+
+            j = self.left[r]
+            while j != r:
+                self._uncover(self.column[j])
+                j = self.left[j]
+            self.chosen.pop()
+            if observer is not None:
+                observer.on_undo(*node_cell(r, self.grid.size)[:2])
+            self.backtrack_count += 1
+            r = self.down[r]
+        self._uncover(best)
+
+    def _fill(self, board):
+        size = self.grid.size
+        filled = []
+        for node in self.chosen:
+            r, c, d = node_cell(node, size)
+            filled.append((r * size + c, d))
+        return fill_cells(board, filled)
+
+    def solve(self, board):
+        self.load(board)
+        self.solving = True
+        self.start_time = time.time()
+        for _ in self._search():
+            return self._fill(board)
+        return None if not self.solving else False
+
+    def iter_solutions(self, board):
+        """Yield every solution of board as a new board of the same kind
+        (a list of lists or a Board)"""
+        self.load(board)
+        self.solving = True
+        for _ in self._search():
+            yield self._fill(board.copy() if isinstance(board, Board) else
+                             [row[:] for row in board])
+
+    def count_solutions(self, board, limit=None):
+        """Count solutions of board, stopping early once limit is reached"""
+        found = 0
+        self.load(board)
+        self.solving = True
+        for _ in self._search():
+            found += 1
+            if limit is not None and found >= limit:
+                break
+        return found
@@ -0,0 +1,210 @@
+"""Sudoku puzzle generation with guaranteed unique solutions.
+
+A random solved grid is built first, then clues are dug out one symmetry
+orbit at a time, keeping a removal only if the puzzle still has exactly one
+solution. Puzzles are written in the line format read by sudoku_batch::
+
+    python -m src.sudoku_generator -n 1000 --symmetry rotational > puzzles.txt
+"""
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import argparse
+import os
+import random
+import sys
+
+from src.sudoku_grid import EMPTY, grid_geometry
+from src.sudoku_propagation import PropagatingSudokuSolver
+
+
+def _orbit_none(r, c, size):
+    return {(r, c)}
+
+
+def _orbit_rotational(r, c, size):
+    """180° rotation"""
+    return {(r, c), (size - 1 - r, size - 1 - c)}
+
+
+def _orbit_horizontal(r, c, size):
+    """Mirror across the horizontal midline"""
+    return {(r, c), (size - 1 - r, c)}
+
+
+def _orbit_vertical(r, c, size):
+    """Mirror across the vertical midline"""
+    return {(r, c), (r, size - 1 - c)}
+
+
+def _orbit_diagonal(r, c, size):
+    """Mirror across the main diagonal"""
+    return {(r, c), (c, r)}
+
+
+def _orbit_dihedral(r, c, size):
+    """All rotations and reflections of the square"""
+    m = size - 1
+    return {(r, c), (c, m - r), (m - r, m - c), (m - c, r),
+            (c, r), (m - r, c), (m - c, m - r), (r, m - c)}
+
+
+# Cells that must be dug together to keep the clue pattern symmetric
+SYMMETRIES = {
+    "none": _orbit_none,
+    "rotational": _orbit_rotational,
+    "horizontal": _orbit_horizontal,
+    "vertical": _orbit_vertical,
+    "diagonal": _orbit_diagonal,
+    "dihedral": _orbit_dihedral,
+}
+
+
+def solved_grid(size=9, rng=None):
+    """A random complete grid.
+
+    The diagonal boxes share no row, column or box, so they are filled with
+    independent random permutations; the solver completes the rest (4x4
+    fillings can be dead ends, so those are redrawn) and the symbols are
+    then shuffled so every value is equally likely anywhere.
+    """
+    rng = rng or random.Random()
+    grid = grid_geometry(size)
+    n = grid.box_size
+    solver = PropagatingSudokuSolver(size)
+    while True:
+        board = [[EMPTY] * size for _ in range(size)]
+        for box in range(n):
+            symbols = rng.sample(grid.symbols, size)
+            for k, symbol in enumerate(symbols):
+                board[box * n + k // n][box * n + k % n] = symbol
+        if solver.solve(board):
+            break
+
+    relabel = dict(zip(grid.symbols, rng.sample(grid.symbols, size)))
+    return [[relabel[symbol] for symbol in row] for row in board]
+
+
+def _orbits(size, symmetry, rng):
+    """Symmetry orbits of the grid cells, in random order"""
+    if symmetry not in SYMMETRIES:
+        raise ValueError(f"Unknown symmetry: {symmetry}")
+    orbit_of = SYMMETRIES[symmetry]
+    seen = set()
+    orbits = []
+    for r in range(size):
+        for c in range(size):
+            if (r, c) not in seen:
+                orbit = orbit_of(r, c, size)
+                seen |= orbit
+                orbits.append(sorted(orbit))
+    rng.shuffle(orbits)
+    return orbits
+
+
+def _is_naked_single(flat, idx, grid):
+    """Whether the clues among a cell's peers leave it a single value"""
+    seen = {flat[peer] for peer in grid.peers[idx]}
+    seen.discard(EMPTY)
+    return len(seen) == grid.size - 1
+
+
+def dig(solution, symmetry="none", min_clues=0, rng=None):
+    """Remove clues from a solved grid while its solution stays unique.
+
+    Every symmetry orbit is tried once, in random order: digging more clues
+    only ever adds solutions, so an orbit that cannot be removed now can
+    never be removed later. Orbits whose removal would take the puzzle
+    below min_clues are skipped, and smaller orbits after them are still
+    tried.
+    Returns the puzzle as a new board; solution is left untouched.
+    """
+    rng = rng or random.Random()
+    size = len(solution)
+    grid = grid_geometry(size)
+    solver = PropagatingSudokuSolver(size)
+    puzzle = [row[:] for row in solution]
+    flat = [symbol for row in puzzle for symbol in row]
+    clues = size * size
+
+    for orbit in _orbits(size, symmetry, rng):
+        if clues - len(orbit) < min_clues:
+            continue
+        for r, c in orbit:
+            puzzle[r][c] = flat[r * size + c] = EMPTY
+        if all(_is_naked_single(flat, r * size + c, grid) for r, c in orbit):
+            # Every dug cell is still forced by the clues around it
+            unique = True
+        elif len(orbit) <= 2:
+            # Unique unless some solution differs from the known one in a dug
+            # cell: one search per cell with its value excluded beats a count
+            unique = not any(solver.count_solutions(puzzle, 1, {(r, c): solution[r][c]})
+                             for r, c in orbit)
+        else:
+            # For larger orbits a single count to two is cheaper
+            unique = solver.count_solutions(puzzle, 2) == 1
+        if unique:
+            clues -= len(orbit)
+        else:
+            for r, c in orbit:
+                puzzle[r][c] = flat[r * size + c] = solution[r][c]
+    return puzzle
+
+
+def generate(size=9, symmetry="none", min_clues=0, rng=None):
+    """A new puzzle with a unique solution, as (puzzle, solution) boards"""
+    rng = rng or random.Random()
+    solution = solved_grid(size, rng)
+    return dig(solution, symmetry, min_clues, rng), solution
+
+
+def _generate_seeded(puzzle_seed, size, symmetry, min_clues):
+    return generate(size, symmetry, min_clues, random.Random(puzzle_seed))
+
+
+def generate_puzzles(count, size=9, symmetry="none", min_clues=0, seed=None, workers=1):
+    """Yield count (puzzle, solution) pairs.
+
+    Every puzzle gets its own seed drawn from seed, so a seeded run yields
+    the same puzzles whatever the number of worker processes.
+    """
+    if symmetry not in SYMMETRIES:
+        raise ValueError(f"Unknown symmetry: {symmetry}")
+    rng = random.Random(seed)
+    seeds = (rng.getrandbits(64) for _ in range(count))
+    if workers <= 1:
+        for puzzle_seed in seeds:
+            yield _generate_seeded(puzzle_seed, size, symmetry, min_clues)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_generate_seeded, seeds, repeat(size), repeat(symmetry),
+                            repeat(min_clues), chunksize=16)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generate Sudoku puzzles with a unique solution")
+    parser.add_argument("-n", "--count", type=int, default=1,
+                        help="number of puzzles to generate")
+    parser.add_argument("--size", type=int, default=9)
+    parser.add_argument("--symmetry", choices=sorted(SYMMETRIES), default="none")
+    parser.add_argument("--min-clues", type=int, default=0,
+                        help="stop digging before going below this many clues")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="worker processes (0 for one per CPU)")
+    parser.add_argument("--solutions", action="store_true",
+                        help="append the solution to each puzzle line")
+    args = parser.parse_args(argv)
+
+    workers = args.workers or os.cpu_count() or 1
+    for puzzle, solution in generate_puzzles(args.count, args.size, args.symmetry,
+                                             args.min_clues, args.seed, workers):
+        line = "".join("".join(row) for row in puzzle)
+        if args.solutions:
+            line += " " + "".join("".join(row) for row in solution)
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
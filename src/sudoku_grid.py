@@ -0,0 +1,84 @@
+from functools import lru_cache
+from math import isqrt
+
+EMPTY = "."
+# Cell symbols in value order: digits first, then letters for grids above 9x9
+SYMBOLS = "123456789ABCDEFGHIJKLMNOP"
+
+
+def box_size_for(size):
+    """Box side for an N²×N² grid, raising ValueError for unsupported sizes"""
+    box = isqrt(size) if size > 0 else 0
+    if box < 2 or box * box != size or size > len(SYMBOLS):
+        raise ValueError(f"Unsupported Sudoku size: {size}")
+    return box
+
+
+class GridGeometry:
+    """Cell, unit and peer tables for one grid size, shared by the solvers.
+
+    Cells are numbered row-major from 0 to size² - 1. Units are numbered
+    rows first (0 to size - 1), then columns, then boxes.
+    """
+
+    def __init__(self, size):
+        box = box_size_for(size)
+        self.size = size
+        self.box_size = box
+        self.num_cells = size * size
+        self.symbols = SYMBOLS[:size]
+        self.values = {symbol: value for value, symbol in enumerate(self.symbols, 1)}
+        self.all_mask = (1 << size) - 1
+
+        # Row, column and box of every cell
+        self.cell_units = [(i // size, i % size, (i // size // box) * box + (i % size) // box)
+                           for i in range(self.num_cells)]
+        self.cell_unit_ids = [(r, size + c, 2 * size + b) for r, c, b in self.cell_units]
+
+        self.units = ([[r * size + c for c in range(size)] for r in range(size)] +
+                      [[r * size + c for r in range(size)] for c in range(size)] +
+                      [[] for _ in range(size)])
+        for idx, (_, _, b) in enumerate(self.cell_units):
+            self.units[2 * size + b].append(idx)
+
+        self.peers = [sorted({p for u in self.cell_unit_ids[idx] for p in self.units[u]} - {idx})
+                      for idx in range(self.num_cells)]
+        self.segments = self._build_segments()
+
+    def _build_segments(self):
+        """Box/line segments for locked candidate (pointing and claiming)
+        reductions.
+
+        A segment is the n cells a row or column shares with a box. Each
+        entry holds the segment's cells, the ids of the other segments on
+        its line and in its box, and the cells of the rest of the line and
+        the rest of the box. Segment masks can then be computed once per
+        pass and combined, instead of rescanning whole lines and boxes.
+        """
+        n, size = self.box_size, self.size
+        segments = []
+        for orientation in (0, 1):
+            for line in range(size):
+                cells = self.units[orientation * size + line]
+                band = line - line % n
+                for part in range(n):
+                    segment = cells[part * n:(part + 1) * n]
+                    box = self.cell_units[segment[0]][2]
+                    line_others = [(orientation * size + line) * n + k
+                                   for k in range(n) if k != part]
+                    box_others = [(orientation * size + other) * n + part
+                                  for other in range(band, band + n) if other != line]
+                    segments.append((
+                        segment,
+                        line_others,
+                        box_others,
+                        [idx for idx in cells if idx not in segment],
+                        [idx for idx in self.units[2 * size + box] if idx not in segment],
+                    ))
+        return segments
+
+
+@lru_cache(maxsize=None)
+def grid_geometry(size):
+    """Shared GridGeometry for a grid size"""
+    return GridGeometry(size)
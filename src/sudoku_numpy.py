@@ -0,0 +1,136 @@
+"""Vectorised Sudoku candidates for stacks of boards.
+
+Boards are integer arrays shaped (N, size, size) with 0 for empty cells and
+1..size for values; to_array converts from the list and line formats. The
+candidate tensor is the batched counterpart of
+SudokuCore.get_possible_numbers: candidates(boards)[k, r, c, v - 1] is True
+when value v can go in cell (r, c) of board k.
+
+Internally every value is a bit, so each row, column and box reduces to one
+OR-ed mask and a cell's free values are the complement of its three masks
+broadcast together; the boolean tensor is unpacked from those masks.
+"""
+import numpy as np
+
+from src.sudoku_grid import EMPTY, box_size_for, grid_geometry
+
+
+def to_array(boards, size=9):
+    """Stack boards (lists of rows or line-format strings) into an int8 array"""
+    values = grid_geometry(size).values
+    out = np.zeros((len(boards), size, size), dtype=np.int8)
+    for k, board in enumerate(boards):
+        cells = board if isinstance(board, str) else [v for row in board for v in row]
+        if len(cells) != size * size:
+            raise ValueError(f"Board must have {size * size} cells")
+        out[k].flat = [0 if v in (EMPTY, "0") else values[v] for v in cells]
+    return out
+
+
+def _as_boards(boards):
+    boards = np.asarray(boards)
+    if boards.ndim == 2:
+        boards = boards[None]
+    if boards.ndim != 3 or boards.shape[1] != boards.shape[2]:
+        raise ValueError("Boards must be shaped (N, size, size)")
+    box_size_for(boards.shape[1])
+    return boards
+
+
+def _unit_masks(bits):
+    """OR of the value bits over each row (N, size), column (N, size) and
+    box (N, n, n)"""
+    count, size = bits.shape[:2]
+    n = box_size_for(size)
+    rows = np.bitwise_or.reduce(bits, axis=2)
+    cols = np.bitwise_or.reduce(bits, axis=1)
+    boxes = np.bitwise_or.reduce(bits.reshape(count, n, n, n, n), axis=(2, 4))
+    return rows, cols, boxes
+
+
+def _bits(boards):
+    """Value bits (N, size, size): 1 << (v - 1) for value v, 0 when empty"""
+    shifted = np.left_shift(1, boards.astype(np.int32) - 1, dtype=np.int32)
+    return np.where(boards > 0, shifted, 0)
+
+
+def _free(boards, bits):
+    """Bitmask of candidate values per cell (N, size, size)"""
+    count, size = boards.shape[:2]
+    n = box_size_for(size)
+    rows, cols, boxes = _unit_masks(bits)
+    used = rows[:, :, None] | cols[:, None, :]
+    used = used.reshape(count, n, n, n, n) | boxes[:, :, None, :, None]
+    free = ~used.reshape(count, size, size) & ((1 << size) - 1)
+    return np.where(boards == 0, free, 0)
+
+
+def candidates(boards):
+    """Boolean candidate tensor (N, size, size, size) for boards (N, size, size).
+
+    A value is a candidate for an empty cell when it is absent from the
+    cell's row, column and box; filled cells have no candidates.
+    """
+    boards = _as_boards(boards)
+    size = boards.shape[1]
+    free = _free(boards, _bits(boards))
+    return (free[..., None] >> np.arange(size, dtype=np.int32)) & 1 == 1
+
+
+def candidate_counts(boards):
+    """Number of candidates per cell, shaped (N, size, size)"""
+    return candidates(boards).sum(axis=-1, dtype=np.int16)
+
+
+def _consistent(boards, bits, free):
+    """Per-board flags: no value repeated in a unit, no empty cell without
+    candidates. Distinct bits add up to their OR, repeated ones do not."""
+    count, size = boards.shape[:2]
+    n = box_size_for(size)
+    wide = bits.astype(np.int64)
+    rows, cols, boxes = _unit_masks(bits)
+    repeated = ((wide.sum(axis=2) != rows).any(axis=1)
+                | (wide.sum(axis=1) != cols).any(axis=1)
+                | (wide.reshape(count, n, n, n, n).sum(axis=(2, 4)) != boxes).any(axis=(1, 2)))
+    stuck = ((boards == 0) & (free == 0)).any(axis=(1, 2))
+    return ~(repeated | stuck)
+
+
+def consistent(boards):
+    """Per-board flags (N,): no repeated value in a unit and no empty cell
+    left without candidates"""
+    boards = _as_boards(boards)
+    bits = _bits(boards)
+    return _consistent(boards, bits, _free(boards, bits))
+
+
+def eliminate_naked_singles(boards, max_rounds=None):
+    """Fill naked singles in every board until none are left.
+
+    Each round fills every cell that has exactly one candidate, on all the
+    boards still changing at once. Returns (filled, ok): filled is a new
+    array and ok flags the boards that are still consistent; a board stops
+    changing as soon as it is found inconsistent (two singles clashing in a
+    unit, or a cell left without candidates).
+    """
+    boards = _as_boards(boards).copy()
+    ok = np.ones(len(boards), dtype=bool)
+    active = np.arange(len(boards))
+    rounds = 0
+    while len(active):
+        part = boards[active]
+        bits = _bits(part)
+        free = _free(part, bits)
+        good = _consistent(part, bits, free)
+        ok[active[~good]] = False
+        if max_rounds is not None and rounds == max_rounds:
+            break
+        singles = (free != 0) & (free & (free - 1) == 0) & good[:, None, None]
+        changed = singles.any(axis=(1, 2))
+        if not changed.any():
+            break
+        values = np.log2(np.where(singles, free, 1)).astype(part.dtype) + 1
+        boards[active] = np.where(singles, values, part)
+        active = active[changed]
+        rounds += 1
+    return boards, ok
@@ -0,0 +1,148 @@
+"""Search observers for Sudoku solving.
+
+Set SudokuCore.observer (or Sudoku's) to a SolveObserver and every engine
+reports its search to it:
+
+- on_start(board) and on_finish(result) around each solve or count
+- on_place(row, col, value) when the search tries a value in a cell
+- on_undo(row, col) when that try is taken back, along with everything
+  propagated since
+- on_propagate(row, col, value) when the propagate engine fills a cell by
+  logic rather than by search
+
+Engines only test ``observer is not None`` at each step, so leaving the
+observer unset costs next to nothing.
+"""
+from collections import namedtuple
+import struct
+
+START, PLACE, UNDO, PROPAGATE, FINISH = range(5)
+EVENT_NAMES = ("start", "place", "undo", "propagate", "finish")
+
+TRACE_MAGIC = b"SDKT\x01"
+# One record per event: kind, row, col, value
+RECORD = struct.Struct("<BBBB")
+
+TraceEvent = namedtuple("TraceEvent", "kind row col value")
+
+
+class SolveObserver:
+    """Base observer; every hook does nothing, so subclasses override only
+    the events they care about"""
+
+    def on_start(self, board):
+        pass
+
+    def on_place(self, row, col, value):
+        pass
+
+    def on_undo(self, row, col):
+        pass
+
+    def on_propagate(self, row, col, value):
+        pass
+
+    def on_finish(self, result):
+        pass
+
+
+class CountingObserver(SolveObserver):
+    """Event counts accumulated over every solve it watches.
+
+    Unlike solve_attempts and backtrack_count on the solver, the counts are
+    not reset between calls; reset() starts over.
+    """
+
+    __slots__ = ("solves", "places", "undos", "propagations", "depth", "max_depth")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.solves = 0
+        self.places = 0
+        self.undos = 0
+        self.propagations = 0
+        self.depth = 0
+        self.max_depth = 0
+
+    def on_start(self, board):
+        self.solves += 1
+        self.depth = 0
+
+    def on_place(self, row, col, value):
+        self.places += 1
+        self.depth += 1
+        if self.depth > self.max_depth:
+            self.max_depth = self.depth
+
+    def on_undo(self, row, col):
+        self.undos += 1
+        self.depth -= 1
+
+    def on_propagate(self, row, col, value):
+        self.propagations += 1
+
+
+class TraceWriter(SolveObserver):
+    """Write the search as a compact binary trace.
+
+    The file starts with TRACE_MAGIC, followed by one 4-byte RECORD per
+    event: kind (START..FINISH), row, col and value. START carries the
+    board size in value and FINISH the outcome (1 solved or solutions
+    found, 0 none, 2 stopped). Records are buffered and written in blocks;
+    use it as a context manager or call close().
+    """
+
+    def __init__(self, path, buffer_size=1 << 16):
+        self.file = open(path, "wb")
+        self.file.write(TRACE_MAGIC)
+        self.buffer = bytearray()
+        self.buffer_size = buffer_size
+
+    def _record(self, kind, row, col, value):
+        self.buffer += RECORD.pack(kind, row, col, value)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def on_start(self, board):
+        self._record(START, 0, 0, len(board))
+
+    def on_place(self, row, col, value):
+        self._record(PLACE, row, col, value)
+
+    def on_undo(self, row, col):
+        self._record(UNDO, row, col, 0)
+
+    def on_propagate(self, row, col, value):
+        self._record(PROPAGATE, row, col, value)
+
+    def on_finish(self, result):
+        self._record(FINISH, 0, 0, 2 if result is None else 1 if result else 0)
+
+    def flush(self):
+        self.file.write(self.buffer)
+        self.buffer.clear()
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_trace(path):
+    """Yield the TraceEvents of a trace written by TraceWriter"""
+    with open(path, "rb") as f:
+        if f.read(len(TRACE_MAGIC)) != TRACE_MAGIC:
+            raise ValueError("Not a Sudoku trace file")
+        data = f.read()
+    if len(data) % RECORD.size:
+        raise ValueError("Truncated Sudoku trace file")
+    for record in RECORD.iter_unpack(data):
+        yield TraceEvent(*record)
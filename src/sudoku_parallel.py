@@ -0,0 +1,189 @@
+"""Parallel search for a single hard Sudoku puzzle.
+
+The top levels of the search tree are expanded the way SudokuCore._solve
+walks them (most constrained cell first, values in the same order) until
+there are a few subtrees per worker; the subtrees then go to a process pool.
+A shared event stops every worker as soon as one of them finds a solution.
+Counting runs every subtree to the end and adds the counts up, since the
+subtrees split the solutions between them::
+
+    python -m src.sudoku_parallel PUZZLE --workers 1 2 4 8 16
+
+measures the speedup of each worker count over a single process.
+"""
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import argparse
+import multiprocessing
+import os
+import sys
+import threading
+import time
+
+from src.sudoku_core import SOLVERS, SudokuCore, parse_board, board_to_string
+
+# Subtrees per worker: enough for the pool to even out uneven subtrees
+SPLIT_FACTOR = 8
+
+_stop = None  # the shared stop event, set in each worker by _init_worker
+
+
+def split(board, parts, size=9):
+    """Expand the search tree under board breadth-first until it has at
+    least parts leaves (or cannot be expanded further).
+
+    Returns the subproblems as new boards, in the order the sequential
+    search would visit them. Dead branches are dropped; a solved board is
+    its own single subproblem.
+    """
+    core = SudokuCore(size)
+    if not core.is_valid_board(board):
+        raise ValueError("Invalid Sudoku board")
+    frontier = [[row[:] for row in board]]
+    while len(frontier) < parts:
+        expanded, next_frontier = False, []
+        for sub in frontier:
+            core.initialize_constraints(sub)
+            cell = core.find_most_constrained_cell(sub)
+            if cell is None:
+                next_frontier.append(sub)
+                continue
+            expanded = True
+            row, col = cell
+            for num in core.get_possible_values(row, col):
+                child = [r[:] for r in sub]
+                child[row][col] = core.symbols[num - 1]
+                next_frontier.append(child)
+        frontier = next_frontier
+        if not expanded:
+            break
+    return frontier
+
+
+def _init_worker(stop):
+    global _stop
+    _stop = stop
+
+
+def _run_subtree(board, size, solver, count):
+    """Solve (or count) one subtree, giving up once the stop event is set.
+
+    Returns (solution string, count); the solution is None when there is
+    none or the search was stopped, the count None unless counting.
+    """
+    if _stop.is_set():
+        return None, 0
+    core = SudokuCore(size)
+    finished = threading.Event()
+
+    def watch():
+        while not finished.is_set():
+            if _stop.wait(0.01):
+                core.stop_solving()
+                return
+
+    watcher = threading.Thread(target=watch, daemon=True)
+    watcher.start()
+    try:
+        if count:
+            found = core.count_solutions(board, limit=None, solver=solver)
+            return None, found
+        solution = core.solve(board, solver=solver)
+        return board_to_string(solution) if solution else None, None
+    finally:
+        finished.set()
+        watcher.join()
+
+
+def _run(board, size, workers, solver, count, parts):
+    workers = workers or os.cpu_count() or 1
+    subtrees = split(board, parts or workers * SPLIT_FACTOR, size)
+    stop = multiprocessing.Event()
+    total, solution = 0, None
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(stop,)) as pool:
+        pending = {pool.submit(_run_subtree, sub, size, solver, count) for sub in subtrees}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.cancelled():
+                    continue
+                found, found_count = future.result()
+                if count:
+                    total += found_count
+                elif found and solution is None:
+                    solution = found
+                    stop.set()
+                    for other in pending:
+                        other.cancel()
+    return total if count else solution
+
+
+def solve_parallel(board, workers=None, solver="backtrack", size=9, parts=None):
+    """Solve board in place across worker processes and return it (False if
+    it has no solution).
+
+    workers defaults to one per CPU and parts, the number of subtrees, to
+    SPLIT_FACTOR per worker. Every worker stops as soon as one finds a
+    solution.
+    """
+    if solver not in SOLVERS:
+        raise ValueError(f"Unknown solver: {solver}")
+    solution = _run(board, size, workers, solver, False, parts)
+    if solution is None:
+        return False
+    for row, solved in zip(board, parse_board(solution, size)):
+        row[:] = solved
+    return board
+
+
+def count_parallel(board, workers=None, solver="propagate", size=9, parts=None):
+    """Count every solution of board across worker processes"""
+    if not hasattr(SOLVERS.get(solver), "count_solutions"):
+        raise ValueError(f"Solver {solver} cannot count solutions")
+    return _run(board, size, workers, solver, True, parts)
+
+
+def measure_speedup(board, worker_counts=(1, 2, 4, 8, 16), solver="backtrack", size=9):
+    """Wall time of solve_parallel for each worker count, plus the
+    sequential solve for reference.
+
+    Returns rows of (workers, seconds, speedup over the sequential solve);
+    workers 0 stands for the plain sequential SudokuCore.solve.
+    """
+    start = time.perf_counter()
+    SudokuCore(size).solve([row[:] for row in board], solver=solver)
+    sequential = time.perf_counter() - start
+    rows = [(0, sequential, 1.0)]
+    for workers in worker_counts:
+        start = time.perf_counter()
+        solve_parallel([row[:] for row in board], workers, solver, size)
+        elapsed = time.perf_counter() - start
+        rows.append((workers, elapsed, sequential / elapsed))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Solve one hard Sudoku puzzle across worker processes")
+    parser.add_argument("puzzle", help="puzzle in the line format")
+    parser.add_argument("--size", type=int, default=9)
+    parser.add_argument("--solver", choices=sorted(SOLVERS), default="backtrack")
+    parser.add_argument("-w", "--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16],
+                        help="worker counts to time")
+    args = parser.parse_args(argv)
+
+    try:
+        board = parse_board(args.puzzle, args.size)
+        rows = measure_speedup(board, args.workers, args.solver, args.size)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"CPUs available: {os.cpu_count()}")
+    print(f"{'workers':>7} {'seconds':>9} {'speedup':>8}")
+    for workers, seconds, speedup in rows:
+        label = "serial" if workers == 0 else workers
+        print(f"{label:>7} {seconds:9.3f} {speedup:8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
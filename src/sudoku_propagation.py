@@ -0,0 +1,279 @@
+import time
+
+from src.sudoku_board import cell_values, fill_cells
+from src.sudoku_grid import grid_geometry
+
+LOGIC = 1
+SEARCH = 2
+
+
+class PropagatingSudokuSolver:
+    """Sudoku solver that runs constraint propagation before every branch.
+
+    Before each branching decision it repeatedly applies naked singles,
+    hidden singles and box/line reductions (pointing pairs and claiming)
+    until nothing changes. Every change goes on a trail so backtracking
+    restores the exact state. After a solve, logic_filled and search_filled
+    report how the initially empty cells were filled.
+
+    Works on any N²×N² grid (9x9 by default, also 4x4, 16x16 and 25x25);
+    values above 9 use the letters of sudoku_grid.SYMBOLS.
+    """
+
+    def __init__(self, size=9):
+        self.grid = grid_geometry(size)
+        self.solving = False
+        self.observer = None
+        self.solve_attempts = 0
+        self.backtrack_count = 0
+        self.logic_filled = 0
+        self.search_filled = 0
+        self.trail = []
+        self.singles = []
+        self.found = 0
+        self.limit = 1
+
+    def load(self, board):
+        """Load a board into candidate masks, raising ValueError if invalid"""
+        grid = self.grid
+        size = grid.size
+        values = cell_values(board, size)
+
+        cells = self.cells = [0] * grid.num_cells
+        placed = self.placed = [0] * (3 * size)
+        self.filled_by = [0] * grid.num_cells
+        self.trail = []
+
+        for idx, (r, c, b) in enumerate(grid.cell_unit_ids):
+            value = values[idx]
+            if not value:
+                continue
+            bit = 1 << (value - 1)
+            if (placed[r] | placed[c] | placed[b]) & bit:
+                raise ValueError("Invalid Sudoku board")
+            placed[r] |= bit
+            placed[c] |= bit
+            placed[b] |= bit
+            cells[idx] = value
+
+        cand = self.cand = [0 if cells[idx] else
+                            grid.all_mask & ~(placed[r] | placed[c] | placed[b])
+                            for idx, (r, c, b) in enumerate(grid.cell_unit_ids)]
+        # Empty cells whose candidates are down to one, for naked singles
+        self.singles = [idx for idx, mask in enumerate(cand)
+                        if not cells[idx] and not mask & (mask - 1)]
+
+    def _start(self, limit):
+        self.solving = True
+        self.start_time = time.time()
+        self.solve_attempts = 0
+        self.backtrack_count = 0
+        self.logic_filled = 0
+        self.search_filled = 0
+        self.found = 0
+        self.limit = limit
+
+    def solve(self, board):
+        self.load(board)
+        self._start(1)
+
+        empties = [idx for idx, value in enumerate(self.cells) if not value]
+        result = self._solve()
+        if not result:
+            return result
+
+        cells = self.cells
+        fill_cells(board, ((idx, cells[idx]) for idx in empties))
+        self.logic_filled = self.filled_by.count(LOGIC)
+        self.search_filled = self.filled_by.count(SEARCH)
+        return board
+
+    def count_solutions(self, board, limit=2, exclude=None):
+        """Count solutions of board, stopping as soon as limit are found.
+
+        The default limit of 2 is a uniqueness check: 1 means the solution
+        is unique. limit=None counts every solution. exclude maps (row, col)
+        to a symbol that empty cell may not take, which restricts the count
+        to solutions differing from a known one there.
+        """
+        self.load(board)
+        self._start(limit)
+        grid, cand = self.grid, self.cand
+        for (r, c), symbol in (exclude or {}).items():
+            idx = r * grid.size + c
+            mask = cand[idx] & ~(1 << (grid.values[symbol] - 1))
+            if not mask:
+                return 0
+            cand[idx] = mask
+            if not mask & (mask - 1):
+                self.singles.append(idx)
+        self._solve()
+        return self.found
+
+    def _solve(self):
+        if not self.solving:
+            return None
+        if not self._propagate():
+            return False
+
+        # Branch on the empty cell with the fewest candidates
+        cand, cells = self.cand, self.cells
+        best = -1
+        fewest = self.grid.size + 1
+        for idx in range(self.grid.num_cells):
+            if not cells[idx]:
+                count = bin(cand[idx]).count("1")
+                if count < fewest:
+                    best, fewest = idx, count
+                    if count <= 2:
+                        break
+        if best < 0:
+            self.found += 1
+            return self.found == self.limit
+
+        # Try candidates in ascending order, lowest bit first
+        observer = self.observer
+        remaining = cand[best]
+        while remaining:
+            bit = remaining & -remaining
+            remaining ^= bit
+            self.solve_attempts += 1
+            mark = len(self.trail)
+            if observer is not None:
+                observer.on_place(*divmod(best, self.grid.size), bit.bit_length())
+            if self._assign(best, bit, SEARCH) and self._solve():
+                return True
+            self.backtrack_count += 1
+            self._undo(mark)
+            if observer is not None:
+                observer.on_undo(*divmod(best, self.grid.size))
+            # Propagation had emptied the queue before this branch
+            self.singles.clear()
+        return False
+
+    def _set(self, values, idx, value):
+        self.trail.append((values, idx, values[idx]))
+        values[idx] = value
+
+    def _undo(self, mark):
+        trail = self.trail
+        while len(trail) > mark:
+            values, idx, value = trail.pop()
+            values[idx] = value
+
+    def _assign(self, idx, bit, source):
+        """Place a digit and remove it from the peers; False on contradiction"""
+        # Hot path: trail entries are appended inline rather than via _set
+        cand, cells, placed, trail = self.cand, self.cells, self.placed, self.trail
+        trail.append((cells, idx, cells[idx]))
+        cells[idx] = bit.bit_length()
+        trail.append((cand, idx, cand[idx]))
+        cand[idx] = 0
+        self._set(self.filled_by, idx, source)
+        for u in self.grid.cell_unit_ids[idx]:
+            trail.append((placed, u, placed[u]))
+            placed[u] |= bit
+        for peer in self.grid.peers[idx]:
+            mask = cand[peer]
+            if mask & bit:
+                if mask == bit:
+                    return False
+                trail.append((cand, peer, mask))
+                mask ^= bit
+                cand[peer] = mask
+                if not mask & (mask - 1):
+                    self.singles.append(peer)
+        return True
+
+    def _eliminate(self, cells, bits):
+        """Remove bits from the candidates of cells; None on contradiction"""
+        cand = self.cand
+        changed = False
+        for idx in cells:
+            mask = cand[idx]
+            if mask & bits:
+                mask &= ~bits
+                if not mask:
+                    return None
+                self._set(cand, idx, mask)
+                if not mask & (mask - 1):
+                    self.singles.append(idx)
+                changed = True
+        return changed
+
+    def _propagate(self):
+        """Apply logical deductions until none applies; False on contradiction"""
+        cand, cells, placed, singles = self.cand, self.cells, self.placed, self.singles
+        grid = self.grid
+        observer = self.observer
+        while True:
+            progress = False
+
+            # Naked singles: cells queued when their candidates hit one
+            while singles:
+                idx = singles.pop()
+                if not cells[idx]:
+                    if observer is not None:
+                        observer.on_propagate(*divmod(idx, grid.size), cand[idx].bit_length())
+                    if not self._assign(idx, cand[idx], LOGIC):
+                        singles.clear()
+                        return False
+
+            # Hidden singles: a digit with one place left in a unit
+            for u, unit in enumerate(grid.units):
+                once = twice = 0
+                for idx in unit:
+                    mask = cand[idx]
+                    twice |= once & mask
+                    once |= mask
+                if once | placed[u] != grid.all_mask:
+                    singles.clear()
+                    return False
+                hidden = once & ~twice
+                while hidden:
+                    bit = hidden & -hidden
+                    hidden ^= bit
+                    for idx in unit:
+                        if cand[idx] & bit:
+                            if observer is not None:
+                                observer.on_propagate(*divmod(idx, grid.size), bit.bit_length())
+                            if not self._assign(idx, bit, LOGIC):
+                                singles.clear()
+                                return False
+                            progress = True
+                            break
+            if progress:
+                continue
+
+            # Box/line reductions, only once singles have dried up. Segment
+            # masks are computed once per pass; eliminations only shrink
+            # candidates, so masks going stale mid-pass can hide a deduction
+            # but never produce a wrong one.
+            seg_masks = []
+            for segment in grid.segments:
+                mask = 0
+                for idx in segment[0]:
+                    mask |= cand[idx]
+                seg_masks.append(mask)
+            for seg, (_, line_others, box_others, line_rest, box_rest) in zip(
+                    seg_masks, grid.segments):
+                if not seg:
+                    continue
+                line_mask = box_mask = 0
+                for other in line_others:
+                    line_mask |= seg_masks[other]
+                for other in box_others:
+                    box_mask |= seg_masks[other]
+                # Pointing: digit confined to this segment within the box
+                pointing = seg & ~box_mask & line_mask
+                # Claiming: digit confined to this segment within the line
+                claiming = seg & ~line_mask & box_mask
+                for rest, bits in ((line_rest, pointing), (box_rest, claiming)):
+                    if bits:
+                        changed = self._eliminate(rest, bits)
+                        if changed is None:
+                            singles.clear()
+                            return False
+                        progress = progress or changed
+            if not progress:
+                return True
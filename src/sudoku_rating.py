@@ -0,0 +1,338 @@
+"""Sudoku difficulty rating by the hardest human technique needed.
+
+The rater solves a puzzle the way a person would: it always applies the
+cheapest technique that makes progress, starting over from the cheapest
+after every step, and scores the puzzle by the most expensive technique it
+had to use. Scores follow the familiar Sudoku Explainer scale; a puzzle the
+techniques cannot finish needs search and scores SEARCH_SCORE::
+
+    python -m src.sudoku_rating puzzles.txt --sort > by_difficulty.txt
+"""
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import combinations
+import argparse
+import os
+import sys
+
+from src.sudoku_core import SudokuCore, parse_board
+from src.sudoku_grid import grid_geometry
+
+SEARCH_SCORE = 10.0
+
+Rating = namedtuple("Rating", "score hardest techniques solved")
+
+
+@lru_cache(maxsize=None)
+def _popcounts(size):
+    if size > 16:
+        raise ValueError("Rating supports grids up to 16x16")
+    return [bin(mask).count("1") for mask in range(1 << size)]
+
+
+class DifficultyRater:
+    """Rates puzzles with human solving techniques.
+
+    rate(board) returns a Rating: score (the hardest technique's score),
+    hardest (its name), techniques (how often each one was applied) and
+    solved (False when the techniques ran out and search would be needed).
+    Works on 4x4, 9x9 and 16x16 grids.
+    """
+
+    def __init__(self, size=9):
+        self.core = SudokuCore(size)
+        self.grid = grid_geometry(size)
+        self.popcount = _popcounts(size)
+        # (name, score, method) in order of cost
+        self.techniques = (
+            ("hidden single", 1.5, self._hidden_single),
+            ("naked single", 2.3, self._naked_single),
+            ("locked candidates", 2.6, self._locked_candidates),
+            ("naked pair", 3.0, lambda: self._naked_subset(2)),
+            ("x-wing", 3.2, lambda: self._fish(2)),
+            ("hidden pair", 3.4, lambda: self._hidden_subset(2)),
+            ("naked triple", 3.6, lambda: self._naked_subset(3)),
+            ("swordfish", 3.8, lambda: self._fish(3)),
+            ("hidden triple", 4.0, lambda: self._hidden_subset(3)),
+            ("xy-wing", 4.2, self._xy_wing),
+        )
+
+    def rate(self, board):
+        """Rate a board; raises ValueError if it is invalid or proves to
+        have no solution"""
+        if not self.core.is_valid_board(board):
+            raise ValueError("Invalid Sudoku board")
+        self._load(board)
+        used = {}
+        hardest, score = None, 0.0
+        while self.empty:
+            for name, cost, technique in self.techniques:
+                steps = technique()
+                if steps:
+                    used[name] = used.get(name, 0) + steps
+                    if cost > score:
+                        hardest, score = name, cost
+                    break
+            else:
+                return Rating(SEARCH_SCORE, "search", used, False)
+        return Rating(score, hardest, used, True)
+
+    def _load(self, board):
+        grid = self.grid
+        self.cells = [grid.values.get(board[r][c], 0) for r, c, _ in grid.cell_units]
+        self.cand = [0] * grid.num_cells
+        self.empty = 0
+        for idx, (r, c, b) in enumerate(grid.cell_unit_ids):
+            if self.cells[idx]:
+                continue
+            used = 0
+            for peer in grid.peers[idx]:
+                if self.cells[peer]:
+                    used |= 1 << (self.cells[peer] - 1)
+            self.cand[idx] = grid.all_mask & ~used
+            self.empty += 1
+
+    def _place(self, idx, bit):
+        cand = self.cand
+        if not cand[idx] & bit:
+            raise ValueError("Puzzle has no solution")
+        self.cells[idx] = bit.bit_length()
+        cand[idx] = 0
+        self.empty -= 1
+        for peer in self.grid.peers[idx]:
+            cand[peer] &= ~bit
+
+    def _eliminate(self, cells, bits):
+        """Remove bits from cells; returns how many cells changed"""
+        cand, changed = self.cand, 0
+        for idx in cells:
+            if cand[idx] & bits:
+                cand[idx] &= ~bits
+                if not cand[idx]:
+                    raise ValueError("Puzzle has no solution")
+                changed += 1
+        return changed
+
+    # Techniques: each returns the number of placements or eliminations made
+
+    def _hidden_single(self):
+        cand, grid = self.cand, self.grid
+        placed = 0
+        for unit in grid.units:
+            once = twice = 0
+            for idx in unit:
+                mask = cand[idx]
+                twice |= once & mask
+                once |= mask
+            hidden = once & ~twice
+            while hidden:
+                bit = hidden & -hidden
+                hidden ^= bit
+                for idx in unit:
+                    if cand[idx] & bit:
+                        self._place(idx, bit)
+                        placed += 1
+                        break
+                else:
+                    # Its only cell was just taken by another hidden single
+                    raise ValueError("Puzzle has no solution")
+        return placed
+
+    def _naked_single(self):
+        cand, popcount = self.cand, self.popcount
+        placed = 0
+        for idx in range(self.grid.num_cells):
+            mask = cand[idx]
+            if mask and popcount[mask] == 1:
+                self._place(idx, mask)
+                placed += 1
+            elif not mask and not self.cells[idx]:
+                raise ValueError("Puzzle has no solution")
+        return placed
+
+    def _locked_candidates(self):
+        cand, segments = self.cand, self.grid.segments
+        seg_masks = []
+        for segment in segments:
+            mask = 0
+            for idx in segment[0]:
+                mask |= cand[idx]
+            seg_masks.append(mask)
+        changed = 0
+        for seg, (_, line_others, box_others, line_rest, box_rest) in zip(seg_masks, segments):
+            if not seg:
+                continue
+            line_mask = box_mask = 0
+            for other in line_others:
+                line_mask |= seg_masks[other]
+            for other in box_others:
+                box_mask |= seg_masks[other]
+            # Pointing: confined to this segment within its box
+            if seg & ~box_mask & line_mask:
+                changed += self._eliminate(line_rest, seg & ~box_mask)
+            # Claiming: confined to this segment within its line
+            if seg & ~line_mask & box_mask:
+                changed += self._eliminate(box_rest, seg & ~line_mask)
+        return changed
+
+    def _naked_subset(self, k):
+        """k cells of a unit whose candidates together number k"""
+        cand, popcount = self.cand, self.popcount
+        changed = 0
+        for unit in self.grid.units:
+            small = [idx for idx in unit if cand[idx] and popcount[cand[idx]] <= k]
+            if len(small) < k:
+                continue
+            for group in combinations(small, k):
+                union = 0
+                for idx in group:
+                    union |= cand[idx]
+                if popcount[union] == k:
+                    changed += self._eliminate([idx for idx in unit if idx not in group], union)
+        return changed
+
+    def _hidden_subset(self, k):
+        """k values of a unit confined to the same k cells"""
+        cand, popcount = self.cand, self.popcount
+        size = self.grid.size
+        changed = 0
+        for unit in self.grid.units:
+            # places[v]: bitmask of the unit positions where value v can go
+            places = [0] * size
+            for pos, idx in enumerate(unit):
+                mask = cand[idx]
+                while mask:
+                    bit = mask & -mask
+                    mask ^= bit
+                    places[bit.bit_length() - 1] |= 1 << pos
+            values = [v for v in range(size) if 2 <= popcount[places[v]] <= k]
+            for group in combinations(values, k):
+                spots = 0
+                for v in group:
+                    spots |= places[v]
+                if popcount[spots] != k:
+                    continue
+                keep = 0
+                for v in group:
+                    keep |= 1 << v
+                for pos, idx in enumerate(unit):
+                    if spots >> pos & 1 and cand[idx] & ~keep:
+                        cand[idx] &= keep
+                        changed += 1
+        return changed
+
+    def _fish(self, k):
+        """X-wing (k=2) and swordfish (k=3): a value confined to the same k
+        columns in k rows (or rows in k columns) is cleared from the rest of
+        those columns (rows)"""
+        cand, popcount = self.cand, self.popcount
+        size = self.grid.size
+        rows, cols = self.grid.units[:size], self.grid.units[size:2 * size]
+        changed = 0
+        for bit in (1 << v for v in range(size)):
+            # base[line][i] is the same cell as cover[i][line]
+            for base, cover in ((rows, cols), (cols, rows)):
+                spots = []
+                for line, unit in enumerate(base):
+                    mask = 0
+                    for i, idx in enumerate(unit):
+                        if cand[idx] & bit:
+                            mask |= 1 << i
+                    if 2 <= popcount[mask] <= k:
+                        spots.append((line, mask))
+                for group in combinations(spots, k):
+                    union = 0
+                    for _, mask in group:
+                        union |= mask
+                    if popcount[union] != k:
+                        continue
+                    lines = {line for line, _ in group}
+                    targets = [idx for i in range(size) if union >> i & 1
+                               for line, idx in enumerate(cover[i]) if line not in lines]
+                    changed += self._eliminate(targets, bit)
+        return changed
+
+    def _xy_wing(self):
+        """Pivot {a, b} seeing pincers {a, c} and {b, c}: c goes from every
+        cell seeing both pincers"""
+        cand, popcount, peers = self.cand, self.popcount, self.grid.peers
+        pairs = [idx for idx in range(self.grid.num_cells) if popcount[cand[idx]] == 2]
+        changed = 0
+        for pivot in pairs:
+            ab = cand[pivot]
+            wings = [idx for idx in peers[pivot]
+                     if popcount[cand[idx]] == 2 and popcount[cand[idx] & ab] == 1]
+            for first, second in combinations(wings, 2):
+                c = cand[first] & cand[second] & ~ab
+                if not c or cand[first] & cand[second] & ab or popcount[c] != 1:
+                    continue
+                if (cand[first] | cand[second]) & ab != ab:
+                    continue
+                common = set(peers[first]).intersection(peers[second]) - {pivot}
+                changed += self._eliminate(common, c)
+        return changed
+
+
+def rate(board, size=9):
+    """Rate one board (list of rows or line-format string)"""
+    if isinstance(board, str):
+        board = parse_board(board, size)
+    return DifficultyRater(len(board)).rate(board)
+
+
+def _rate_chunk(puzzles, size):
+    rater = DifficultyRater(size)
+    results = []
+    for puzzle in puzzles:
+        try:
+            results.append(rater.rate(parse_board(puzzle, size)))
+        except ValueError:
+            results.append(None)
+    return results
+
+
+def rate_puzzles(puzzles, size=9, workers=1, chunk_size=256):
+    """Yield a Rating (None for invalid puzzles) for each puzzle string"""
+    puzzles = list(puzzles)
+    chunks = [puzzles[i:i + chunk_size] for i in range(0, len(puzzles), chunk_size)]
+    if workers <= 1:
+        for chunk in chunks:
+            yield from _rate_chunk(chunk, size)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for results in pool.map(_rate_chunk, chunks, [size] * len(chunks)):
+            yield from results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rate Sudoku puzzles by technique difficulty")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="puzzle file, one per line ('-' for stdin)")
+    parser.add_argument("--size", type=int, default=9)
+    parser.add_argument("--sort", action="store_true", help="print easiest first")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="worker processes (0 for one per CPU)")
+    args = parser.parse_args(argv)
+
+    if args.input == "-":
+        lines = sys.stdin.readlines()
+    else:
+        with open(args.input) as f:
+            lines = f.readlines()
+    puzzles = [line.strip().split()[0][:args.size ** 2] for line in lines
+               if line.strip() and not line.startswith("#")]
+    workers = args.workers or os.cpu_count() or 1
+    rows = list(zip(puzzles, rate_puzzles(puzzles, args.size, workers)))
+    if args.sort:
+        rows.sort(key=lambda row: row[1].score if row[1] else float("inf"))
+    for puzzle, rating in rows:
+        if rating is None:
+            print(f"{'-':>4} {'invalid':<17} {puzzle}")
+        else:
+            print(f"{rating.score:4.1f} {rating.hardest or 'given':<17} {puzzle}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,10 @@
 import unittest
-from src.hanoi import TowerOfHanoi
+from itertools import islice
+from unittest import mock
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from src.hanoi import HanoiAnimation, TowerOfHanoi
 
 class TestTowerOfHanoi(unittest.TestCase):
     def setUp(self):
@@ -31,5 +36,100 @@ class TestTowerOfHanoi(unittest.TestCase):
         self.assertEqual(self.hanoi.pegs[2], [3, 2, 1])
         self.assertEqual(len(moves), 7)  # 2^n - 1 moves for n disks
 
+    def test_solve_without_setup(self):
+        self.assertEqual(self.hanoi.solve(), [])
+
+    def _recursive(self, n, source, target, auxiliary, out):
+        if n > 0:
+            self._recursive(n - 1, source, auxiliary, target, out)
+            out.append((n, source, target))
+            self._recursive(n - 1, auxiliary, target, source, out)
+        return out
+
+    def test_iter_moves(self):
+        for n in range(1, 11):
+            expected = self._recursive(n, 0, 2, 1, [])
+            self.assertEqual(list(self.hanoi.iter_moves(n)), expected)
+        # Huge towers stream without building the move list
+        self.assertEqual(list(islice(self.hanoi.iter_moves(64), 3)),
+                         [(1, 0, 1), (2, 0, 2), (1, 1, 2)])
+        with self.assertRaises(ValueError):
+            self.hanoi.iter_moves(0)
+
+    def test_move_at(self):
+        for n in range(1, 9):
+            for k, move in enumerate(self.hanoi.iter_moves(n)):
+                self.assertEqual(self.hanoi.move_at(k, n), move)
+        self.hanoi.setup(4)
+        self.assertEqual(self.hanoi.move_at(7), (4, 0, 2))
+        # The middle move of any tower moves the largest disk
+        self.assertEqual(self.hanoi.move_at(2 ** 99 - 1, 100), (100, 0, 2))
+        with self.assertRaises(ValueError):
+            self.hanoi.move_at(15, 4)
+        with self.assertRaises(ValueError):
+            self.hanoi.move_at(-1, 4)
+
+    def test_state_at(self):
+        for n in range(1, 8):
+            self.hanoi.setup(n)
+            self.assertEqual(self.hanoi.state_at(n, 0), self.hanoi.pegs)
+            for k, (_, from_peg, to_peg) in enumerate(self.hanoi.iter_moves(n), 1):
+                self.hanoi.move_disk(from_peg, to_peg)
+                self.assertEqual(self.hanoi.state_at(n, k), self.hanoi.pegs)
+        # Any position of a huge tower without replaying the moves before it
+        pegs = self.hanoi.state_at(64, 2 ** 63)
+        self.assertEqual(pegs[2], [64])
+        self.assertEqual(pegs[1], list(range(63, 0, -1)))
+        with self.assertRaises(ValueError):
+            self.hanoi.state_at(3, 8)
+        with self.assertRaises(ValueError):
+            self.hanoi.state_at(3, -1)
+        with self.assertRaises(ValueError):
+            self.hanoi.state_at(0, 0)
+
+    def test_animation_draws_state(self):
+        animation = HanoiAnimation(self.hanoi, 4, delay=0.5, start=5)
+        self.addCleanup(plt.close, animation.fig)
+        artists = animation.draw(animation.step)
+        self.assertEqual(len(artists), 5)
+        for peg, disks in enumerate(self.hanoi.state_at(4, 5)):
+            for disk in disks:
+                rect = animation.disks[disk - 1]
+                self.assertAlmostEqual(rect.get_x() + rect.get_width() / 2, peg)
+        self.assertIn("Move 5 of 15", animation.title.get_text())
+
+    def test_animation_seek_and_frame_skip(self):
+        animation = HanoiAnimation(self.hanoi, 10, delay=0.5)
+        self.addCleanup(plt.close, animation.fig)
+        self.assertEqual(animation.moves_per_frame, 1)
+        animation.seek(-5)
+        self.assertEqual(animation.step, 0)
+        animation.seek(5000)
+        self.assertEqual(animation.step, 1023)
+
+        # Faster than the frame rate: several moves per frame
+        animation.set_speed(0.001)
+        self.assertGreater(animation.moves_per_frame, 1)
+        self.assertGreaterEqual(animation.interval, 1000 // HanoiAnimation.MAX_FPS)
+        animation.seek(0)
+        frames = animation.frames()
+        steps = [next(frames) for _ in range(3)]
+        self.assertEqual(steps, [0, animation.moves_per_frame, 2 * animation.moves_per_frame])
+        # Holds at the last move instead of stopping
+        animation.seek(1023)
+        frames = animation.frames()
+        self.assertEqual([next(frames) for _ in range(2)], [1023, 1023])
+
+        with self.assertRaises(ValueError):
+            HanoiAnimation(self.hanoi, 3, delay=0)
+
+    def test_visualize_blits(self):
+        self.hanoi.setup(3)
+        with mock.patch("src.hanoi.plt.show"), \
+                mock.patch("src.hanoi.FuncAnimation") as animation:
+            self.hanoi.visualize(0.1, start=2)
+        self.assertTrue(animation.call_args.kwargs["blit"])
+        plt.close("all")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,86 @@
+import json
+import os
+import tempfile
+import unittest
+from src.hanoi import TowerOfHanoi
+from src.hanoi_multipeg import (SplitTable, benchmark, iter_moves, move_at,
+                                move_count, state_at)
+
+
+class TestFrameStewart(unittest.TestCase):
+    def _replay(self, n, pegs):
+        """Play the moves on real pegs, checking each one is legal"""
+        towers = [list(range(n, 0, -1))] + [[] for _ in range(pegs - 1)]
+        for disk, from_peg, to_peg in iter_moves(n, pegs):
+            self.assertEqual(towers[from_peg][-1], disk)
+            self.assertTrue(not towers[to_peg] or towers[to_peg][-1] > disk)
+            towers[to_peg].append(towers[from_peg].pop())
+            yield disk, from_peg, to_peg, towers
+
+    def test_move_counts(self):
+        # Frame–Stewart numbers for four pegs (OEIS A007664)
+        self.assertEqual([move_count(n, 4) for n in range(1, 13)],
+                         [1, 3, 5, 9, 13, 17, 25, 33, 41, 49, 65, 81])
+        self.assertEqual(move_count(10, 3), 1023)
+        self.assertEqual(move_count(64, 4), 18433)
+        for n in range(2, 20):
+            self.assertLessEqual(move_count(n, 6), move_count(n, 5))
+            self.assertLessEqual(move_count(n, 5), move_count(n, 4))
+        with self.assertRaises(ValueError):
+            move_count(0, 4)
+        with self.assertRaises(ValueError):
+            move_count(3, 2)
+
+    def test_moves_are_legal_and_complete(self):
+        for pegs in (4, 5, 6):
+            for n in range(1, 11):
+                moves = 0
+                for moves, (_, _, _, towers) in enumerate(self._replay(n, pegs), 1):
+                    pass
+                self.assertEqual(moves, move_count(n, pegs))
+                self.assertEqual(towers[-1], list(range(n, 0, -1)))
+
+    def test_move_at_and_state_at(self):
+        for pegs in (4, 5):
+            n = 9
+            self.assertEqual(state_at(n, pegs, 0),
+                             [list(range(n, 0, -1))] + [[] for _ in range(pegs - 1)])
+            for k, (disk, from_peg, to_peg, towers) in enumerate(self._replay(n, pegs)):
+                self.assertEqual(move_at(n, pegs, k), (disk, from_peg, to_peg))
+                self.assertEqual(state_at(n, pegs, k + 1), towers)
+        total = move_count(9, 4)
+        with self.assertRaises(ValueError):
+            move_at(9, 4, total)
+        with self.assertRaises(ValueError):
+            state_at(9, 4, total + 1)
+
+    def test_table_persists(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "splits.json")
+            table = SplitTable(path)
+            self.assertEqual(table.moves(20, 5), move_count(20, 5))
+            with open(path) as f:
+                self.assertIn("5", json.load(f)["splits"])
+            reloaded = SplitTable(path)
+            self.assertEqual(reloaded.counts, table.counts)
+            self.assertEqual(reloaded.split(20, 5), table.split(20, 5))
+
+    def test_benchmark(self):
+        rows = benchmark((4, 5), (8, 64))
+        self.assertEqual([(p, n, moves) for p, n, moves, _ in rows],
+                         [(4, 8, 33), (4, 64, 18433), (5, 8, 23), (5, 64, 1535)])
+
+    def test_tower_of_hanoi_pegs(self):
+        hanoi = TowerOfHanoi(4)
+        hanoi.setup(6)
+        self.assertEqual(len(hanoi.pegs), 4)
+        moves = hanoi.solve()
+        self.assertEqual(len(moves), 17)
+        self.assertEqual(hanoi.pegs[3], [6, 5, 4, 3, 2, 1])
+        self.assertEqual(hanoi.move_at(0), move_at(6, 4, 0))
+        self.assertEqual(hanoi.state_at(6, 17), hanoi.pegs)
+        with self.assertRaises(ValueError):
+            TowerOfHanoi(2)
+
+if __name__ == '__main__':
+    unittest.main()
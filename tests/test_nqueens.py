@@ -1,5 +1,8 @@
+import random
 import unittest
+from array import array
 from src.nqueens import NQueens
+from src.nqueens_bitboard import BitboardNQueensSolver, half_prefixes, symmetries
 
 class TestNQueens(unittest.TestCase):
     def setUp(self):
@@ -30,4 +33,93 @@ class TestNQueens(unittest.TestCase):
             self.assertEqual(len(board), 4)
             for row in board:
                 self.assertEqual(len(row), 4)
-                self.assertEqual(row.count('Q'), 1)
\ No newline at end of file
+                self.assertEqual(row.count('Q'), 1)
+
+    def test_bitboard_matches_backtrack(self):
+        for n in range(1, 9):
+            expected = self.solver.solve(n, solver="backtrack")
+            self.assertEqual(self.solver.solve(n, solver="bitboard"), expected)
+            self.assertEqual(self.solver.count, len(expected))
+        with self.assertRaises(ValueError):
+            self.solver.solve(4, solver="nope")
+
+    def test_bitboard_counts(self):
+        engine = BitboardNQueensSolver()
+        for n, count in ((1, 1), (2, 0), (3, 0), (6, 4), (10, 724), (11, 2680)):
+            solutions = engine.solve(n)
+            self.assertEqual((engine.count, len(set(solutions))), (count, count))
+        self.assertEqual(engine.solve(4), [(1, 3, 0, 2), (2, 0, 3, 1)])
+
+    def test_count_and_iter(self):
+        for n in range(1, 10):
+            boards = self.solver.solve(n)
+            self.assertEqual(self.solver.count_solutions(n), len(boards))
+            columns = self.solver.iter_solutions(n)
+            self.assertEqual([self.solver._create_board(q, n) for q in columns], boards)
+        self.assertEqual(self.solver.get_solution_count(12), 14200)
+        # Streaming stops whenever the caller does
+        first = next(self.solver.iter_solutions(20))
+        self.assertTrue(self.solver.is_valid_solution(self.solver._create_board(first, 20)))
+        with self.assertRaises(ValueError):
+            self.solver.count_solutions(0)
+        with self.assertRaises(ValueError):
+            self.solver.iter_solutions(-1)
+
+    def test_fundamental_solutions(self):
+        # OEIS A002562: solutions up to rotation and reflection
+        for n, classes in ((1, 1), (2, 0), (4, 1), (5, 2), (6, 1), (7, 6), (8, 12), (9, 46), (10, 92)):
+            boards = self.solver.solve(n, fundamental=True)
+            self.assertEqual(len(boards), classes)
+            self.assertEqual(self.solver.count, self.solver.count_solutions(n))
+            every = set(self.solver.iter_solutions(n))
+            found = set()
+            for board in boards:
+                queens = tuple(row.index('Q') for row in board)
+                self.assertEqual(queens, min(symmetries(queens)))
+                found.update(symmetries(queens))
+            self.assertEqual(found, every)
+
+    def test_prefixes(self):
+        self.assertEqual(half_prefixes(5), [(0,), (1,), (2, 0)])
+        engine = BitboardNQueensSolver()
+        for n in range(4, 10):
+            every = list(engine.iter_solutions(n))
+            for prefix in [(0,), (1, 3), (n - 1, 0, 2)]:
+                expected = [q for q in every if q[:len(prefix)] == prefix]
+                self.assertEqual(list(engine.iter_solutions(n, prefix)), expected)
+                self.assertEqual(engine.count_solutions(n, prefix), len(expected))
+        self.assertEqual(list(engine.iter_solutions(4, (1, 3, 0, 2))), [(1, 3, 0, 2)])
+        with self.assertRaises(ValueError):
+            engine.count_solutions(4, (4,))
+
+    def test_one_solution(self):
+        for n in [1] + list(range(4, 300)) + [10007, 100000]:
+            queens = self.solver.one_solution(n)
+            self.assertIsInstance(queens, array)
+            self.assertEqual(len(queens), n)
+            self.assertTrue(self.solver.is_valid_placement(queens), n)
+        self.assertEqual(list(self.solver.one_solution(8)), [1, 3, 5, 7, 2, 0, 6, 4])
+        for n in (0, 2, 3):
+            with self.assertRaises(ValueError):
+                self.solver.one_solution(n)
+
+    def test_constructed_solutions(self):
+        for n in (4, 5, 8, 30, 31):
+            found = self.solver.constructed_solutions(n)
+            self.assertEqual(found[0], tuple(self.solver.one_solution(n)))
+            self.assertEqual(len(set(found)), len(found))
+            for queens in found:
+                self.assertTrue(self.solver.is_valid_placement(queens))
+        self.assertEqual(len(self.solver.constructed_solutions(8)), 8)
+
+    def test_is_valid_placement(self):
+        rng = random.Random(6)
+        for _ in range(300):
+            n = rng.randint(1, 9)
+            queens = [rng.randrange(n) for _ in range(n)]
+            board = self.solver._create_board(queens, n)
+            pairwise = all(queens[i] != queens[j] and abs(queens[i] - queens[j]) != j - i
+                           for i in range(n) for j in range(i + 1, n))
+            self.assertEqual(self.solver.is_valid_placement(queens), pairwise)
+            self.assertEqual(self.solver.is_valid_solution(board), pairwise)
+        self.assertFalse(self.solver.is_valid_placement([0, 4, 1, 3]))
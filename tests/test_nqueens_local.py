@@ -0,0 +1,60 @@
+import unittest
+from src.nqueens import NQueens
+from src.nqueens_bitboard import BitboardNQueensSolver
+from src.nqueens_local import MinConflictsSolver
+
+
+class TestNQueensCompletion(unittest.TestCase):
+    def setUp(self):
+        self.solver = NQueens()
+
+    def test_iter_completions(self):
+        engine = BitboardNQueensSolver()
+        every = engine.solve(8)
+        for placed in ({}, {3: 0}, {0: 4, 7: 2}, {2: 5, 5: 1, 6: 6}):
+            expected = [q for q in every if all(q[row] == col for row, col in placed.items())]
+            self.assertEqual(list(engine.iter_completions(8, placed)), expected)
+        with self.assertRaises(ValueError):
+            list(engine.iter_completions(8, {0: 0, 7: 7}))
+        with self.assertRaises(ValueError):
+            engine.iter_completions(8, {8: 0})
+
+    def test_complete_search(self):
+        queens = self.solver.complete(10, {4: 4, 9: 0})
+        self.assertTrue(self.solver.is_valid_placement(queens))
+        self.assertEqual((queens[4], queens[9]), (4, 0))
+        self.assertEqual(self.solver.stats["method"], "search")
+        # No 4-queens solution has a corner queen
+        self.assertIsNone(self.solver.complete(4, {0: 0}))
+        with self.assertRaises(ValueError):
+            self.solver.complete(8, {}, method="nope")
+
+    def test_complete_local(self):
+        placed = {0: 0, 123: 45, 4999: 2500}
+        queens = self.solver.complete(5000, placed, seed=3)
+        self.assertTrue(self.solver.is_valid_placement(queens))
+        self.assertEqual({row: queens[row] for row in placed}, placed)
+        stats = self.solver.stats
+        self.assertEqual((stats["method"], stats["conflicts"]), ("local", 0))
+        self.assertGreaterEqual(stats["steps"], stats["moves"])
+        with self.assertRaises(ValueError):
+            self.solver.complete(5000, {0: 0, 1: 1})
+
+    def test_min_conflicts(self):
+        checker = NQueens()
+        for n in (1, 4, 6, 8, 30, 1000):
+            for seed in range(5):
+                queens = MinConflictsSolver(seed=seed).solve(n)
+                self.assertTrue(checker.is_valid_placement(queens), (n, seed))
+
+    def test_step_budget(self):
+        solver = MinConflictsSolver(max_steps=50, seed=1)
+        self.assertIsNone(solver.solve(3))
+        self.assertEqual(solver.steps, 50)
+        self.assertGreater(solver.stats()["conflicts"], 0)
+        self.assertGreater(solver.restarts, 0)
+        # A single free row cannot be repaired
+        self.assertIsNone(MinConflictsSolver(seed=1).solve(5, {0: 1, 1: 4, 2: 0, 3: 3}))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import tempfile
+import unittest
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from unittest import mock
+from src.nqueens import NQueens, PAGER_SEARCH_SIZE
+from src.nqueens_pages import CHECKER_SIZE, SolutionPages
+
+
+class TestNQueensPages(unittest.TestCase):
+    def test_pages_pull_solutions_lazily(self):
+        pages = SolutionPages(24, NQueens().iter_solutions(24), per_page=4)
+        pages.show_page(1)
+        self.assertEqual(len(pages.solutions), 8)
+        self.assertFalse(pages.exhausted)
+        self.assertEqual(pages.titles[0].get_text(), "Solution 5")
+        pages.close()
+
+    def test_page_contents(self):
+        solver = NQueens()
+        boards = solver.solve(6)
+        pages = SolutionPages(6, solver.iter_solutions(6), per_page=3)
+        pages.show_page(1)
+        self.assertIn("page 2 of 2, 4 solutions", pages.status.get_text())
+        cols, rows = pages.queens[0].get_data()
+        self.assertEqual([boards[3][r].index('Q') for r in rows], list(cols))
+        self.assertEqual(pages.titles[1].get_text(), "")
+        with self.assertRaises(IndexError):
+            pages.show_page(2)
+        pages.close()
+
+    def test_page_turns_blit(self):
+        pages = SolutionPages(8, NQueens().iter_solutions(8))
+        pages.show_page(0)
+        with mock.patch.object(pages.fig.canvas, "draw") as draw:
+            pages.show_page(3)
+            pages._on_key(mock.Mock(key="left"))
+        draw.assert_not_called()
+        self.assertEqual(pages.page, 2)
+        pages.close()
+
+    def test_save_pages(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            pages = SolutionPages(8, NQueens().iter_solutions(8), figsize=(4, 4))
+            paths = pages.save_pages(tmp)
+            self.assertEqual(len(paths), 6)
+            first, last = plt.imread(paths[0]), plt.imread(paths[-1])
+            self.assertEqual(first.shape, last.shape)
+            self.assertTrue((first != last).any())
+            self.assertEqual(pages.save_pages(tmp, range(5, 9)), paths[-1:])
+            pages.close()
+
+    def test_large_boards_show_constructed_solutions(self):
+        solver = NQueens()
+        n = PAGER_SEARCH_SIZE + 2
+        pages = solver.pages(n)
+        pages.show_page(0)
+        self.assertTrue(pages.exhausted)
+        self.assertIn("(constructed)", pages.status.get_text())
+        self.assertEqual(pages.solutions[0], tuple(solver.one_solution(n)))
+        for queens in pages.solutions:
+            self.assertTrue(solver.is_valid_placement(queens))
+        pages.close()
+
+    def test_large_boards_skip_the_checkerboard(self):
+        n = CHECKER_SIZE + 1
+        pages = SolutionPages(n, [NQueens().one_solution(n)], per_page=1)
+        self.assertEqual(len(pages.axes[0].images), 0)
+        pages.show_page(0)
+        self.assertEqual(len(pages.queens[0].get_xdata()), n)
+        pages.close()
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            SolutionPages(8, [], per_page=0)
+        pages = SolutionPages(3, NQueens().iter_solutions(3))
+        pages.show_page(0)
+        self.assertIn("0 solutions", pages.status.get_text())
+        pages.close()
+
+if __name__ == '__main__':
+    unittest.main()
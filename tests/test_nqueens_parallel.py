@@ -0,0 +1,67 @@
+import multiprocessing
+import time
+import unittest
+from src.nqueens_bitboard import BitboardNQueensSolver
+from src.nqueens_parallel import (split, count_parallel, iter_parallel, measure_scaling,
+                                  _pool_results)
+
+
+def _nap(n, prefix):
+    time.sleep(prefix[0])
+    return prefix[0]
+
+
+class TestNQueensParallel(unittest.TestCase):
+    def test_split(self):
+        self.assertEqual(split(5, 1), [(0,), (1,), (2, 0)])
+        engine = BitboardNQueensSolver()
+        for n in range(4, 10):
+            prefixes = split(n)
+            self.assertEqual(len(set(prefixes)), len(prefixes))
+            self.assertEqual(2 * sum(engine.count_solutions(n, p) for p in prefixes),
+                             engine.count_solutions(n))
+        with self.assertRaises(ValueError):
+            split(1)
+
+    def test_count_parallel(self):
+        for n, count in ((1, 1), (3, 0), (4, 2), (8, 92), (10, 724)):
+            self.assertEqual(count_parallel(n, workers=2), count)
+        self.assertEqual(count_parallel(9, workers=2, depth=1), 352)
+        with self.assertRaises(ValueError):
+            count_parallel(0)
+
+    def test_iter_parallel(self):
+        for n in (1, 5, 8):
+            solutions = list(iter_parallel(n, workers=2))
+            self.assertEqual(len(solutions), len(set(solutions)))
+            self.assertEqual(set(solutions), set(BitboardNQueensSolver().iter_solutions(n)))
+
+    def test_stop_early(self):
+        solutions = iter_parallel(12, workers=1, depth=2)
+        self.assertEqual(len(next(solutions)), 12)
+        solutions.close()
+
+    def test_close_does_not_wait(self):
+        # One worker: the next subtree is still running when the first arrives
+        solutions = iter_parallel(14, workers=1, depth=1)
+        next(solutions)
+        start = time.perf_counter()
+        solutions.close()
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+    def test_close_stops_workers(self):
+        results = _pool_results(_nap, 0, [(0,), (60,)], 1)
+        next(results)
+        workers = multiprocessing.active_children()
+        results.close()
+        deadline = time.perf_counter() + 5
+        while any(p.is_alive() for p in workers) and time.perf_counter() < deadline:
+            time.sleep(0.05)
+        self.assertFalse(any(p.is_alive() for p in workers))
+
+    def test_measure_scaling(self):
+        rows = measure_scaling(8, worker_counts=(1, 2))
+        self.assertEqual([row[0] for row in rows], [0, 1, 2])
+
+if __name__ == '__main__':
+    unittest.main()
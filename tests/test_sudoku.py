@@ -2,6 +2,7 @@ from PyQt6.QtWidgets import QApplication
 import unittest
 from src.sudoku import Sudoku
 import sys
+import time
 
 class TestSudoku(unittest.TestCase):
     @classmethod
@@ -72,6 +73,55 @@ class TestSudoku(unittest.TestCase):
         ]
         self.assertTrue(self.solver.is_valid_solution(board))
 
+
+class TestSudokuThrottledGui(unittest.TestCase):
+    # Needs about 80k search nodes with the default backtracking solver
+    HARD = "..............3.85..1.2.......5.7.....4...1...9.......5......73..2.1........4...9"
+    EASY = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.solver = Sudoku()
+        self.solver.create_gui()
+
+    def tearDown(self):
+        self.solver.window.close()
+
+    def board(self, puzzle):
+        return [list(puzzle[i:i + 9]) for i in range(0, 81, 9)]
+
+    def test_snapshots_are_throttled(self):
+        board = self.board(self.EASY)
+        self.solver._next_frame = 0.0
+        for _ in range(1000):
+            self.solver._on_progress(board)
+        snapshot = self.solver._snapshot
+        self.assertEqual(snapshot, board)
+        self.assertIsNot(snapshot, board)
+        board[0][2] = "4"
+        self.solver._on_progress(board)
+        self.assertIs(self.solver._snapshot, snapshot)  # Next frame not due yet
+
+    def test_background_solve_paints_solution(self):
+        board = self.board(self.EASY)
+        self.solver.load_array_to_gui(board)
+        solution = self.solver._solve_in_background(board)
+        self.assertTrue(self.solver.is_valid_solution(solution))
+        self.assertEqual([[cell.text() for cell in row] for row in self.solver.cells], solution)
+        self.assertIsNone(self.solver._worker)
+
+    def test_stop_cancels_promptly(self):
+        from PyQt6.QtCore import QTimer
+        QTimer.singleShot(50, self.solver.stop_solving)
+        start = time.perf_counter()
+        result = self.solver._solve_in_background(self.board(self.HARD))
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertFalse(result)
+        self.assertFalse(self.solver.solving)
+
 # some inputs
 
 # [["2","6",".",".","7",".",".",".","."],[".",".","9","6",".","2",".","1","."],["4",".",".","3",".",".",".",".","."],[".",".","3",".",".",".",".",".","8"],["8",".","7","9",".","4","5",".","2"],["9",".",".",".",".",".","7",".","."],[".",".",".",".",".","7",".",".","5"],[".","4",".","2",".","6","1",".","."],[".",".",".",".","3",".",".","8","6"]]
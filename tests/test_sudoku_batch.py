@@ -0,0 +1,84 @@
+import unittest
+import os
+import tempfile
+from contextlib import redirect_stderr
+from io import StringIO
+from src.sudoku_batch import (read_puzzles, solve_puzzle, solve_batch,
+                              BatchStats, main)
+from src.sudoku_core import SudokuCore, parse_board
+
+PUZZLES = [
+    "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79",
+    ".......71.2.8........4.3...7...6..5....2..3..9........6...7.....8....4......5....",
+    ".47.8...1............6..7..6....357......5....1..6....28..4.....9.1...4.....2.69.",
+    "26..7......96.2.1.4..3.......3.....88.79.45.29.....7.......7..5.4.2.61......3..86",
+]
+
+
+class TestSudokuBatch(unittest.TestCase):
+    def test_read_puzzles(self):
+        lines = ["# header\n", "\n", PUZZLES[0] + ",extra\n", PUZZLES[1].replace(".", "0")]
+        self.assertEqual(list(read_puzzles(lines)),
+                         [PUZZLES[0], PUZZLES[1].replace(".", "0")])
+
+    def test_solve_puzzle(self):
+        result = solve_puzzle(PUZZLES[0])
+        self.assertTrue(SudokuCore().is_valid_solution(parse_board(result.solution)))
+        self.assertIsNone(result.error)
+        self.assertGreater(result.solve_attempts, 0)
+
+    def test_engines_agree(self):
+        for puzzle in PUZZLES[:3]:
+            bitmask = solve_puzzle(puzzle, "bitmask")
+            backtrack = solve_puzzle(puzzle, "backtrack")
+            self.assertEqual(bitmask.solution, backtrack.solution)
+            self.assertEqual(bitmask.backtrack_count, backtrack.backtrack_count)
+
+    def test_invalid_puzzle(self):
+        result = solve_puzzle("55" + "." * 79)
+        self.assertIsNone(result.solution)
+        self.assertIsNotNone(result.error)
+
+    def test_batch_preserves_order(self):
+        puzzles = PUZZLES * 3 + ["55" + "." * 79]
+        results = list(solve_batch(puzzles, workers=2, chunk_size=2))
+        self.assertEqual([r.index for r in results], list(range(len(puzzles))))
+        self.assertEqual([r.puzzle for r in results], puzzles)
+        self.assertEqual(results[0].solution, solve_puzzle(PUZZLES[0]).solution)
+
+        stats = BatchStats()
+        for result in results:
+            stats.add(result)
+        stats.finish()
+        self.assertEqual(stats.puzzles, len(puzzles))
+        self.assertEqual(stats.invalid, 1)
+        self.assertEqual(stats.solved, len(puzzles) - 1)
+        self.assertGreater(stats.throughput, 0)
+
+    def test_bad_arguments(self):
+        with self.assertRaises(ValueError):
+            list(solve_batch(PUZZLES, chunk_size=0))
+        with self.assertRaises(ValueError):
+            list(solve_batch(PUZZLES, engine="unknown"))
+
+    def test_cli(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            in_path = os.path.join(tmp, "puzzles.txt")
+            out_path = os.path.join(tmp, "solutions.txt")
+            with open(in_path, "w") as f:
+                f.write("\n".join(PUZZLES) + "\n")
+
+            with redirect_stderr(StringIO()) as err:
+                code = main([in_path, "-o", out_path, "-w", "2", "-c", "1"])
+            self.assertEqual(code, 0)
+            self.assertIn("Throughput", err.getvalue())
+
+            with open(out_path) as f:
+                lines = f.read().splitlines()
+            self.assertEqual(len(lines), len(PUZZLES))
+            solution, attempts, backtracks, _ = lines[0].split("\t")
+            self.assertEqual(solution, solve_puzzle(PUZZLES[0]).solution)
+            self.assertEqual(int(attempts), solve_puzzle(PUZZLES[0]).solve_attempts)
+
+if __name__ == '__main__':
+    unittest.main()
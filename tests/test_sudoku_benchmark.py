@@ -0,0 +1,34 @@
+import random
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from src.sudoku_benchmark import random_grid, random_puzzle, benchmark_sizes, main
+from src.sudoku_core import SudokuCore
+
+
+class TestSudokuBenchmark(unittest.TestCase):
+    def test_random_grid(self):
+        for size in (4, 9, 16):
+            self.assertTrue(SudokuCore(size).is_valid_solution(random_grid(size, random.Random(size))))
+
+    def test_random_puzzle_clues(self):
+        board = random_puzzle(16, 0.5, random.Random(1))
+        self.assertEqual(sum(row.count(".") for row in board), 128)
+        self.assertEqual(board, random_puzzle(16, 0.5, random.Random(1)))
+
+    def test_benchmark_sizes(self):
+        rows = benchmark_sizes(sizes=(4, 9), engines=("bitmask", "propagate"), puzzles=2)
+        self.assertEqual([(r["size"], r["engine"]) for r in rows],
+                         [(4, "propagate"), (9, "bitmask"), (9, "propagate")])
+        for row in rows:
+            self.assertEqual(row["solved"], 2)
+            self.assertEqual(row["timed_out"], 0)
+
+    def test_cli(self):
+        out = StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(main(["--sizes", "4", "-n", "1"]), 0)
+        self.assertIn("propagate", out.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
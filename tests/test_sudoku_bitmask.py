@@ -0,0 +1,73 @@
+import unittest
+import copy
+from src.sudoku import Sudoku
+from src.sudoku_bitmask import BitmaskSudokuSolver
+
+EXAMPLE = [
+    ["5","3",".",".","7",".",".",".","."],
+    ["6",".",".","1","9","5",".",".","."],
+    [".","9","8",".",".",".",".","6","."],
+    ["8",".",".",".","6",".",".",".","3"],
+    ["4",".",".","8",".","3",".",".","1"],
+    ["7",".",".",".","2",".",".",".","6"],
+    [".","6",".",".",".",".","2","8","."],
+    [".",".",".","4","1","9",".",".","5"],
+    [".",".",".",".","8",".",".","7","9"]
+]
+
+HARD = [
+    [[".",".",".",".",".",".",".","7","1"],[".","2",".","8",".",".",".",".","."],[".",".",".","4",".","3",".",".","."],["7",".",".",".","6",".",".","5","."],[".",".",".","2",".",".","3",".","."],["9",".",".",".",".",".",".",".","."],["6",".",".",".","7",".",".",".","."],[".","8",".",".",".",".","4",".","."],[".",".",".",".","5",".",".",".","."]],
+    [[".","4","7",".","8",".",".",".","1"],[".",".",".",".",".",".",".",".","."],[".",".",".","6",".",".","7",".","."],["6",".",".",".",".","3","5","7","."],[".",".",".",".",".","5",".",".","."],[".","1",".",".","6",".",".",".","."],["2","8",".",".","4",".",".",".","."],[".","9",".","1",".",".",".","4","."],[".",".",".",".","2",".","6","9","."]],
+]
+
+
+class TestBitmaskSudokuSolver(unittest.TestCase):
+    def setUp(self):
+        self.solver = BitmaskSudokuSolver()
+
+    def test_matches_sudoku_solve(self):
+        for puzzle in [EXAMPLE] + HARD:
+            reference = Sudoku(test_mode=True)
+            expected = reference.solve(copy.deepcopy(puzzle))
+            result = self.solver.solve(copy.deepcopy(puzzle))
+            self.assertEqual(result, expected)
+            self.assertEqual(self.solver.solve_attempts, reference.solve_attempts)
+            self.assertEqual(self.solver.backtrack_count, reference.backtrack_count)
+
+    def test_solves_in_place(self):
+        board = copy.deepcopy(EXAMPLE)
+        self.assertIs(self.solver.solve(board), board)
+        self.assertTrue(Sudoku(test_mode=True).is_valid_solution(board))
+
+    def test_empty_board(self):
+        board = [["."] * 9 for _ in range(9)]
+        expected = Sudoku(test_mode=True).solve([["."] * 9 for _ in range(9)])
+        self.assertEqual(self.solver.solve(board), expected)
+
+    def test_invalid_board(self):
+        board = [
+            ["5","3",".",".","7",".",".",".","."],
+            ["5",".",".","1","9","5",".",".","."],
+            [".","9","8",".",".",".",".","6","."]
+        ]
+        with self.assertRaises(ValueError):
+            self.solver.solve(board)
+
+        board = copy.deepcopy(EXAMPLE)
+        board[0][2] = "5"  # Duplicate 5 in first row
+        with self.assertRaises(ValueError):
+            self.solver.solve(board)
+
+    def test_unsolvable_board(self):
+        board = [["."] * 9 for _ in range(9)]
+        board[0] = ["1","2","3","4","5","6","7","8","."]
+        board[4][8] = "9"
+        self.assertFalse(self.solver.solve(board))
+
+    def test_reuse_between_boards(self):
+        self.solver.solve(copy.deepcopy(HARD[0]))
+        result = self.solver.solve(copy.deepcopy(EXAMPLE))
+        self.assertTrue(Sudoku(test_mode=True).is_valid_solution(result))
+
+if __name__ == '__main__':
+    unittest.main()
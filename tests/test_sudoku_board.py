@@ -0,0 +1,96 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src.sudoku import Sudoku
+from src.sudoku_board import Board, iter_boards, read_boards
+from src.sudoku_core import SudokuCore, parse_board
+from src.sudoku_dlx import DancingLinksSudokuSolver
+from tests.test_sudoku_core import EXAMPLE, SOLUTION
+from tests.test_sudoku_sizes import PUZZLE_16
+
+
+class TestBoard(unittest.TestCase):
+    def test_round_trip(self):
+        board = Board.from_string(EXAMPLE)
+        self.assertEqual(str(board), EXAMPLE)
+        self.assertEqual(board.to_list(), parse_board(EXAMPLE))
+        self.assertEqual(Board.from_list(parse_board(EXAMPLE)), board)
+        self.assertEqual(Board.from_string(EXAMPLE.replace(".", "0")), board)
+        self.assertEqual(board[0, 0], 5)
+        self.assertEqual(board[0, 2], 0)
+        self.assertEqual(board.empty_count(), EXAMPLE.count("."))
+
+    def test_16x16(self):
+        board = Board.from_string(PUZZLE_16.lower(), 16)
+        self.assertEqual(board.to_string(), PUZZLE_16)
+        self.assertEqual(board.to_list(), parse_board(PUZZLE_16, 16))
+
+    def test_copy_is_independent(self):
+        board = Board.from_string(EXAMPLE)
+        copy = board.copy()
+        copy[0, 2] = 4
+        self.assertEqual(board[0, 2], 0)
+        self.assertNotEqual(copy, board)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            Board.from_string(EXAMPLE[:80])
+        with self.assertRaises(ValueError):
+            Board.from_string("A" + EXAMPLE[1:])
+        with self.assertRaises(ValueError):
+            Board.from_list([["1"] * 8] * 9)
+        with self.assertRaises(ValueError):
+            Board(9, bytes([10]) + bytes(80))
+
+    def test_solve_in_place(self):
+        for solver in ("backtrack", "bitmask", "propagate", "dlx"):
+            board = Board.from_string(EXAMPLE)
+            self.assertIs(SudokuCore().solve(board, solver=solver), board)
+            self.assertEqual(str(board), SOLUTION)
+        self.assertEqual(SudokuCore().count_solutions(Board.from_string(EXAMPLE)), 1)
+        board = Board.from_string(EXAMPLE)
+        self.assertIs(Sudoku(test_mode=True).solve_array(board), board)
+        self.assertEqual(str(board), SOLUTION)
+
+    def test_engines_use_cells_directly(self):
+        # No detour through the list format for the engines
+        with mock.patch.object(Board, "to_list", side_effect=AssertionError), \
+                mock.patch.object(Board, "update", side_effect=AssertionError):
+            for solver in ("bitmask", "propagate", "dlx"):
+                board = Board.from_string(EXAMPLE)
+                self.assertIs(SudokuCore().solve(board, solver=solver), board)
+                self.assertEqual(str(board), SOLUTION)
+            self.assertEqual(SudokuCore().count_solutions(Board.from_string(EXAMPLE),
+                                                          solver="dlx"), 1)
+            solutions = list(DancingLinksSudokuSolver().iter_solutions(Board.from_string(EXAMPLE)))
+            self.assertEqual([str(b) for b in solutions], [SOLUTION])
+
+    def test_size_mismatch(self):
+        with self.assertRaises(ValueError):
+            SudokuCore(16).solve(Board.from_string(EXAMPLE), solver="propagate")
+        with self.assertRaises(ValueError):
+            SudokuCore(16).count_solutions(Board.from_string(EXAMPLE))
+        self.assertIsNone(Sudoku(test_mode=True, size=16).solve_array(Board.from_string(EXAMPLE)))
+
+    def test_unsolvable_left_untouched(self):
+        puzzle = "12345678." + "." * 8 + "9" + "." * 63
+        board = Board.from_string(puzzle)
+        self.assertFalse(SudokuCore().solve(board, solver="propagate"))
+        self.assertEqual(str(board), puzzle)
+
+    def test_iter_boards(self):
+        data = f"# corpus\n\n{EXAMPLE},rated\n{SOLUTION}".encode()
+        self.assertEqual([str(b) for b in iter_boards(data)], [EXAMPLE, SOLUTION])
+
+    def test_read_boards_mmap(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "puzzles.txt")
+            with open(path, "w") as f:
+                f.write(f"{EXAMPLE}\r\n{SOLUTION}\r\n")
+            self.assertEqual([str(b) for b in read_boards(path)], [EXAMPLE, SOLUTION])
+            open(path, "w").close()
+            self.assertEqual(list(read_boards(path)), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import os
+import random
+import tempfile
+import time
+import unittest
+from src.sudoku_cache import SolutionCache, apply_transform, canonical_form, invert_transform
+from src.sudoku_core import SudokuCore, parse_board, board_to_string
+from src.sudoku_observer import CountingObserver
+from tests.test_sudoku_core import EXAMPLE, SOLUTION
+from tests.test_sudoku_sizes import PUZZLE_4
+
+MINIMAL = "...8....9.873...4.6..7.......85..97...........43..75.......3....3...145.4....2..1"
+
+
+def scramble(board, rng):
+    """board under a random relabel, band/stack/row/column shuffle and transpose"""
+    size = len(board)
+    n = int(size ** 0.5)
+    rows = [b * n + r for b in rng.sample(range(n), n) for r in rng.sample(range(n), n)]
+    cols = [s * n + c for s in rng.sample(range(n), n) for c in rng.sample(range(n), n)]
+    symbols = "123456789ABCDEFGHIJKLMNOP"[:size]
+    relabel = dict(zip(symbols, rng.sample(symbols, size)), **{".": "."})
+    scrambled = [[relabel[board[r][c]] for c in cols] for r in rows]
+    if rng.random() < 0.5:
+        scrambled = [list(col) for col in zip(*scrambled)]
+    return scrambled
+
+
+class TestCanonicalForm(unittest.TestCase):
+    def test_equivalent_boards_share_key(self):
+        rng = random.Random(0)
+        for puzzle, size in ((EXAMPLE, 9), (MINIMAL, 9), (SOLUTION, 9), (PUZZLE_4, 4)):
+            board = parse_board(puzzle, size)
+            key, _ = canonical_form(board)
+            for _ in range(5):
+                self.assertEqual(canonical_form(scramble(board, rng))[0], key)
+
+    def test_transform_round_trip(self):
+        board = parse_board(MINIMAL)
+        key, transform = canonical_form(board)
+        canonical = apply_transform(board, transform)
+        self.assertEqual(board_to_string(canonical), key)
+        self.assertEqual(invert_transform(canonical, transform), board)
+
+    def test_different_puzzles_differ(self):
+        self.assertNotEqual(canonical_form(parse_board(EXAMPLE))[0],
+                            canonical_form(parse_board(MINIMAL))[0])
+
+    def test_step_limit(self):
+        board = parse_board(EXAMPLE)
+        self.assertIsNone(canonical_form(board, max_steps=0))
+        self.assertEqual(canonical_form(board, max_steps=20000), canonical_form(board))
+        self.assertIsNone(canonical_form(parse_board("." * 81), max_steps=20000))
+
+    def test_unknown_symbol(self):
+        board = parse_board(EXAMPLE)
+        board[0][2] = "X"
+        with self.assertRaises(ValueError):
+            canonical_form(board)
+
+
+class TestSolutionCache(unittest.TestCase):
+    def test_hit_maps_solution_back(self):
+        cache = SolutionCache()
+        core = SudokuCore(cache=cache)
+        self.assertEqual(board_to_string(core.solve(parse_board(EXAMPLE))), SOLUTION)
+        self.assertGreater(core.solve_attempts, 0)
+
+        board = scramble(parse_board(EXAMPLE), random.Random(1))
+        solution = core.solve([row[:] for row in board], solver="dlx")
+        self.assertEqual(core.solve_attempts, 0)
+        self.assertTrue(core.is_valid_solution(solution))
+        for given, solved in zip(board_to_string(board), board_to_string(solution)):
+            if given != ".":
+                self.assertEqual(given, solved)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cache.hit_rate, 0.5)
+
+    def test_unsolvable_cached(self):
+        core = SudokuCore(cache=SolutionCache(max_steps=None, min_clues=0))
+        board = parse_board("12345678." + "." * 8 + "9" + "." * 63)
+        self.assertFalse(core.solve([row[:] for row in board], solver="propagate"))
+        self.assertFalse(core.solve([row[:] for row in board], solver="propagate"))
+        self.assertEqual(core.cache.hits, 1)
+
+    def test_lru_eviction(self):
+        cache = SolutionCache(maxsize=2)
+        for key in "abc":
+            cache.put(key, key)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("c"), "c")
+
+    def test_disk_store(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "solutions")
+            with SolutionCache(path=path) as cache:
+                SudokuCore(cache=cache).solve(parse_board(EXAMPLE), solver="propagate")
+            with SolutionCache(path=path) as cache:
+                core = SudokuCore(cache=cache)
+                board = scramble(parse_board(EXAMPLE), random.Random(2))
+                self.assertTrue(core.is_valid_solution(core.solve(board)))
+                self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_minimal_puzzle_hits_with_defaults(self):
+        cache = SolutionCache()
+        core = SudokuCore(cache=cache)
+        core.solve(parse_board(MINIMAL), solver="dlx")
+        board = scramble(parse_board(MINIMAL), random.Random(4))
+        self.assertTrue(core.is_valid_solution(core.solve(board, solver="dlx")))
+        self.assertEqual((cache.hits, cache.misses, cache.skipped), (1, 1, 0))
+
+    def test_sparse_boards_skip_the_cache(self):
+        cache = SolutionCache()
+        core = SudokuCore(cache=cache)
+        start = time.perf_counter()
+        self.assertTrue(core.is_valid_solution(core.solve(parse_board("." * 81), solver="dlx")))
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(cache.stats()["skipped"], 1)
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+
+    def test_observer_sees_hits(self):
+        core = SudokuCore(cache=SolutionCache())
+        core.observer = CountingObserver()
+        core.solve(parse_board(EXAMPLE), solver="dlx")
+        core.solve(scramble(parse_board(EXAMPLE), random.Random(3)), solver="dlx")
+        self.assertEqual(core.cache.hits, 1)
+        self.assertEqual(core.observer.solves, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import subprocess
+import sys
+import os
+from src.sudoku_core import SudokuCore, parse_board, board_to_string
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+EXAMPLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+SOLUTION = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+
+
+class TestSudokuCore(unittest.TestCase):
+    def setUp(self):
+        self.solver = SudokuCore()
+
+    def test_solve(self):
+        board = parse_board(EXAMPLE)
+        self.assertEqual(board_to_string(self.solver.solve(board)), SOLUTION)
+        self.assertGreater(self.solver.solve_attempts, 0)
+
+    def test_invalid_board(self):
+        board = parse_board(EXAMPLE)
+        board[0][2] = "5"
+        with self.assertRaises(ValueError):
+            self.solver.solve(board)
+
+    def test_reuse_between_boards(self):
+        self.solver.solve(parse_board(EXAMPLE))
+        solution = self.solver.solve(parse_board("." * 81))
+        self.assertTrue(self.solver.is_valid_solution(solution))
+
+    def test_count_solutions(self):
+        self.assertEqual(self.solver.count_solutions(parse_board(EXAMPLE)), 1)
+        self.assertEqual(self.solver.count_solutions(parse_board("." * 81)), 2)
+        self.assertEqual(self.solver.count_solutions(parse_board("." * 81), 3, solver="dlx"), 3)
+        with self.assertRaises(ValueError):
+            self.solver.count_solutions(parse_board(EXAMPLE), solver="backtrack")
+
+    def test_parse_board_formats(self):
+        expected = parse_board(EXAMPLE)
+        self.assertEqual(parse_board(EXAMPLE.replace(".", "0")), expected)
+        self.assertEqual(parse_board(EXAMPLE.encode()), expected)
+        self.assertEqual(parse_board([EXAMPLE[i:i + 9] for i in range(0, 81, 9)]), expected)
+        self.assertEqual(parse_board([[int(c) if c != "." else 0 for c in EXAMPLE[i:i + 9]]
+                                      for i in range(0, 81, 9)]), expected)
+
+    def test_parse_board_rejects_bad_input(self):
+        with self.assertRaises(ValueError):
+            parse_board(EXAMPLE[:80])
+        with self.assertRaises(ValueError):
+            parse_board("x" + EXAMPLE[1:])
+        with self.assertRaises(ValueError):
+            parse_board([["."] * 9 for _ in range(8)])
+
+    def test_import_without_qt(self):
+        """Importing the solver modules must not load PyQt6 or matplotlib"""
+        code = (
+            "import sys\n"
+            "import src.sudoku_core, src.sudoku\n"
+            "from src.sudoku import Sudoku\n"
+            "Sudoku(test_mode=True).solve([['.'] * 9 for _ in range(9)])\n"
+            "loaded = [m for m in ('PyQt6', 'matplotlib') if m in sys.modules]\n"
+            "if loaded:\n"
+            "    sys.exit('loaded ' + ', '.join(loaded))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                                capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+if __name__ == '__main__':
+    unittest.main()
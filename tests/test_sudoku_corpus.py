@@ -0,0 +1,76 @@
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from src.sudoku_corpus import CORPUS, measure, run_corpus, compare, main
+from src.sudoku_core import SudokuCore, parse_board
+
+
+class TestSudokuCorpus(unittest.TestCase):
+    def test_corpus_puzzles_unique(self):
+        core = SudokuCore()
+        for tier, puzzles in CORPUS.items():
+            for puzzle in puzzles:
+                self.assertEqual(core.count_solutions(parse_board(puzzle)), 1, (tier, puzzle))
+        for puzzle in CORPUS["17-clue"]:
+            self.assertEqual(81 - puzzle.count("."), 17)
+
+    def test_measure(self):
+        record = measure(CORPUS["easy"][0])
+        self.assertTrue(record["solved"])
+        self.assertGreater(record["nodes"], 0)
+        self.assertGreaterEqual(record["nodes"], record["backtracks"])
+        self.assertGreater(record["peak_kib"], 0)
+        self.assertIsNone(measure(CORPUS["easy"][0], memory=False)["peak_kib"])
+
+    def test_run_corpus(self):
+        report = run_corpus(["easy"], solver="propagate", repeat=2)
+        self.assertEqual(len(report["puzzles"]), len(CORPUS["easy"]))
+        self.assertEqual(report["tiers"]["easy"]["puzzles"], len(CORPUS["easy"]))
+        self.assertEqual(report["tiers"]["easy"]["timed_out"], 0)
+        json.dumps(report)
+        with self.assertRaises(ValueError):
+            run_corpus(["nope"])
+
+    def test_compare(self):
+        baseline = {"tiers": {"hard": {"timed_out": 0, "seconds": 1.0, "nodes": 100,
+                                       "backtracks": 50, "peak_kib": 40.0}}}
+        report = {"tiers": {"hard": {"timed_out": 0, "seconds": 1.1, "nodes": 200,
+                                     "backtracks": 50, "peak_kib": None},
+                            "easy": {"timed_out": 0, "seconds": 9.0, "nodes": 1,
+                                     "backtracks": 0, "peak_kib": 1.0}}}
+        regressions = compare(report, baseline, threshold=0.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn("nodes", regressions[0])
+        self.assertEqual(len(compare(report, baseline, threshold=1.0)), 0)
+        # Tiny absolute wall-time changes are noise
+        baseline["tiers"]["hard"].update(seconds=0.001, nodes=200)
+        report["tiers"]["hard"]["seconds"] = 0.005
+        self.assertEqual(compare(report, baseline), [])
+
+    def test_cli_fails_on_regression(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            baseline = os.path.join(tmp, "baseline.json")
+            report = os.path.join(tmp, "report.json")
+            args = ["--tiers", "easy", "--repeat", "1", "--no-memory"]
+            with redirect_stdout(StringIO()):
+                self.assertEqual(main(args + ["--save-baseline", baseline]), 0)
+                self.assertEqual(main(args + ["--baseline", baseline, "--report", report,
+                                              "--threshold", "10"]), 0)
+            with open(report) as f:
+                self.assertIn("easy", json.load(f)["tiers"])
+
+            with open(baseline) as f:
+                data = json.load(f)
+            data["tiers"]["easy"]["nodes"] //= 2
+            with open(baseline, "w") as f:
+                json.dump(data, f)
+            err = StringIO()
+            with redirect_stdout(StringIO()), redirect_stderr(err):
+                self.assertEqual(main(args + ["--baseline", baseline]), 1)
+            self.assertIn("REGRESSION easy: nodes", err.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from src.sudoku_core import SudokuCore, parse_board, board_to_string
+from src.sudoku_dlx import DancingLinksSudokuSolver
+
+EXAMPLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+SOLUTION = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+# 17-clue puzzle with a unique solution
+MINIMAL = "000000010400000000020000000000050407008000300001090000300400200050100000000806000"
+
+
+class TestDancingLinksSudokuSolver(unittest.TestCase):
+    def setUp(self):
+        self.solver = DancingLinksSudokuSolver()
+        self.core = SudokuCore()
+
+    def test_solve(self):
+        board = parse_board(EXAMPLE)
+        self.assertIs(self.solver.solve(board), board)
+        self.assertEqual(board_to_string(board), SOLUTION)
+
+    def test_minimal_puzzle(self):
+        solution = self.solver.solve(parse_board(MINIMAL))
+        self.assertTrue(self.core.is_valid_solution(solution))
+        for given, solved in zip(MINIMAL, board_to_string(solution)):
+            if given != "0":
+                self.assertEqual(given, solved)
+
+    def test_count_solutions(self):
+        self.assertEqual(self.solver.count_solutions(parse_board(EXAMPLE)), 1)
+        self.assertEqual(self.solver.count_solutions(parse_board(MINIMAL)), 1)
+        self.assertEqual(self.solver.count_solutions(parse_board("." * 81), limit=5), 5)
+
+    def test_iter_solutions(self):
+        board = parse_board(SOLUTION[:27] + "." * 9 + SOLUTION[36:])
+        solutions = list(self.solver.iter_solutions(board))
+        self.assertEqual([board_to_string(s) for s in solutions], [SOLUTION])
+        self.assertEqual(board_to_string(board).count("."), 9)  # Input untouched
+
+    def test_multiple_solutions(self):
+        # Deadly pattern: rows 0 and 3 hold 6,7 / 7,6 in columns 3 and 4
+        puzzle = list(SOLUTION)
+        for idx in (3, 4, 30, 31):
+            puzzle[idx] = "."
+        board = parse_board("".join(puzzle))
+        solutions = [board_to_string(s) for s in self.solver.iter_solutions(board)]
+        self.assertEqual(len(solutions), 2)
+        self.assertIn(SOLUTION, solutions)
+        for solution in solutions:
+            self.assertTrue(self.core.is_valid_solution(parse_board(solution)))
+        self.assertEqual(self.solver.count_solutions(board), 2)
+        self.assertEqual(self.solver.count_solutions(board, limit=1), 1)
+
+    def test_invalid_board(self):
+        with self.assertRaises(ValueError):
+            self.solver.solve(parse_board("55" + "." * 79))
+        with self.assertRaises(ValueError):
+            self.solver.solve([["5", "3"], ["5", "."]])
+
+    def test_unsolvable_board(self):
+        board = parse_board("12345678." + "." * 27 + "........9" + "." * 36)
+        self.assertFalse(self.solver.solve(board))
+        self.assertEqual(self.solver.count_solutions(board), 0)
+
+    def test_solver_option(self):
+        for solver in ("backtrack", "bitmask", "dlx"):
+            board = parse_board(MINIMAL)
+            self.assertTrue(self.core.is_valid_solution(self.core.solve(board, solver=solver)))
+            self.assertGreater(self.core.solve_attempts, 0)
+        with self.assertRaises(ValueError):
+            self.core.solve(parse_board(EXAMPLE), solver="unknown")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import random
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from src.sudoku_core import SudokuCore, parse_board, board_to_string
+from src.sudoku_generator import (SYMMETRIES, solved_grid, dig, generate,
+                                  generate_puzzles, main)
+
+
+class TestSudokuGenerator(unittest.TestCase):
+    def setUp(self):
+        self.core = SudokuCore()
+
+    def assertUniquePuzzle(self, puzzle, solution, size=9):
+        core = SudokuCore(size)
+        self.assertTrue(core.is_valid_solution(solution))
+        self.assertEqual(core.count_solutions(puzzle), 1)
+        for puzzle_row, solution_row in zip(puzzle, solution):
+            for given, solved in zip(puzzle_row, solution_row):
+                if given != ".":
+                    self.assertEqual(given, solved)
+
+    def test_solved_grid(self):
+        for size in (4, 9, 16):
+            self.assertTrue(SudokuCore(size).is_valid_solution(solved_grid(size, random.Random(1))))
+
+    def test_generate_unique(self):
+        rng = random.Random(3)
+        for _ in range(5):
+            puzzle, solution = generate(rng=rng)
+            self.assertUniquePuzzle(puzzle, solution)
+            # Dug to a minimal puzzle: well below 40 clues, never under 17
+            self.assertTrue(17 <= 81 - board_to_string(puzzle).count(".") < 40)
+
+    def test_symmetry(self):
+        for symmetry, orbit_of in SYMMETRIES.items():
+            puzzle, solution = generate(symmetry=symmetry, rng=random.Random(7))
+            self.assertUniquePuzzle(puzzle, solution)
+            for r in range(9):
+                for c in range(9):
+                    empty = {puzzle[i][j] == "." for i, j in orbit_of(r, c, 9)}
+                    self.assertEqual(len(empty), 1, (symmetry, r, c))
+
+    def test_min_clues(self):
+        solution = solved_grid(rng=random.Random(2))
+        puzzle = dig(solution, min_clues=40, rng=random.Random(2))
+        self.assertEqual(81 - board_to_string(puzzle).count("."), 40)
+        self.assertUniquePuzzle(puzzle, solution)
+
+    def test_other_sizes(self):
+        puzzle, solution = generate(size=4, rng=random.Random(1))
+        self.assertUniquePuzzle(puzzle, solution, 4)
+
+    def test_seeded_runs_repeat(self):
+        first = list(generate_puzzles(3, seed=11))
+        self.assertEqual(first, list(generate_puzzles(3, seed=11)))
+        self.assertEqual(first, list(generate_puzzles(3, seed=11, workers=2)))
+        with self.assertRaises(ValueError):
+            list(generate_puzzles(1, symmetry="spiral"))
+
+    def test_cli(self):
+        out = StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(main(["-n", "2", "--seed", "1", "--symmetry", "rotational",
+                                   "--solutions"]), 0)
+        lines = out.getvalue().split()
+        self.assertEqual(len(lines), 4)
+        for puzzle, solution in zip(lines[::2], lines[1::2]):
+            self.assertUniquePuzzle(parse_board(puzzle), parse_board(solution))
+
+if __name__ == '__main__':
+    unittest.main()
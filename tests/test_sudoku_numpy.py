@@ -0,0 +1,60 @@
+import unittest
+import numpy as np
+from src.sudoku_core import SudokuCore, parse_board
+from src.sudoku_corpus import CORPUS
+from src.sudoku_numpy import (to_array, candidates, candidate_counts, consistent,
+                              eliminate_naked_singles)
+from tests.test_sudoku_core import EXAMPLE, SOLUTION
+from tests.test_sudoku_sizes import PUZZLE_16
+
+
+class TestSudokuNumpy(unittest.TestCase):
+    def assertMatchesCore(self, puzzles, size):
+        core = SudokuCore(size)
+        cand = candidates(to_array(puzzles, size))
+        self.assertEqual(cand.shape, (len(puzzles), size, size, size))
+        for k, puzzle in enumerate(puzzles):
+            board = parse_board(puzzle, size)
+            for r in range(size):
+                for c in range(size):
+                    expected = (core.get_possible_numbers(board, r, c)
+                                if board[r][c] == "." else set())
+                    self.assertEqual({v + 1 for v in np.flatnonzero(cand[k, r, c])}, expected)
+
+    def test_candidates_match_core(self):
+        self.assertMatchesCore([p for tier in CORPUS.values() for p in tier], 9)
+        self.assertMatchesCore([PUZZLE_16], 16)
+
+    def test_to_array(self):
+        array = to_array([EXAMPLE, parse_board(SOLUTION)])
+        self.assertEqual(array.shape, (2, 9, 9))
+        self.assertEqual(array[0, 0, 0], 5)
+        self.assertEqual(array[0, 0, 2], 0)
+        with self.assertRaises(ValueError):
+            to_array([EXAMPLE[:80]])
+        with self.assertRaises(ValueError):
+            candidates(np.zeros((1, 8, 8), dtype=np.int8))
+
+    def test_candidate_counts(self):
+        counts = candidate_counts(to_array([EXAMPLE, SOLUTION, "." * 81]))
+        self.assertEqual(counts[0, 0, 2], 3)  # 1, 2 or 4
+        self.assertFalse(counts[1].any())
+        self.assertTrue((counts[2] == 9).all())
+
+    def test_eliminate_naked_singles(self):
+        filled, ok = eliminate_naked_singles(to_array([EXAMPLE, "." * 81]))
+        self.assertTrue(ok.all())
+        self.assertEqual("".join(map(str, filled[0].ravel())), SOLUTION)
+        self.assertFalse(filled[1].any())
+
+    def test_inconsistent_boards(self):
+        # The 9 below rules 9 out of both empty cells in the top row, so
+        # both are forced to 8
+        clash = "1234567.." + "." * 8 + "9" + "." * 63
+        duplicate = "11" + "." * 79
+        filled, ok = eliminate_naked_singles(to_array([clash, duplicate, EXAMPLE]))
+        self.assertEqual(ok.tolist(), [False, False, True])
+        self.assertEqual(consistent(to_array([duplicate, EXAMPLE])).tolist(), [False, True])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+from collections import Counter
+from src.sudoku import Sudoku
+from src.sudoku_core import SudokuCore, parse_board
+from src.sudoku_observer import (SolveObserver, CountingObserver, TraceWriter, read_trace,
+                                 START, PLACE, UNDO, PROPAGATE, FINISH)
+from tests.test_sudoku_core import EXAMPLE
+
+HARD = ".......71.2.8........4.3...7...6..5....2..3..9........6...7.....8....4......5...."
+
+
+class RecordingObserver(SolveObserver):
+    def __init__(self):
+        self.events = []
+
+    def on_place(self, row, col, value):
+        self.events.append(("place", row, col, value))
+
+    def on_undo(self, row, col):
+        self.events.append(("undo", row, col))
+
+
+class TestSudokuObserver(unittest.TestCase):
+    def test_counts_match_solver_counters(self):
+        for solver in ("backtrack", "bitmask", "dlx", "propagate"):
+            core = SudokuCore()
+            core.observer = CountingObserver()
+            core.solve(parse_board(HARD), solver=solver)
+            counts = core.observer
+            self.assertEqual(counts.places, core.solve_attempts, solver)
+            self.assertEqual(counts.undos, core.backtrack_count, solver)
+            self.assertEqual(counts.solves, 1)
+            self.assertEqual(counts.max_depth > 0, counts.places > 0)
+            if solver == "propagate":
+                self.assertGreater(counts.propagations, 0)
+            else:
+                self.assertEqual(counts.propagations, 0)
+
+    def test_counts_accumulate(self):
+        sudoku = Sudoku(test_mode=True)
+        sudoku.observer = counts = CountingObserver()
+        sudoku.solve(parse_board(HARD))
+        places = counts.places
+        sudoku.solve(parse_board(HARD))
+        self.assertEqual(counts.solves, 2)
+        self.assertEqual(counts.places, 2 * places)
+        sudoku.count_solutions(parse_board(EXAMPLE))
+        self.assertEqual(counts.solves, 3)
+        counts.reset()
+        self.assertEqual((counts.solves, counts.places), (0, 0))
+
+    def test_undo_matches_place(self):
+        core = SudokuCore()
+        core.observer = recorder = RecordingObserver()
+        core.solve(parse_board(HARD), solver="bitmask")
+        stack = []
+        for event in recorder.events:
+            if event[0] == "place":
+                stack.append(event[1:3])
+            else:
+                self.assertEqual(stack.pop(), event[1:])
+
+    def test_trace_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "search.trace")
+            core = SudokuCore()
+            counts = CountingObserver()
+            with TraceWriter(path, buffer_size=64) as trace:
+                core.observer = trace
+                core.solve(parse_board(HARD), solver="propagate")
+            core.observer = counts
+            core.solve(parse_board(HARD), solver="propagate")
+
+            events = list(read_trace(path))
+            self.assertEqual(os.path.getsize(path), 5 + 4 * len(events))
+            self.assertEqual(events[0], (START, 0, 0, 9))
+            self.assertEqual(events[-1], (FINISH, 0, 0, 1))
+            kinds = Counter(event.kind for event in events)
+            self.assertEqual(kinds[PLACE], counts.places)
+            self.assertEqual(kinds[UNDO], counts.undos)
+            self.assertEqual(kinds[PROPAGATE], counts.propagations)
+
+            with open(path, "wb") as f:
+                f.write(b"nope")
+            with self.assertRaises(ValueError):
+                list(read_trace(path))
+
+if __name__ == '__main__':
+    unittest.main()
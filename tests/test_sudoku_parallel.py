@@ -0,0 +1,48 @@
+import unittest
+from src.sudoku_core import SudokuCore, parse_board, board_to_string
+from src.sudoku_corpus import CORPUS
+from src.sudoku_parallel import split, solve_parallel, count_parallel
+from tests.test_sudoku_core import EXAMPLE, SOLUTION
+
+
+class TestSudokuParallel(unittest.TestCase):
+    def test_split(self):
+        board = parse_board(CORPUS["hard"][0])
+        subtrees = split(board, 16)
+        self.assertGreaterEqual(len(subtrees), 16)
+        core = SudokuCore()
+        for sub in subtrees:
+            self.assertTrue(core.is_valid_board(sub))
+        # Exactly one subtree still holds the unique solution
+        self.assertEqual(sum(core.count_solutions(sub) for sub in subtrees), 1)
+        self.assertEqual(board_to_string(board), CORPUS["hard"][0])
+        self.assertEqual(split(parse_board(SOLUTION), 4), [parse_board(SOLUTION)])
+
+    def test_solve_parallel(self):
+        board = parse_board(EXAMPLE)
+        self.assertIs(solve_parallel(board, workers=2), board)
+        self.assertEqual(board_to_string(board), SOLUTION)
+        hard = parse_board(CORPUS["hard"][2])
+        self.assertTrue(SudokuCore().is_valid_solution(solve_parallel(hard, 2, solver="propagate")))
+
+    def test_first_solution_stops_workers(self):
+        # Every subtree of the empty board has solutions; the first one found wins
+        board = solve_parallel(parse_board("." * 81), workers=2)
+        self.assertTrue(SudokuCore().is_valid_solution(board))
+
+    def test_unsolvable(self):
+        board = parse_board("12345678." + "." * 8 + "9" + "." * 63)
+        self.assertFalse(solve_parallel(board, workers=2))
+
+    def test_count_parallel(self):
+        self.assertEqual(count_parallel(parse_board("." * 16, 4), workers=2, size=4), 288)
+        self.assertEqual(count_parallel(parse_board(EXAMPLE), workers=2), 1)
+        with self.assertRaises(ValueError):
+            count_parallel(parse_board(EXAMPLE), solver="backtrack")
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            solve_parallel(parse_board("11" + "." * 79), workers=1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+from src.sudoku_core import SudokuCore, parse_board, board_to_string
+from src.sudoku_bitmask import BitmaskSudokuSolver
+from src.sudoku_propagation import PropagatingSudokuSolver
+
+EXAMPLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+SOLUTION = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+HARD = [
+    "..5...987.4..5...1..7......2...48....9.1.....6..2.....3..6..2.......9.7.......5..",
+    ".......71.2.8........4.3...7...6..5....2..3..9........6...7.....8....4......5....",
+    "...8....9.873...4.6..7.......85..97...........43..75.......3....3...145.4....2..1",
+    "..............3.85..1.2.......5.7.....4...1...9.......5......73..2.1........4...9",
+]
+
+
+class TestPropagatingSudokuSolver(unittest.TestCase):
+    def setUp(self):
+        self.solver = PropagatingSudokuSolver()
+
+    def test_logic_only_puzzle(self):
+        board = parse_board(EXAMPLE)
+        self.assertIs(self.solver.solve(board), board)
+        self.assertEqual(board_to_string(board), SOLUTION)
+        self.assertEqual(self.solver.logic_filled, EXAMPLE.count("."))
+        self.assertEqual(self.solver.search_filled, 0)
+        self.assertEqual(self.solver.solve_attempts, 0)
+
+    def test_hard_puzzles(self):
+        for puzzle in HARD:
+            expected = BitmaskSudokuSolver()
+            solution = expected.solve(parse_board(puzzle))
+            result = self.solver.solve(parse_board(puzzle))
+            self.assertEqual(result, solution)
+            self.assertEqual(self.solver.logic_filled + self.solver.search_filled,
+                             puzzle.count("."))
+            self.assertLess(self.solver.backtrack_count, expected.backtrack_count)
+
+    def test_fill_counts_through_core(self):
+        core = SudokuCore()
+        core.solve(parse_board(EXAMPLE), solver="propagate")
+        self.assertEqual((core.logic_filled, core.search_filled), (EXAMPLE.count("."), 0))
+        core.solve(parse_board(HARD[0]), solver="propagate")
+        self.assertGreater(core.search_filled, 0)
+        self.assertEqual(core.logic_filled + core.search_filled, HARD[0].count("."))
+
+    def test_backtracking_restores_state(self):
+        puzzle = HARD[0]
+        self.solver.load(parse_board(puzzle))
+        cand, cells = self.solver.cand[:], self.solver.cells[:]
+        mark = len(self.solver.trail)
+        self.solver._propagate()
+        self.assertNotEqual(self.solver.cells, cells)
+        self.solver._undo(mark)
+        self.assertEqual(self.solver.cand, cand)
+        self.assertEqual(self.solver.cells, cells)
+
+    def test_empty_board(self):
+        solution = self.solver.solve(parse_board("." * 81))
+        self.assertTrue(SudokuCore().is_valid_solution(solution))
+
+    def test_invalid_board(self):
+        with self.assertRaises(ValueError):
+            self.solver.solve(parse_board("55" + "." * 79))
+
+    def test_unsolvable_board(self):
+        board = parse_board("12345678." + "." * 27 + "........9" + "." * 36)
+        self.assertFalse(self.solver.solve(board))
+
+    def test_count_solutions(self):
+        minimal = "000000010400000000020000000000050407008000300001090000300400200050100000000806000"
+        self.assertEqual(self.solver.count_solutions(parse_board(minimal)), 1)
+        self.assertEqual(self.solver.count_solutions(parse_board("." * 81), limit=5), 5)
+        # Deadly pattern: rows 0 and 3 hold 6,7 / 7,6 in columns 3 and 4
+        puzzle = list(SOLUTION)
+        for idx in (3, 4, 30, 31):
+            puzzle[idx] = "."
+        board = parse_board("".join(puzzle))
+        self.assertEqual(self.solver.count_solutions(board, limit=None), 2)
+        self.assertEqual(self.solver.count_solutions(board, 1, {(0, 3): SOLUTION[3]}), 1)
+        self.assertEqual(self.solver.count_solutions(parse_board(EXAMPLE), 1,
+                                                     {(0, 2): SOLUTION[2]}), 0)
+        self.assertEqual(board_to_string(board).count("."), 4)  # Input untouched
+
+    def test_solver_option(self):
+        core = SudokuCore()
+        result = core.solve(parse_board(HARD[1]), solver="propagate")
+        self.assertTrue(core.is_valid_solution(result))
+
+if __name__ == '__main__':
+    unittest.main()
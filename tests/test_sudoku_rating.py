@@ -0,0 +1,67 @@
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import mock
+from src.sudoku_core import SudokuCore, parse_board
+from src.sudoku_corpus import CORPUS
+from src.sudoku_generator import generate_puzzles
+from src.sudoku_rating import DifficultyRater, rate, rate_puzzles, main, SEARCH_SCORE
+from tests.test_sudoku_core import EXAMPLE, SOLUTION
+from tests.test_sudoku_sizes import PUZZLE_16
+
+LOCKED = CORPUS["hard"][0]
+INKALA = CORPUS["hard"][3]
+
+
+class TestSudokuRating(unittest.TestCase):
+    def test_scores(self):
+        self.assertEqual(rate(EXAMPLE)[:2], (1.5, "hidden single"))
+        self.assertEqual(rate(LOCKED)[:2], (2.6, "locked candidates"))
+        rating = rate(INKALA)
+        self.assertEqual((rating.score, rating.hardest, rating.solved),
+                         (SEARCH_SCORE, "search", False))
+        self.assertEqual(rate(SOLUTION)[:2], (0.0, None))
+
+    def test_deductions_are_sound(self):
+        rater = DifficultyRater()
+        hardest = set()
+        for puzzle, solution in generate_puzzles(60, seed=9):
+            rating = rater.rate(puzzle)
+            hardest.add(rating.hardest)
+            for idx, value in enumerate(rater.cells):
+                expected = int(solution[idx // 9][idx % 9])
+                if value:
+                    self.assertEqual(value, expected)
+                else:
+                    self.assertTrue(rater.cand[idx] >> (expected - 1) & 1)
+        # Generated puzzles exercise more than the singles
+        self.assertGreater(len(hardest), 3)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            rate("11" + "." * 79)
+        with self.assertRaises(ValueError):
+            rate("1234567.." + "." * 8 + "9" + "." * 63)
+        ratings = list(rate_puzzles([EXAMPLE, "11" + "." * 79]))
+        self.assertEqual(ratings[0].hardest, "hidden single")
+        self.assertIsNone(ratings[1])
+
+    def test_16x16(self):
+        puzzle = parse_board(PUZZLE_16, 16)
+        solution = SudokuCore(16).solve(parse_board(PUZZLE_16, 16), solver="propagate")
+        rater = DifficultyRater(16)
+        rater.rate(puzzle)
+        for idx, value in enumerate(rater.cells):
+            if value:
+                self.assertEqual(value, rater.grid.values[solution[idx // 16][idx % 16]])
+
+    def test_cli_sort(self):
+        out = StringIO()
+        with mock.patch("sys.stdin", StringIO(f"{INKALA}\n{EXAMPLE}\n{LOCKED}\n")), \
+                redirect_stdout(out):
+            self.assertEqual(main(["--sort"]), 0)
+        lines = out.getvalue().splitlines()
+        self.assertEqual([line.split()[-1] for line in lines], [EXAMPLE, LOCKED, INKALA])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+from src.sudoku_core import SudokuCore, parse_board, board_to_string
+from src.sudoku_bitmask import BitmaskSudokuSolver
+from src.sudoku_dlx import DancingLinksSudokuSolver
+from src.sudoku_grid import grid_geometry
+from src.sudoku_propagation import PropagatingSudokuSolver
+
+PUZZLE_16 = ("4.B.2.CAF1.36.7.......7.B9.8...2..2.F..1D...8..B.5D6B.4.2AC.31E."
+             "284.C.F...D5.6B...E579B.....1G.CF..1...376..A8.4.6.9.A.8C.F....."
+             "AB8.GC.2.F5E.D...D...4.B.21..F535F.E6...8B...2......3E..6D...BA8"
+             "6.5.9B8....2.C31..9BA2G...3F.E6..4A.1F.C5.6.B..9...F5D..9...24..")
+PUZZLE_4 = "1.3..4.22..3.3.1"
+
+
+class TestSudokuSizes(unittest.TestCase):
+    def assertSolves(self, puzzle, size, solver):
+        core = SudokuCore(size)
+        solution = core.solve(parse_board(puzzle, size), solver=solver)
+        self.assertTrue(core.is_valid_solution(solution))
+        for given, solved in zip(puzzle, board_to_string(solution)):
+            if given != ".":
+                self.assertEqual(given, solved)
+
+    def test_solve_4x4(self):
+        for solver in ("backtrack", "dlx", "propagate"):
+            self.assertSolves(PUZZLE_4, 4, solver)
+
+    def test_solve_16x16(self):
+        for solver in ("backtrack", "dlx", "propagate"):
+            self.assertSolves(PUZZLE_16, 16, solver)
+
+    def test_empty_25x25(self):
+        for solver in ("dlx", "propagate"):
+            self.assertSolves("." * 625, 25, solver)
+
+    def test_symbols(self):
+        board = parse_board(PUZZLE_16.lower(), 16)
+        self.assertEqual(board_to_string(board), PUZZLE_16)
+        self.assertEqual(parse_board([[16] + [0] * 15] + [[0] * 16] * 15, 16)[0][0], "G")
+        with self.assertRaises(ValueError):
+            parse_board("H" + PUZZLE_16[1:], 16)
+        with self.assertRaises(ValueError):
+            parse_board("A" + "." * 80)
+
+    def test_invalid_16x16(self):
+        core = SudokuCore(16)
+        with self.assertRaises(ValueError):
+            core.solve(parse_board("GG" + "." * 254, 16), solver="propagate")
+        self.assertFalse(core.is_valid_board(parse_board("G" + "." * 16 + "G" + "." * 238, 16)))
+
+    def test_unsupported_sizes(self):
+        for size in (0, 1, 8, 36):
+            with self.assertRaises(ValueError):
+                SudokuCore(size)
+        with self.assertRaises(ValueError):
+            BitmaskSudokuSolver(16)
+        with self.assertRaises(ValueError):
+            SudokuCore(16).solve(parse_board(PUZZLE_16, 16), solver="bitmask")
+
+    def test_engines_share_geometry(self):
+        self.assertIs(PropagatingSudokuSolver(16).grid, DancingLinksSudokuSolver(16).grid)
+        grid = grid_geometry(16)
+        self.assertEqual(len(grid.units), 48)
+        self.assertEqual(len(grid.peers[0]), 15 + 15 + 9)
+        self.assertEqual(len(grid.segments), 2 * 16 * 4)
+
+if __name__ == '__main__':
+    unittest.main()